@@ -1,5 +1,6 @@
 """Application services package."""
 
 from .data_manager_service import DataManagerService
+from .edit_history_service import EditHistoryService
 
-__all__ = ["DataManagerService"]
+__all__ = ["DataManagerService", "EditHistoryService"]
@@ -1,24 +1,38 @@
 """Data manager service for the application layer."""
 
-from typing import Dict, Tuple, Any
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Any
+import numpy as np
 from ...domain.value_objects.view_type import ViewType
+from ...domain.value_objects.frame_snapshot import FrameSnapshot
 from ...infrastructure.repositories.vehicle_data_repository import VehicleDataRepository
 from ...infrastructure.export.excel_export_service import ExcelExportService
+from ...infrastructure.journal.calibration_journal import CalibrationJournal
+from ..use_cases.export_calibrated_data_use_case import ExportCalibratedDataUseCase
+from .edit_history_service import EditHistoryService, HistoryEntry
 
 
 class DataManagerService:
     """Application service for managing vehicle data operations."""
 
-    def __init__(self):
+    def __init__(self, frame_cache_size: int = 256, journal_path: Optional[str] = None):
         """Initialize the data manager service."""
         self.repository = VehicleDataRepository()
+        self.history = EditHistoryService(
+            self.repository, CalibrationJournal(journal_path)
+        )
         self.export_service = ExcelExportService()
         self.total_records: int = 0
+        self.frame_cache_size = frame_cache_size
+        self._frame_cache: "OrderedDict[int, FrameSnapshot]" = OrderedDict()
 
     def initialize(self) -> None:
         """Initialize data from repository."""
         self.repository.load_all_data()
         self.total_records = self.repository.get_total_records()
+        # Edits journaled against other data are not replayed onto this one
+        self.history.journal.bind(self.repository.data_version())
+        self.history.replay()
 
     def get_coord(self, view_name: str, index: int) -> Tuple[float, float]:
         """Get coordinate for a view and index."""
@@ -27,13 +41,48 @@ class DataManagerService:
         return coord.x, coord.y
 
     def get_original_coord(self, view_name: str, index: int) -> Tuple[float, float]:
-        """Get original coordinate (same as get_coord for now)."""
-        return self.get_coord(view_name, index)
+        """Get the coordinate as loaded, before any calibration edit."""
+        view_type = ViewType.from_string(view_name)
+        coord = self.repository.get_original_coordinate(view_type, index)
+        return coord.x, coord.y
+
+    def get_original_coords(self, view_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get x and y arrays for all records of a view in one call."""
+        view_type = ViewType.from_string(view_name)
+        return self.repository.get_coordinate_arrays(view_type)
+
+    def get_line_ids(self, view_name: str) -> np.ndarray:
+        """Get the lineId of every record of a view."""
+        view_type = ViewType.from_string(view_name)
+        return self.repository.get_line_ids(view_type)
 
     def set_coord(self, view_name: str, index: int, x: float, y: float) -> None:
-        """Set coordinate for a view and index."""
+        """Set coordinate for a view and index, recording it for undo."""
         view_type = ViewType.from_string(view_name)
-        self.repository.update_coordinate(view_type, index, x, y)
+        self.history.record(view_type, index, x, y)
+        self._frame_cache.pop(index, None)
+
+    def undo(self) -> Optional[HistoryEntry]:
+        """Undo the latest coordinate edit."""
+        entry = self.history.undo()
+        if entry is not None:
+            self._frame_cache.pop(entry.index, None)
+        return entry
+
+    def redo(self) -> Optional[HistoryEntry]:
+        """Redo the latest undone coordinate edit."""
+        entry = self.history.redo()
+        if entry is not None:
+            self._frame_cache.pop(entry.index, None)
+        return entry
+
+    def sync_journal(self) -> None:
+        """Flush pending journal records to disk."""
+        self.history.journal.sync()
+
+    def close(self) -> None:
+        """Flush and close the edit journal."""
+        self.history.close()
 
     def get_extents(self, view_name: str) -> Tuple[float, float, float, float]:
         """Get extents for a view."""
@@ -43,19 +92,53 @@ class DataManagerService:
 
     def export_calibrated(self, output_dir: str) -> Dict[str, str]:
         """Export calibrated data to Excel files."""
-        written_files = {}
-        for view_type in ViewType:
-            records = self.repository.get_all_records(view_type)
-            file_path = self.export_service.export_data(
-                records, view_type.value, output_dir
-            )
-            written_files[view_type.value] = file_path
-        return written_files
+        modifications = {
+            view_type.value: self.repository.get_modifications(view_type)
+            for view_type in ViewType
+        }
+        use_case = ExportCalibratedDataUseCase(self.repository, modifications)
+        return use_case.execute(output_dir)
+
+    def get_calibration_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get calibration edit statistics per view."""
+        return {
+            view_type.value: self.repository.get_calibration_stats(view_type)
+            for view_type in ViewType
+        }
 
     def reload_data(self) -> None:
-        """Reload all data from database."""
+        """Reload all data from database and re-apply journaled edits."""
         self.repository.load_all_data()
         self.total_records = self.repository.get_total_records()
+        # Edits journaled against other data are not replayed onto this one
+        self.history.journal.bind(self.repository.data_version())
+        self.history.replay()
+        self._frame_cache.clear()
+
+    def get_frame(self, index: int) -> FrameSnapshot:
+        """Get an immutable snapshot of every view and the master row at index."""
+        frame = self._frame_cache.get(index)
+        if frame is not None:
+            self._frame_cache.move_to_end(index)
+            return frame
+
+        views, coordinates = {}, {}
+        for view_type in ViewType:
+            row = self.repository.get_full_record(view_type, index)
+            views[view_type.value] = row
+            if row:
+                coordinates[view_type.value] = (
+                    row[view_type.get_x_column()],
+                    row[view_type.get_y_column()],
+                )
+        master = self.repository.get_master_record(index)
+        frame = FrameSnapshot.build(index, master, views, coordinates)
+
+        if self.frame_cache_size > 0:
+            self._frame_cache[index] = frame
+            if len(self._frame_cache) > self.frame_cache_size:
+                self._frame_cache.popitem(last=False)
+        return frame
 
     def get_full_record(self, view_name: str, index: int) -> Dict[str, Any]:
         """Get full record data for a view and index."""
@@ -0,0 +1,160 @@
+"""Undo/redo history of calibration edits backed by a journal."""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from ...domain.value_objects.view_type import ViewType
+from ...infrastructure.journal.calibration_journal import (
+    CalibrationJournal,
+    JournalOp,
+)
+from ...infrastructure.repositories.vehicle_data_repository import VehicleDataRepository
+
+VIEWS = list(ViewType)
+
+
+class HistoryEntry(NamedTuple):
+    """One coordinate edit that can be undone and redone."""
+
+    view_type: ViewType
+    index: int
+    mag_id: int
+    old: Tuple[float, float]
+    new: Tuple[float, float]
+
+
+class EditHistoryService:
+    """Applies coordinate edits to the repository and keeps them undoable.
+
+    Every edit, undo and redo is appended to the journal, so ``replay`` can
+    rebuild both the coordinates and the undo/redo stacks after a restart
+    or reload. Replay resolves records by magId, not by index.
+    """
+
+    def __init__(self, repository: VehicleDataRepository, journal: CalibrationJournal):
+        """Initialize with the repository to edit and the journal to log to."""
+        self.repository = repository
+        self.journal = journal
+        self._undo: List[HistoryEntry] = []
+        self._redo: List[HistoryEntry] = []
+
+    def record(self, view_type: ViewType, index: int, x: float, y: float) -> None:
+        """Apply and journal an edit, clearing the redo stack."""
+        current = self.repository.get_coordinate(view_type, index)
+        old = (current.x, current.y)
+        if old == (x, y):
+            return
+
+        mag_id = self.repository.get_mag_id(view_type, index)
+        entry = HistoryEntry(view_type, index, mag_id, old, (x, y))
+        self.repository.update_coordinate(view_type, index, x, y)
+        self._log(JournalOp.EDIT, entry)
+        self._undo.append(entry)
+        self._redo.clear()
+
+    def undo(self) -> Optional[HistoryEntry]:
+        """Revert the latest edit; None if there is nothing to undo."""
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self.repository.update_coordinate(entry.view_type, entry.index, *entry.old)
+        self._log(JournalOp.UNDO, entry)
+        self._redo.append(entry)
+        return entry
+
+    def redo(self) -> Optional[HistoryEntry]:
+        """Re-apply the latest undone edit; None if there is nothing to redo."""
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self.repository.update_coordinate(entry.view_type, entry.index, *entry.new)
+        self._log(JournalOp.REDO, entry)
+        self._undo.append(entry)
+        return entry
+
+    def replay(self) -> int:
+        """Restore edits and stacks from the journal; return points restored."""
+        self._undo, self._redo = [], []
+        records = self.journal.read_all()
+        if not len(records):
+            return 0
+
+        indices = np.full(len(records), -1, dtype=np.int64)
+        for code, view_type in enumerate(VIEWS):
+            mask = records["view"] == code
+            if mask.any():
+                mag_ids = records["mag_id"][mask]
+                indices[mask] = self.repository.find_indices(view_type, mag_ids)
+
+        undo, redo, final = self._simulate(records)
+        ids = np.fromiter(final.values(), dtype=np.int64, count=len(final))
+        ids = ids[indices[np.abs(ids) - 1] >= 0]
+        rows = np.abs(ids) - 1
+        xs = np.where(ids > 0, records["new_x"][rows], records["old_x"][rows])
+        ys = np.where(ids > 0, records["new_y"][rows], records["old_y"][rows])
+        codes = records["view"][rows]
+        for code, view_type in enumerate(VIEWS):
+            mask = codes == code
+            if mask.any():
+                self.repository.update_coordinates(
+                    view_type, indices[rows][mask], xs[mask], ys[mask]
+                )
+
+        self._undo = self._entries(records, indices, undo)
+        self._redo = self._entries(records, indices, redo)
+        return len(rows)
+
+    @staticmethod
+    def _simulate(records: np.ndarray) -> Tuple[List[int], List[int], Dict]:
+        """Run the journal ops over record ids without touching the repository.
+
+        Returns the undo and redo stacks as record ids, and for every edited
+        point the record that last set it: +(id + 1) for its new value,
+        -(id + 1) for its old value.
+        """
+        keys = list(zip(records["view"].tolist(), records["mag_id"].tolist()))
+        undo: List[int] = []
+        redo: List[int] = []
+        final: Dict[Tuple[int, int], int] = {}
+        for i, op in enumerate(records["op"].tolist()):
+            if op == JournalOp.EDIT:
+                undo.append(i)
+                redo.clear()
+                final[keys[i]] = i + 1
+            elif op == JournalOp.UNDO and undo:
+                j = undo.pop()
+                redo.append(j)
+                final[keys[j]] = -(j + 1)
+            elif op == JournalOp.REDO and redo:
+                j = redo.pop()
+                undo.append(j)
+                final[keys[j]] = j + 1
+        return undo, redo, final
+
+    @staticmethod
+    def _entries(
+        records: np.ndarray, indices: np.ndarray, ids: List[int]
+    ) -> List[HistoryEntry]:
+        """Build history entries for record ids whose magId still exists."""
+        ids = np.asarray(ids, dtype=np.int64)
+        ids = ids[indices[ids] >= 0] if len(ids) else ids
+        rows = records[ids]
+        columns = zip(
+            rows["view"].tolist(),
+            indices[ids].tolist(),
+            rows["mag_id"].tolist(),
+            zip(rows["old_x"].tolist(), rows["old_y"].tolist()),
+            zip(rows["new_x"].tolist(), rows["new_y"].tolist()),
+        )
+        return [
+            HistoryEntry(VIEWS[view], index, mag_id, old, new)
+            for view, index, mag_id, old, new in columns
+        ]
+
+    def _log(self, op: JournalOp, entry: HistoryEntry) -> None:
+        """Append one history operation to the journal."""
+        code = VIEWS.index(entry.view_type)
+        self.journal.append(op, code, entry.index, entry.mag_id, entry.old, entry.new)
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        self.journal.close()
@@ -19,7 +19,8 @@ class CoordinateScalingService:
     ) -> Coordinate:
         """Scale real coordinates to canvas space."""
         norm_x = (coordinate.x - extents.min_x) / extents.x_range
-        norm_y = (coordinate.y - extents.min_y) / extents.y_range        canvas_x = norm_x * canvas_width
+        norm_y = (coordinate.y - extents.min_y) / extents.y_range
+        canvas_x = norm_x * canvas_width
         
         # No invertimos Y ya que los datos están en orden correcto
         canvas_y = norm_y * canvas_height
@@ -34,7 +35,8 @@ class CoordinateScalingService:
         canvas_height: int,
         view_type: ViewType = None
     ) -> Coordinate:
-        """Scale canvas coordinates back to real space."""        norm_x = canvas_coordinate.x / max(canvas_width, 1e-9)
+        """Scale canvas coordinates back to real space."""
+        norm_x = canvas_coordinate.x / max(canvas_width, 1e-9)
         
         # No invertimos Y ya que los datos están en orden correcto
         norm_y = canvas_coordinate.y / max(canvas_height, 1e-9)
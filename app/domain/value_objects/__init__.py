@@ -3,5 +3,6 @@
 from .coordinate import Coordinate
 from .view_type import ViewType
 from .extents import Extents
+from .frame_snapshot import FrameSnapshot
 
-__all__ = ["Coordinate", "ViewType", "Extents"]
+__all__ = ["Coordinate", "ViewType", "Extents", "FrameSnapshot"]
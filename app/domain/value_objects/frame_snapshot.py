@@ -0,0 +1,38 @@
+"""Frame snapshot value object."""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """Immutable view of every table row at one playback index."""
+
+    index: int
+    master: Mapping[str, Any]
+    views: Mapping[str, Mapping[str, Any]]
+    coordinates: Mapping[str, Tuple[float, float]]
+
+    def __post_init__(self) -> None:
+        """Validate snapshot index."""
+        if self.index < 0:
+            raise ValueError("index must be non-negative")
+
+    @classmethod
+    def build(
+        cls,
+        index: int,
+        master: Dict[str, Any],
+        views: Dict[str, Dict[str, Any]],
+        coordinates: Dict[str, Tuple[float, float]],
+    ) -> "FrameSnapshot":
+        """Create a snapshot wrapping every mapping as read-only."""
+        return cls(
+            index=index,
+            master=MappingProxyType(master),
+            views=MappingProxyType(
+                {name: MappingProxyType(row) for name, row in views.items()}
+            ),
+            coordinates=MappingProxyType(coordinates),
+        )
@@ -28,15 +28,23 @@ class ExcelExportService:
             df = data_frames[view_name]
             new_df = df.copy()
 
-            # Apply modifications
-            view_modifications = modifications.get(view_name, {})
-            for index, modification in view_modifications.items():
-                if modification.is_significant():
-                    x_col = view_type.get_x_column()
-                    y_col = view_type.get_y_column()
-
-                    new_df.at[index, x_col] = modification.modified_coordinate.x
-                    new_df.at[index, y_col] = modification.modified_coordinate.y
+            # Apply modifications (only the edited rows are touched)
+            view_modifications = [
+                m
+                for m in modifications.get(view_name, {}).values()
+                if m.is_significant()
+            ]
+            if view_modifications:
+                x_col = view_type.get_x_column()
+                y_col = view_type.get_y_column()
+                rows = [m.record_index for m in view_modifications]
+                new_df[[x_col, y_col]] = new_df[[x_col, y_col]].astype(float)
+                new_df.loc[rows, x_col] = [
+                    m.modified_coordinate.x for m in view_modifications
+                ]
+                new_df.loc[rows, y_col] = [
+                    m.modified_coordinate.y for m in view_modifications
+                ]
 
             # Write to file
             filename = f"{view_name}_calibrated.xlsx"
@@ -0,0 +1,5 @@
+"""Infrastructure journal package."""
+
+from .calibration_journal import CalibrationJournal, JournalOp
+
+__all__ = ["CalibrationJournal", "JournalOp"]
@@ -0,0 +1,138 @@
+"""Append-only binary journal of calibration edits."""
+
+import glob
+import os
+import time
+from enum import IntEnum
+from typing import Optional
+import numpy as np
+
+BASE_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+DEFAULT_PATH = os.path.join(BASE_DIR, "share", "journal", "calibration.journal")
+MAGIC = b"CALJRNL1"
+RECORD_DTYPE = np.dtype(
+    [
+        ("op", "u1"),
+        ("view", "u1"),
+        ("index", "<u4"),
+        ("mag_id", "<i8"),
+        ("old_x", "<f8"),
+        ("old_y", "<f8"),
+        ("new_x", "<f8"),
+        ("new_y", "<f8"),
+    ]
+)
+
+
+class JournalOp(IntEnum):
+    """Kind of journal entry."""
+
+    EDIT = 1
+    UNDO = 2
+    REDO = 3
+
+
+class CalibrationJournal:
+    """Fixed-size binary records appended to one file, fsynced in batches.
+
+    A record is written on every edit, undo and redo. Buffered records are
+    flushed and fsynced once ``batch_size`` accumulate or ``sync_interval``
+    seconds have passed, and always on ``sync``/``close``. Once ``bind`` is
+    called, each loaded data version has its own file.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        batch_size: int = 64,
+        sync_interval: float = 1.0,
+        keep: int = 3,
+    ):
+        """Use path, else $CALIBRATION_JOURNAL, else share/journal/."""
+        self.base_path = path or os.getenv("CALIBRATION_JOURNAL", DEFAULT_PATH)
+        self.path = self.base_path
+        self.keep = keep
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._file = None
+
+    def bind(self, data_version: str) -> None:
+        """Switch to the journal of one loaded data version.
+
+        Edits only replay onto the data they were made on. Journals of other
+        versions are deleted beyond the ``keep`` most recently used files.
+        """
+        self.close()
+        root, ext = os.path.splitext(self.base_path)
+        self.path = f"{root}.{data_version}{ext}"
+        if os.path.exists(self.path):
+            os.utime(self.path)
+        others = [p for p in glob.glob(f"{glob.escape(root)}.*{ext}") if p != self.path]
+        others.sort(key=os.path.getmtime, reverse=True)
+        for stale in others[max(self.keep - 1, 0):]:
+            os.remove(stale)
+
+    def _open(self):
+        """Open for appending; write the header or drop a torn last record."""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "ab")
+            size = self._file.tell()
+            if size == 0:
+                self._file.write(MAGIC)
+            elif size > len(MAGIC):
+                torn = (size - len(MAGIC)) % RECORD_DTYPE.itemsize
+                self._file.truncate(size - torn)
+        return self._file
+
+    def append(
+        self,
+        op: JournalOp,
+        view: int,
+        index: int,
+        mag_id: int,
+        old: tuple,
+        new: tuple,
+    ) -> None:
+        """Append one record."""
+        record = np.array(
+            [(op, view, index, mag_id, old[0], old[1], new[0], new[1])],
+            dtype=RECORD_DTYPE,
+        )
+        self._open().write(record.tobytes())
+        self._pending += 1
+        interval_elapsed = time.monotonic() - self._last_sync >= self.sync_interval
+        if self._pending >= self.batch_size or interval_elapsed:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffered records and fsync them to disk."""
+        if self._file is not None and self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def read_all(self) -> np.ndarray:
+        """Read every complete record; a torn trailing record is ignored."""
+        self.sync()
+        if not os.path.exists(self.path):
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a calibration journal: {self.path}")
+            data = f.read()
+        count = len(data) // RECORD_DTYPE.itemsize
+        return np.frombuffer(data, dtype=RECORD_DTYPE, count=count)
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,92 @@
+"""Sparse calibration overlay for one view."""
+
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+
+class CalibrationOverlay:
+    """Sparse (index, dx, dy) edits layered over immutable base arrays.
+
+    Storage grows with the number of edits, not with the dataset. A dict
+    maps record index -> slot so reads, writes and removals are O(1).
+    """
+
+    def __init__(self, capacity: int = 16):
+        """Initialize an empty overlay."""
+        self._slots: Dict[int, int] = {}
+        self._indices = np.empty(capacity, dtype=np.int64)
+        self._dx = np.empty(capacity, dtype=np.float64)
+        self._dy = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        """Get number of edited records."""
+        return len(self._slots)
+
+    def get_delta(self, index: int) -> Optional[Tuple[float, float]]:
+        """Get the (dx, dy) edit for index, or None if unedited."""
+        slot = self._slots.get(index)
+        if slot is None:
+            return None
+        return float(self._dx[slot]), float(self._dy[slot])
+
+    def set_delta(self, index: int, dx: float, dy: float) -> None:
+        """Store the (dx, dy) edit for index."""
+        slot = self._slots.get(index)
+        if slot is None:
+            slot = len(self._slots)
+            if slot == len(self._indices):
+                self._grow()
+            self._slots[index] = slot
+            self._indices[slot] = index
+        self._dx[slot] = dx
+        self._dy[slot] = dy
+
+    def set_many(self, indices: np.ndarray, dx: np.ndarray, dy: np.ndarray) -> None:
+        """Store edits for many distinct indices at once."""
+        indices = np.asarray(indices, dtype=np.int64)
+        get = self._slots.get
+        slots = np.fromiter(
+            (get(i, -1) for i in indices.tolist()), dtype=np.int64, count=len(indices)
+        )
+        present = slots >= 0
+        self._dx[slots[present]] = dx[present]
+        self._dy[slots[present]] = dy[present]
+
+        new = ~present
+        start = len(self._slots)
+        end = start + int(new.sum())
+        while end > len(self._indices):
+            self._grow()
+        self._indices[start:end] = indices[new]
+        self._dx[start:end] = dx[new]
+        self._dy[start:end] = dy[new]
+        self._slots.update(zip(indices[new].tolist(), range(start, end)))
+
+    def remove(self, index: int) -> None:
+        """Drop the edit for index by moving the last slot into its place."""
+        slot = self._slots.pop(index, None)
+        if slot is None:
+            return
+        last = len(self._slots)
+        if slot != last:
+            moved = int(self._indices[last])
+            self._indices[slot] = moved
+            self._dx[slot] = self._dx[last]
+            self._dy[slot] = self._dy[last]
+            self._slots[moved] = slot
+
+    def clear(self) -> None:
+        """Drop every edit."""
+        self._slots.clear()
+
+    def edits(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get (indices, dx, dy) arrays covering only the edited records."""
+        n = len(self._slots)
+        return self._indices[:n], self._dx[:n], self._dy[:n]
+
+    def _grow(self) -> None:
+        """Double the capacity of the slot arrays."""
+        size = max(2 * len(self._indices), 16)
+        self._indices = np.resize(self._indices, size)
+        self._dx = np.resize(self._dx, size)
+        self._dy = np.resize(self._dy, size)
@@ -0,0 +1,100 @@
+"""Columnar storage for a single view's coordinates."""
+
+from typing import Tuple
+import numpy as np
+import pandas as pd
+from ...domain.value_objects.view_type import ViewType
+from .calibration_overlay import CalibrationOverlay
+
+SIGNIFICANT_DELTA = 1e-9
+
+
+class ColumnarViewStore:
+    """Holds x/y/magId of one view as contiguous NumPy arrays.
+
+    The loaded coordinates are immutable; edits live in a sparse
+    ``CalibrationOverlay`` and are merged on read.
+    """
+
+    def __init__(self, view_type: ViewType, df: pd.DataFrame):
+        """Build the arrays once from the loaded DataFrame."""
+        self.view_type = view_type
+        self._source = df
+        self._rows = df.to_records(index=False)
+        self._columns = self._rows.dtype.names
+        self.x = np.array(df[view_type.get_x_column()], dtype=np.float64)
+        self.y = np.array(df[view_type.get_y_column()], dtype=np.float64)
+        self.x.flags.writeable = False
+        self.y.flags.writeable = False
+        self.mag_ids = np.ascontiguousarray(df["magId"], dtype=np.int64)
+        if "lineId" in df.columns:
+            self.line_ids = np.ascontiguousarray(df["lineId"], dtype=np.int64)
+        else:
+            self.line_ids = np.zeros(len(df), dtype=np.int64)
+        self.overlay = CalibrationOverlay()
+        self._mag_order = np.argsort(self.mag_ids, kind="stable")
+
+    def __len__(self) -> int:
+        """Get number of records."""
+        return len(self.x)
+
+    def get(self, index: int) -> Tuple[float, float]:
+        """Get the current (x, y) pair at index."""
+        x, y = float(self.x[index]), float(self.y[index])
+        delta = self.overlay.get_delta(index)
+        if delta is None:
+            return x, y
+        return x + delta[0], y + delta[1]
+
+    def get_original(self, index: int) -> Tuple[float, float]:
+        """Get the loaded (x, y) pair at index, ignoring edits."""
+        return float(self.x[index]), float(self.y[index])
+
+    def set(self, index: int, x: float, y: float) -> None:
+        """Record (x, y) at index as an edit over the loaded value."""
+        dx, dy = x - self.x[index], y - self.y[index]
+        if abs(dx) > SIGNIFICANT_DELTA or abs(dy) > SIGNIFICANT_DELTA:
+            self.overlay.set_delta(index, float(dx), float(dy))
+        else:
+            self.overlay.remove(index)
+
+    def set_many(self, indices: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Record edits for many distinct indices in one vectorized pass."""
+        dx, dy = xs - self.x[indices], ys - self.y[indices]
+        significant = np.maximum(np.abs(dx), np.abs(dy)) > SIGNIFICANT_DELTA
+        self.overlay.set_many(indices[significant], dx[significant], dy[significant])
+        for index in indices[~significant].tolist():
+            self.overlay.remove(index)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the read-only loaded x and y columns."""
+        return self.x, self.y
+
+    def current_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get copies of the x and y columns with edits applied."""
+        x, y = self.x.copy(), self.y.copy()
+        indices, dx, dy = self.overlay.edits()
+        x[indices] += dx
+        y[indices] += dy
+        return x, y
+
+    def indices_of(self, mag_ids: np.ndarray) -> np.ndarray:
+        """Get the record index of each magId, or -1 where it is absent."""
+        if not len(self.mag_ids):
+            return np.full(len(mag_ids), -1, dtype=np.int64)
+        sorted_ids = self.mag_ids[self._mag_order]
+        pos = np.minimum(np.searchsorted(sorted_ids, mag_ids), len(sorted_ids) - 1)
+        found = sorted_ids[pos] == mag_ids
+        return np.where(found, self._mag_order[pos], -1)
+
+    def get_row(self, index: int) -> dict:
+        """Get the full source row with current coordinates applied."""
+        row = dict(zip(self._columns, self._rows[index].tolist()))
+        x, y = self.get(index)
+        row[self.view_type.get_x_column()] = x
+        row[self.view_type.get_y_column()] = y
+        return row
+
+    def source_frame(self) -> pd.DataFrame:
+        """Get the DataFrame as loaded (edits not applied)."""
+        return self._source
@@ -1,13 +1,17 @@
 """Vehicle data repository implementation."""
 
-from typing import Dict, Any
+import hashlib
+from typing import Dict, Any, Tuple
+import numpy as np
 import pandas as pd
 from ...domain.entities.vehicle_record import VehicleRecord
+from ...domain.entities.coordinate_modification import CoordinateModification
 from ...domain.value_objects.coordinate import Coordinate
 from ...domain.value_objects.view_type import ViewType
 from ...domain.value_objects.extents import Extents
 from .data_loader import DataLoader
 from .extents_calculator import ExtentsCalculator
+from .columnar_view_store import ColumnarViewStore
 
 
 class VehicleDataRepository:
@@ -18,6 +22,8 @@ class VehicleDataRepository:
         self.loader = DataLoader()
         self.extents_calc = ExtentsCalculator()
         self._data_frames: Dict[str, pd.DataFrame] = {}
+        self._stores: Dict[str, ColumnarViewStore] = {}
+        self._master_rows: np.ndarray = np.empty(0)
         self._extents: Dict[str, Extents] = {}
 
     def load_all_data(self) -> None:
@@ -25,6 +31,31 @@ class VehicleDataRepository:
         self._data_frames = self.loader.load_all_tables()
         self.loader.validate_data_consistency(self._data_frames)
         self._extents = self.extents_calc.compute_all_extents(self._data_frames)
+        self._stores = {
+            view.value: ColumnarViewStore(view, self._data_frames[view.value])
+            for view in ViewType
+            if view.value in self._data_frames
+        }
+        if "map" in self._data_frames:
+            self._master_rows = self._data_frames["map"].to_records(index=False)
+
+    def data_version(self) -> str:
+        """Fingerprint of the loaded views: magIds and coordinates, in magId order."""
+        digest = hashlib.blake2b(digest_size=8)
+        for name in sorted(self._stores):
+            store = self._stores[name]
+            order = np.argsort(store.mag_ids, kind="stable")
+            digest.update(name.encode())
+            for values in (store.mag_ids, store.x, store.y):
+                digest.update(np.ascontiguousarray(values[order]).tobytes())
+        return digest.hexdigest()
+
+    def _get_store(self, view_type: ViewType, index: int) -> ColumnarViewStore:
+        """Get the columnar store for a view, validating the index."""
+        store = self._stores.get(view_type.value)
+        if store is None or index >= len(store):
+            raise IndexError(f"Invalid index {index} for view {view_type.value}")
+        return store
 
     def get_total_records(self) -> int:
         """Get total number of records."""
@@ -34,14 +65,38 @@ class VehicleDataRepository:
 
     def get_coordinate(self, view_type: ViewType, index: int) -> Coordinate:
         """Get coordinate for specific view and index."""
-        df = self._data_frames.get(view_type.value)
-        if df is None or index >= len(df):
-            raise IndexError(f"Invalid index {index} for view {view_type.value}")
-
-        row = df.iloc[index]
-        x_col = view_type.get_x_column()
-        y_col = view_type.get_y_column()
-        return Coordinate(float(row[x_col]), float(row[y_col]))
+        x, y = self._get_store(view_type, index).get(index)
+        return Coordinate(x, y)
+
+    def get_original_coordinate(self, view_type: ViewType, index: int) -> Coordinate:
+        """Get the loaded coordinate for specific view and index, ignoring edits."""
+        x, y = self._get_store(view_type, index).get_original(index)
+        return Coordinate(x, y)
+
+    def get_coordinate_arrays(self, view_type: ViewType) -> Tuple[np.ndarray, ...]:
+        """Get read-only loaded x and y arrays for every record of a view."""
+        store = self._stores.get(view_type.value)
+        if store is None:
+            raise KeyError(view_type.value)
+        return store.arrays()
+
+    def get_line_ids(self, view_type: ViewType) -> np.ndarray:
+        """Get the lineId of every record of a view."""
+        store = self._stores.get(view_type.value)
+        if store is None:
+            raise KeyError(view_type.value)
+        return store.line_ids
+
+    def get_mag_id(self, view_type: ViewType, index: int) -> int:
+        """Get the magId of the record at index."""
+        return int(self._get_store(view_type, index).mag_ids[index])
+
+    def find_indices(self, view_type: ViewType, mag_ids: np.ndarray) -> np.ndarray:
+        """Map magIds to record indices of a view; -1 where absent."""
+        store = self._stores.get(view_type.value)
+        if store is None:
+            return np.full(len(mag_ids), -1, dtype=np.int64)
+        return store.indices_of(np.asarray(mag_ids, dtype=np.int64))
 
     def get_extents(self, view_type: ViewType) -> Extents:
         """Get coordinate extents for a view."""
@@ -51,46 +106,87 @@ class VehicleDataRepository:
         self, view_type: ViewType, index: int, x: float, y: float
     ) -> None:
         """Update coordinate for specific view and index."""
-        df = self._data_frames.get(view_type.value)
-        if df is None or index >= len(df):
-            raise IndexError(f"Invalid index {index} for view {view_type.value}")
+        self._get_store(view_type, index).set(index, x, y)
 
-        x_col = view_type.get_x_column()
-        y_col = view_type.get_y_column()
-        df.loc[index, x_col] = x
-        df.loc[index, y_col] = y
+    def update_coordinates(
+        self, view_type: ViewType, indices: np.ndarray, xs: np.ndarray, ys: np.ndarray
+    ) -> None:
+        """Update many coordinates of a view; indices must be distinct."""
+        store = self._stores.get(view_type.value)
+        indices = np.asarray(indices, dtype=np.int64)
+        if store is None or ((indices < 0) | (indices >= len(store))).any():
+            raise IndexError(f"Invalid indices for view {view_type.value}")
+        store.set_many(indices, np.asarray(xs, float), np.asarray(ys, float))
+
+    def get_dataframe(self, view_type: ViewType) -> pd.DataFrame:
+        """Get the view's DataFrame as loaded (calibration edits not applied)."""
+        store = self._stores.get(view_type.value)
+        if store is None:
+            raise KeyError(view_type.value)
+        return store.source_frame()
+
+    def get_modifications(
+        self, view_type: ViewType
+    ) -> Dict[int, CoordinateModification]:
+        """Get the calibration edits of a view, in O(number of edits)."""
+        store = self._stores.get(view_type.value)
+        if store is None:
+            return {}
+
+        modifications = {}
+        indices, dx, dy = store.overlay.edits()
+        for index, ddx, ddy in zip(indices.tolist(), dx.tolist(), dy.tolist()):
+            original = Coordinate(*store.get_original(index))
+            modifications[index] = CoordinateModification(
+                record_index=index,
+                view=view_type,
+                original_coordinate=original,
+                modified_coordinate=original.add(ddx, ddy),
+            )
+        return modifications
+
+    def get_calibration_stats(self, view_type: ViewType) -> Dict[str, float]:
+        """Get edit count and displacement statistics for a view."""
+        store = self._stores.get(view_type.value)
+        _, dx, dy = store.overlay.edits() if store else ((), (), ())
+        if not len(dx):
+            return {"edits": 0, "mean_shift": 0.0, "max_shift": 0.0}
+
+        shift = np.hypot(dx, dy)
+        return {
+            "edits": len(shift),
+            "mean_shift": float(shift.mean()),
+            "max_shift": float(shift.max()),
+        }
 
     def get_all_records(self, view_type: ViewType) -> list[VehicleRecord]:
         """Get all records for a view type."""
-        df = self._data_frames.get(view_type.value)
-        if df is None:
+        store = self._stores.get(view_type.value)
+        if store is None:
             return []
 
         records = []
-        x_col = view_type.get_x_column()
-        y_col = view_type.get_y_column()
-
-        for _, row in df.iterrows():
-            coord = Coordinate(float(row[x_col]), float(row[y_col]))
-            record = VehicleRecord(int(row["magId"]), coord)
-            records.append(record)
+        xs, ys = store.current_arrays()
+        for index, (mag_id, x, y) in enumerate(
+            zip(store.mag_ids.tolist(), xs.tolist(), ys.tolist())
+        ):
+            coords = {view_type.value: Coordinate(x, y)}
+            records.append(VehicleRecord(index, mag_id, coords))
 
         return records
 
     def get_full_record(self, view_type: ViewType, index: int) -> Dict[str, Any]:
         """Get full record data for specific view and index."""
-        df = self._data_frames.get(view_type.value)
-        if df is None or index >= len(df):
+        store = self._stores.get(view_type.value)
+        if store is None or index >= len(store):
             return {}
 
-        row = df.iloc[index]
-        return row.to_dict()
+        return store.get_row(index)
 
     def get_master_record(self, index: int) -> Dict[str, Any]:
         """Get master table (map) record for index."""
-        df = self._data_frames.get("map")
-        if df is None or index >= len(df):
+        rows = self._master_rows
+        if index >= len(rows):
             return {}
 
-        row = df.iloc[index]
-        return row.to_dict()
+        return dict(zip(rows.dtype.names, rows[index].tolist()))
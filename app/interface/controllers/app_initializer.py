@@ -7,6 +7,7 @@ from ...application.services.data_manager_service import DataManagerService
 from .playback_controller import PlaybackController
 from .export_handler import ExportHandler
 from .reload_handler import ReloadHandler
+from .history_handler import HistoryHandler
 
 
 class AppInitializer:
@@ -29,6 +30,7 @@ class AppInitializer:
         self,
         update_callback: Callable[[int], None],
         status_callback: Callable[[str], None],
+        refresh_callback: Callable[[], None],
     ) -> Dict[str, object]:
         """Create and return controller instances."""
         playback_ctrl = PlaybackController(
@@ -38,12 +40,21 @@ class AppInitializer:
         export_handler = ExportHandler(self.data_service, status_callback)
 
         reload_handler = ReloadHandler(
-            self.data_service, playback_ctrl, status_callback, update_callback
+            self.data_service,
+            playback_ctrl,
+            status_callback,
+            update_callback,
+            refresh_callback,
+        )
+
+        history_handler = HistoryHandler(
+            self.root, self.data_service, playback_ctrl, status_callback
         )
 
         return {
             "playback_ctrl": playback_ctrl,
             "export_handler": export_handler,
             "reload_handler": reload_handler,
+            "history_handler": history_handler,
             "data_service": self.data_service,
         }
@@ -15,11 +15,12 @@ class EmulatorController:
         # Initialize app components
         self.initializer = AppInitializer(root)
         controllers = self.initializer.create_controllers(
-            self._update_all_views, self._set_status
+            self._update_all_views, self._set_status, self._reload_paths
         )
         self.playback_ctrl = controllers["playback_ctrl"]
         self.export_handler = controllers["export_handler"]
         self.reload_handler = controllers["reload_handler"]
+        self.history_handler = controllers["history_handler"]
         # Build UI and set up event handlers
         self._build_ui()
         self._update_all_views(0)
@@ -43,6 +44,7 @@ class EmulatorController:
         )
         # Wire up the playback controls
         self._wire_playback_controls(components)
+        self.history_handler.bind_shortcuts()
 
     def _wire_playback_controls(self, components: dict) -> None:
         """Wire up playback control callbacks."""
@@ -71,21 +73,27 @@ class EmulatorController:
 
     def _update_all_views(self, index: int) -> None:
         """Update all canvas views and info panels."""
-        for canvas in self.canvases.values():
-            canvas.update_marker(index)
-        for view_name, panel in self.info_panels.items():
-            try:
-                data = self.initializer.data_service.get_full_record(view_name, index)
-                panel.update_data(data)
-            except Exception:
-                panel.update_data({})
         try:
-            master_data = self.initializer.data_service.get_master_record(index)
-            correlation_data = self.initializer.data_service.get_correlation_data(index)
-            self.correlation_panel.update_data(master_data, correlation_data)
+            frame = self.initializer.data_service.get_frame(index)
         except Exception:
+            frame = None
+        coordinates = frame.coordinates if frame else {}
+        views = frame.views if frame else {}
+
+        for view_name, canvas in self.canvases.items():
+            canvas.update_marker(index, coordinates.get(view_name))
+        for view_name, panel in self.info_panels.items():
+            panel.update_data(views.get(view_name, {}))
+        if frame:
+            self.correlation_panel.update_data(frame.master, views)
+        else:
             self.correlation_panel.update_data({}, {})
 
+    def _reload_paths(self) -> None:
+        """Re-project every canvas path after the data was reloaded."""
+        for canvas in self.canvases.values():
+            canvas.reload_path()
+
     def _set_status(self, message: str) -> None:
         """Set status message."""
         self.event_handlers.status_display.set_status(message)
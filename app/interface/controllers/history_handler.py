@@ -0,0 +1,61 @@
+"""Undo/redo keyboard handler."""
+
+import tkinter as tk
+from typing import Callable, Optional
+from ...application.services.data_manager_service import DataManagerService
+from ...application.services.edit_history_service import HistoryEntry
+from .playback_controller import PlaybackController
+
+SYNC_INTERVAL_MS = 1000
+
+
+class HistoryHandler:
+    """Binds undo/redo shortcuts and keeps the edit journal synced."""
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        data_service: DataManagerService,
+        playback_ctrl: PlaybackController,
+        status_callback: Callable[[str], None],
+    ):
+        """Initialize history handler."""
+        self.root = root
+        self.data_service = data_service
+        self.playback_ctrl = playback_ctrl
+        self.status_callback = status_callback
+
+    def bind_shortcuts(self) -> None:
+        """Bind Ctrl+Z to undo and Ctrl+Y / Ctrl+Shift+Z to redo."""
+        self.root.bind_all("<Control-z>", lambda e: self.undo())
+        self.root.bind_all("<Control-y>", lambda e: self.redo())
+        self.root.bind_all("<Control-Z>", lambda e: self.redo())
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(SYNC_INTERVAL_MS, self._sync)
+
+    def undo(self) -> None:
+        """Undo the latest edit and show the affected record."""
+        self._show(self.data_service.undo(), "Undo")
+
+    def redo(self) -> None:
+        """Redo the latest undone edit and show the affected record."""
+        self._show(self.data_service.redo(), "Redo")
+
+    def _show(self, entry: Optional[HistoryEntry], action: str) -> None:
+        """Move playback to the edited record and report the action."""
+        if entry is None:
+            self.status_callback(f"Nothing to {action.lower()}")
+            return
+        self.playback_ctrl.current_index = entry.index
+        self.playback_ctrl.update_callback(entry.index)
+        self.status_callback(f"{action}: {entry.view_type.value} #{entry.index}")
+
+    def _sync(self) -> None:
+        """Periodically flush journal records written while idle."""
+        self.data_service.sync_journal()
+        self.root.after(SYNC_INTERVAL_MS, self._sync)
+
+    def _on_close(self) -> None:
+        """Close the journal before destroying the window."""
+        self.data_service.close()
+        self.root.destroy()
@@ -14,12 +14,14 @@ class ReloadHandler:
         playback_ctrl: PlaybackController,
         status_callback: Callable[[str], None],
         update_callback: Callable[[int], None],
+        refresh_callback: Callable[[], None],
     ):
         """Initialize reload handler."""
         self.data_service = data_service
         self.playback_ctrl = playback_ctrl
         self.status_callback = status_callback
         self.update_callback = update_callback
+        self.refresh_callback = refresh_callback
 
     def reload_data(self) -> None:
         """Reload data from database and update views."""
@@ -27,6 +29,7 @@ class ReloadHandler:
             self.status_callback("Reloading data from database...")
             self.data_service.reload_data()
             self.playback_ctrl.update_total_records(self.data_service.total_records)
+            self.refresh_callback()  # Re-project paths from the new data
             self.update_callback(0)  # Reset to first record
             self.status_callback("Data reloaded successfully!")
         except Exception as exc:
@@ -3,8 +3,12 @@
         3. No invierte el eje Y ya que los datos están en orden correcto.s."""
 
 from typing import Tuple
+import numpy as np
 from ...domain.value_objects.view_type import ViewType
 
+ZOOM_STEP = 1.25
+MAX_ZOOM_LEVEL = 40
+
 
 class CanvasCoordinateHelper:
     """Helper for coordinate transformations on a Tkinter canvas.
@@ -48,13 +52,34 @@ class CanvasCoordinateHelper:
         """
         self.data_service = data_service
         self.view_name = view_name
-        self.width = width
-        self.height = height
+        self.padding = padding
+
+        # Estado de zoom/pan: nivel entero (zoom = ZOOM_STEP ** nivel) + desplazamiento
+        self.zoom_level = 0
+        self.pan_x = 0.0
+        self.pan_y = 0.0
 
         # Extremos de los datos (min/max) recuperados del servicio existente
         self.min_x, self.min_y, self.max_x, self.max_y = data_service.get_extents(
             view_name
         )
+        self.resize(width, height)
+
+        # Invertir Y solo para BambooPattern para que UW* esté abajo y DE* arriba
+        view_type = ViewType.from_string(view_name)
+        self.flip_y = (view_type == ViewType.BAMBOO_PATTERN)
+
+    def refresh_extents(self) -> None:
+        """Relee los extremos de los datos (tras recargar) y recalcula la escala."""
+        self.min_x, self.min_y, self.max_x, self.max_y = self.data_service.get_extents(
+            self.view_name
+        )
+        self.resize(self.width, self.height)
+
+    def resize(self, width: int, height: int) -> None:
+        """Recalcula escala y offsets para un nuevo tamaño de canvas."""
+        self.width = width
+        self.height = height
 
         # Rango en cada eje (evitamos división por 0)
         range_x = self.max_x - self.min_x or 1e-9
@@ -62,16 +87,62 @@ class CanvasCoordinateHelper:
 
         # --- Escala uniforme: mismo factor en X e Y ---
         self.scale = min(
-            (width - 2 * padding) / range_x, (height - 2 * padding) / range_y
+            max(width - 2 * self.padding, 1) / range_x,
+            max(height - 2 * self.padding, 1) / range_y,
         )
 
         # Offsets para centrar
         self.offset_x = (width - range_x * self.scale) / 2
         self.offset_y = (height - range_y * self.scale) / 2
 
-        # Invertir Y solo para BambooPattern para que UW* esté abajo y DE* arriba
-        view_type = ViewType.from_string(view_name)
-        self.flip_y = (view_type == ViewType.BAMBOO_PATTERN)
+    # --------------------------------------------------------------------- #
+    #                          Zoom y desplazamiento                        #
+    # --------------------------------------------------------------------- #
+
+    @property
+    def zoom(self) -> float:
+        """Factor de zoom actual sobre la proyección base."""
+        return ZOOM_STEP**self.zoom_level
+
+    @property
+    def is_zoomed(self) -> bool:
+        """Indica si la vista difiere de la proyección base."""
+        return self.zoom_level != 0 or self.pan_x != 0 or self.pan_y != 0
+
+    def zoom_at(self, cx: float, cy: float, steps: int) -> bool:
+        """Cambia el nivel de zoom manteniendo fijo el punto (cx, cy)."""
+        level = min(max(self.zoom_level + steps, 0), MAX_ZOOM_LEVEL)
+        if level == self.zoom_level:
+            return False
+        bx, by = self._to_base(cx, cy)
+        self.zoom_level = level
+        if level == 0:
+            self.pan_x = self.pan_y = 0.0
+        else:
+            self.pan_x = cx - bx * self.zoom
+            self.pan_y = cy - by * self.zoom
+        return True
+
+    def pan_by(self, dx: float, dy: float) -> None:
+        """Desplaza la vista dx/dy píxeles de canvas."""
+        self.pan_x += dx
+        self.pan_y += dy
+
+    def reset_view(self) -> None:
+        """Vuelve a la proyección base (sin zoom ni desplazamiento)."""
+        self.zoom_level = 0
+        self.pan_x = self.pan_y = 0.0
+
+    def viewport_in_base(self) -> Tuple[float, float, float, float]:
+        """Rectángulo visible del canvas expresado en la proyección base."""
+        x0, y0 = self._to_base(0, 0)
+        x1, y1 = self._to_base(self.width, self.height)
+        return x0, y0, x1, y1
+
+    def _to_base(self, cx: float, cy: float) -> Tuple[float, float]:
+        """Deshace zoom/pan: canvas -> proyección base."""
+        zoom = self.zoom
+        return (cx - self.pan_x) / zoom, (cy - self.pan_y) / zoom
 
     # --------------------------------------------------------------------- #
     #                    Conversión dominio <-> canvas                      #
@@ -85,10 +156,33 @@ class CanvasCoordinateHelper:
             cy = self.height - ((y - self.min_y) * self.scale + self.offset_y)
         else:
             cy = (y - self.min_y) * self.scale + self.offset_y
-        return cx, cy
+        zoom = self.zoom
+        return cx * zoom + self.pan_x, cy * zoom + self.pan_y
+
+    def to_base_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Proyección base vectorizada (sin zoom/pan): devuelve un array (n, 2)."""
+        points = np.empty((len(xs), 2), dtype=np.float64)
+        np.multiply(np.subtract(xs, self.min_x), self.scale, out=points[:, 0])
+        points[:, 0] += self.offset_x
+
+        cy = points[:, 1]
+        np.multiply(np.subtract(ys, self.min_y), self.scale, out=cy)
+        cy += self.offset_y
+        if self.flip_y:
+            np.subtract(self.height, cy, out=cy)
+        return points
+
+    def to_canvas_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Versión vectorizada de ``to_canvas``: devuelve un array (n, 2)."""
+        points = self.to_base_many(xs, ys)
+        if self.is_zoomed:
+            points *= self.zoom
+            points += (self.pan_x, self.pan_y)
+        return points
 
     def from_canvas(self, cx: float, cy: float) -> Tuple[float, float]:
         """Convierte coordenadas de canvas a coordenadas de datos."""
+        cx, cy = self._to_base(cx, cy)
         if self.flip_y:
             y_comp = self.height - cy - self.offset_y
         else:
@@ -1,52 +1,133 @@
 """Canvas drag interaction handler."""
 
 import tkinter as tk
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
 
-if TYPE_CHECKING:
-    pass
+FRAME_MS = 16
+HIT_SLACK = 3
+
+
+@dataclass
+class DragSession:
+    """State of one marker drag, from press to release or cancel."""
+
+    index: int
+    origin: Tuple[float, float]
+    pending: Optional[Tuple[float, float]] = None
 
 
 class DragHandler:
-    """Handles mouse drag interactions on canvas."""
+    """Handles mouse drag interactions on canvas.
 
-    def __init__(self, canvas: tk.Canvas, data_service, coordinate_helper):
-        """Initialize drag handler."""
+    Motion events only move the marker item, at most once per frame; the
+    data service sees a single ``set_coord`` when the button is released.
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        data_service,
+        coordinate_helper,
+        on_commit: Optional[Callable[[], None]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize drag handler; the callbacks redraw the marker after a drag."""
         self.canvas = canvas
         self.data_service = data_service
         self.coord_helper = coordinate_helper
-        self.dragging: bool = False
+        self.on_commit = on_commit
+        self.on_cancel = on_cancel
         self.current_index: int = 0
+        self.marker_id: Optional[int] = None
+        self.session: Optional[DragSession] = None
+        self._frame_job: Optional[str] = None
 
         self._bind_events()
 
+    @property
+    def dragging(self) -> bool:
+        """Whether a drag session is active."""
+        return self.session is not None
+
     def _bind_events(self) -> None:
         """Bind mouse events for dragging."""
         self.canvas.bind("<ButtonPress-1>", self._on_press)
         self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_release)
+        self.canvas.bind("<Escape>", self._on_cancel)
 
     def _on_press(self, event: tk.Event) -> None:
-        """Handle mouse press event."""
-        self.dragging = True
+        """Start a drag session when the press hits the marker."""
+        bbox = self.canvas.bbox(self.marker_id) if self.marker_id else None
+        if not bbox:
+            return
+        x1, y1, x2, y2 = bbox
+        if not (x1 - HIT_SLACK <= event.x <= x2 + HIT_SLACK):
+            return
+        if not (y1 - HIT_SLACK <= event.y <= y2 + HIT_SLACK):
+            return
+
+        origin = ((x1 + x2) / 2.0, (y1 + y2) / 2.0)
+        self.session = DragSession(self.current_index, origin)
+        self.canvas.focus_set()
 
     def _on_drag(self, event: tk.Event) -> None:
-        """Handle mouse drag event."""
-        if not self.dragging:
+        """Record the latest pointer position and schedule a preview frame."""
+        if self.session is None:
             return
 
-        # Convert canvas coordinates to data coordinates
-        x, y = self.coord_helper.from_canvas(event.x, event.y)
+        self.session.pending = (event.x, event.y)
+        if self._frame_job is None:
+            self._frame_job = self.canvas.after(FRAME_MS, self._flush_preview)
 
-        # Update the coordinate in the data service
-        self.data_service.set_coord(
-            self.coord_helper.view_name, self.current_index, x, y
-        )
+    def _flush_preview(self) -> None:
+        """Move the marker item to the latest pending position."""
+        self._frame_job = None
+        if self.session is not None and self.session.pending is not None:
+            self._move_marker(*self.session.pending)
 
     def _on_release(self, event: tk.Event) -> None:
-        """Handle mouse release event."""
-        self.dragging = False
+        """Commit the drag as a single coordinate update."""
+        session = self._end_session()
+        if session is None or session.pending is None:
+            return
+
+        self._move_marker(*session.pending)
+        x, y = self.coord_helper.from_canvas(*session.pending)
+        self.data_service.set_coord(self.coord_helper.view_name, session.index, x, y)
+        if self.on_commit:
+            self.on_commit()
+
+    def _on_cancel(self, event: tk.Event) -> None:
+        """Abort the drag and redraw the marker at its unchanged coordinate."""
+        session = self._end_session()
+        if session is None:
+            return
+        if self.on_cancel:
+            self.on_cancel()
+        else:
+            self._move_marker(*session.origin)
+
+    def _end_session(self) -> Optional[DragSession]:
+        """Stop the session and any pending preview frame."""
+        if self._frame_job is not None:
+            self.canvas.after_cancel(self._frame_job)
+            self._frame_job = None
+        session, self.session = self.session, None
+        return session
+
+    def _move_marker(self, cx: float, cy: float) -> None:
+        """Center the marker item on canvas position (cx, cy)."""
+        if self.marker_id is None:
+            return
+        x1, y1, x2, y2 = self.canvas.coords(self.marker_id)
+        self.canvas.move(self.marker_id, cx - (x1 + x2) / 2.0, cy - (y1 + y2) / 2.0)
 
     def set_current_index(self, index: int) -> None:
         """Set the current index for dragging operations."""
         self.current_index = index
+
+    def set_marker(self, marker_id: Optional[int]) -> None:
+        """Set the canvas item dragged by this handler."""
+        self.marker_id = marker_id
@@ -0,0 +1,36 @@
+"""Level-of-detail decimation for projected paths."""
+
+from typing import List
+import numpy as np
+
+
+class PathDecimator:
+    """Drops consecutive path points that collapse into the same pixel bucket."""
+
+    def __init__(self, tolerance: float = 1.0):
+        """Initialize with the bucket size in canvas pixels."""
+        self.tolerance = max(tolerance, 1e-9)
+
+    def decimate(self, points: np.ndarray, line_ids: np.ndarray) -> List[np.ndarray]:
+        """Return one flat [x0, y0, x1, y1, ...] array per ``lineId`` run.
+
+        Runs in O(n) with NumPy only. A point is kept when its bucket differs
+        from the previous point's, and the first/last point of every run is
+        always kept so runs never get joined or shortened.
+        """
+        n = len(points)
+        if n == 0:
+            return []
+
+        buckets = np.floor(points / self.tolerance).astype(np.int64)
+        run_break = line_ids[1:] != line_ids[:-1]
+
+        keep = np.ones(n, dtype=bool)
+        keep[1:] = (buckets[1:] != buckets[:-1]).any(axis=1) | run_break
+        keep[:-1] |= run_break
+
+        starts = np.flatnonzero(np.concatenate(([True], run_break)))
+        kept_per_run = np.add.reduceat(keep.astype(np.intp), starts)
+        kept = points[keep]
+        bounds = np.cumsum(kept_per_run)[:-1]
+        return [run.ravel() for run in np.split(kept, bounds)]
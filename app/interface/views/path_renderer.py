@@ -1,10 +1,17 @@
 """Canvas path renderer."""
 
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import Dict, List, Tuple, TYPE_CHECKING
+import numpy as np
+from .path_decimator import PathDecimator
+from .spatial_bucket_index import SpatialBucketIndex
 
 if TYPE_CHECKING:
     import tkinter as tk
 
+PATH_TAG = "path"
+ZOOM_CACHE_SIZE = 8
+
 
 class PathRenderer:
     """Renders trajectory paths on canvas."""
@@ -14,18 +21,100 @@ class PathRenderer:
         self.canvas = canvas
         self.data_service = data_service
         self.coord_helper = coordinate_helper
+        self.decimator = PathDecimator()
+        self._projection_cache: Dict[Tuple[int, int], np.ndarray] = {}
+        self._segment_cache: Dict[Tuple[int, int], List[np.ndarray]] = {}
+        self._index_cache: Dict[Tuple[int, int], SpatialBucketIndex] = {}
+        self._zoom_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def _size_key(self) -> Tuple[int, int]:
+        """Get the cache key for the current canvas size."""
+        return self.coord_helper.width, self.coord_helper.height
+
+    def project_path(self, view_name: str) -> np.ndarray:
+        """Get the (n, 2) base projection of the path for the current size."""
+        key = self._size_key()
+        points = self._projection_cache.get(key)
+        if points is None:
+            xs, ys = self.data_service.get_original_coords(view_name)
+            points = self.coord_helper.to_base_many(xs, ys)
+            self._projection_cache = {key: points}
+        return points
+
+    def path_segments(self, view_name: str) -> List[np.ndarray]:
+        """Get decimated per-lineId polylines for the current size."""
+        key = self._size_key()
+        segments = self._segment_cache.get(key)
+        if segments is None:
+            points = self.project_path(view_name)
+            line_ids = self.data_service.get_line_ids(view_name)
+            segments = self.decimator.decimate(points, line_ids)
+            self._segment_cache = {key: segments}
+        return segments
+
+    def _spatial_index(self, view_name: str) -> SpatialBucketIndex:
+        """Get the bucket index over the base projection for the current size."""
+        key = self._size_key()
+        index = self._index_cache.get(key)
+        if index is None:
+            index = SpatialBucketIndex(self.project_path(view_name))
+            self._index_cache = {key: index}
+        return index
+
+    def _zoomed_path(self, view_name: str) -> np.ndarray:
+        """Get the base projection scaled to the current zoom level (LRU cached)."""
+        key = (self._size_key(), self.coord_helper.zoom_level)
+        points = self._zoom_cache.get(key)
+        if points is None:
+            points = self.project_path(view_name) * self.coord_helper.zoom
+            self._zoom_cache[key] = points
+            if len(self._zoom_cache) > ZOOM_CACHE_SIZE:
+                self._zoom_cache.popitem(last=False)
+        else:
+            self._zoom_cache.move_to_end(key)
+        return points
+
+    def visible_segments(self, view_name: str) -> List[np.ndarray]:
+        """Get decimated polylines for the points inside the current viewport."""
+        hits = self._spatial_index(view_name).query(
+            *self.coord_helper.viewport_in_base()
+        )
+        if not len(hits):
+            return []
+
+        # Neighbours are included so segments crossing the viewport edge are drawn
+        last = len(self.project_path(view_name)) - 1
+        visible = np.unique(np.concatenate((hits - 1, hits, hits + 1)).clip(0, last))
+        line_ids = self.data_service.get_line_ids(view_name)[visible]
+        breaks = (np.diff(visible) != 1) | (line_ids[1:] != line_ids[:-1])
+        runs = np.concatenate(([0], np.cumsum(breaks)))
+
+        helper = self.coord_helper
+        points = self._zoomed_path(view_name)[visible] + (helper.pan_x, helper.pan_y)
+        return self.decimator.decimate(points, runs)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached projections (e.g. after a data reload)."""
+        self._projection_cache.clear()
+        self._segment_cache.clear()
+        self._index_cache.clear()
+        self._zoom_cache.clear()
 
     def draw_path(self, view_name: str) -> None:
-        """Draw the full polyline path for this view."""
+        """Draw the decimated polyline path for this view."""
         try:
-            coords: list[float] = []
-            for idx in range(self.data_service.total_records):
-                x, y = self.data_service.get_original_coord(view_name, idx)
-                cx, cy = self.coord_helper.to_canvas(x, y)
-                coords.extend([cx, cy])
-
-            if coords:
-                self.canvas.create_line(*coords, fill="#cccccc", width=1)
+            self.canvas.delete(PATH_TAG)
+            if self.coord_helper.is_zoomed:
+                segments = self.visible_segments(view_name)
+            else:
+                segments = self.path_segments(view_name)
+            segments = [s for s in segments if len(s) >= 4]
+            for segment in segments:
+                self.canvas.create_line(
+                    *segment.tolist(), fill="#cccccc", width=1, tags=PATH_TAG
+                )
+            if segments:
+                self.canvas.tag_lower(PATH_TAG)
         except Exception as exc:
             print(f"[PathRenderer] Failed to draw path for {view_name}: {exc}")
 
@@ -0,0 +1,41 @@
+"""Uniform-grid bucket index over projected path points."""
+
+import numpy as np
+
+
+class SpatialBucketIndex:
+    """Groups point indices by grid cell for fast rectangle queries."""
+
+    def __init__(self, points: np.ndarray, cell_size: float = 16.0):
+        """Bucket the (n, 2) points into square cells of ``cell_size``."""
+        self.cell_size = cell_size
+        cells = np.floor(points / cell_size).astype(np.int64)
+        if len(cells):
+            self._origin = cells.min(axis=0)
+            self._shape = cells.max(axis=0) - self._origin + 1
+        else:
+            self._origin = np.zeros(2, dtype=np.int64)
+            self._shape = np.zeros(2, dtype=np.int64)
+
+        local = cells - self._origin
+        keys = local[:, 1] * self._shape[0] + local[:, 0]
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Get sorted indices of all points in cells overlapping the rectangle."""
+        lo = np.floor(np.array([min(x0, x1), min(y0, y1)]) / self.cell_size)
+        hi = np.floor(np.array([max(x0, x1), max(y0, y1)]) / self.cell_size)
+        lo = np.maximum(lo.astype(np.int64) - self._origin, 0)
+        hi = np.minimum(hi.astype(np.int64) - self._origin, self._shape - 1)
+        if (hi < lo).any():
+            return np.empty(0, dtype=np.int64)
+
+        cols = self._shape[0]
+        row_keys = np.arange(lo[1], hi[1] + 1) * cols
+        starts = np.searchsorted(self._sorted_keys, row_keys + lo[0], side="left")
+        ends = np.searchsorted(self._sorted_keys, row_keys + hi[0], side="right")
+        hits = [self._order[s:e] for s, e in zip(starts, ends) if e > s]
+        if not hits:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(hits))
@@ -1,12 +1,13 @@
 """Canvas view for displaying vehicle trajectories."""
 
 import tkinter as tk
-from typing import Optional
+from typing import Optional, Tuple
 
 from ...application.services.data_manager_service import DataManagerService
 from .canvas_coordinate_helper import CanvasCoordinateHelper
 from .path_renderer import PathRenderer
 from .drag_handler import DragHandler
+from .viewport_handler import ViewportHandler
 
 
 class ViewCanvas(tk.Canvas):
@@ -36,28 +37,72 @@ class ViewCanvas(tk.Canvas):
         self.view_name = view_name
         self.current_index: int = 0
         self.marker_id: Optional[int] = None
+        self._resize_job: Optional[str] = None
 
         # Initialize helpers
         self.coord_helper = CanvasCoordinateHelper(
             data_service, view_name, width, height
         )
         self.path_renderer = PathRenderer(self, data_service, self.coord_helper)
-        self.drag_handler = DragHandler(self, data_service, self.coord_helper)
+        self.drag_handler = DragHandler(
+            self,
+            data_service,
+            self.coord_helper,
+            on_commit=lambda: self.update_marker(self.current_index),
+            on_cancel=lambda: self.update_marker(self.current_index),
+        )
+        self.viewport_handler = ViewportHandler(
+            self, self.coord_helper, self.redraw_view
+        )
 
         # Draw initial path
         self.path_renderer.draw_path(view_name)
+        self.bind("<Configure>", self._on_configure)
 
-    def update_marker(self, index: int) -> None:
-        """Update the position of the vehicle marker."""
-        if self.marker_id is not None:
-            self.delete(self.marker_id)
+    def _on_configure(self, event: tk.Event) -> None:
+        """Schedule a path redraw when the canvas size changes."""
+        size = (event.width, event.height)
+        if size == (self.coord_helper.width, self.coord_helper.height):
+            return
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(50, self._apply_resize, *size)
+
+    def _apply_resize(self, width: int, height: int) -> None:
+        """Re-project and re-decimate the path for the new canvas size."""
+        self._resize_job = None
+        self.coord_helper.resize(width, height)
+        self.redraw_view()
+
+    def reload_path(self) -> None:
+        """Re-project the path from freshly reloaded data."""
+        self.coord_helper.refresh_extents()
+        self.path_renderer.invalidate_cache()
+        self.redraw_view()
 
+    def redraw_view(self) -> None:
+        """Redraw the path and marker for the current size, zoom and pan."""
+        self.path_renderer.draw_path(self.view_name)
+        self.update_marker(self.current_index)
+
+    def update_marker(
+        self, index: int, coord: Optional[Tuple[float, float]] = None
+    ) -> None:
+        """Update the vehicle marker, using ``coord`` when already known."""
         self.current_index = index
         self.drag_handler.set_current_index(index)
+        if self.drag_handler.dragging:
+            return  # keep the drag preview; the commit redraws the marker
+
+        if self.marker_id is not None:
+            self.delete(self.marker_id)
 
         try:
-            x, y = self.data_service.get_coord(self.view_name, index)
+            if coord is None:
+                coord = self.data_service.get_coord(self.view_name, index)
+            x, y = coord
             self.marker_id = self.path_renderer.draw_marker(x, y)
         except Exception as exc:
             print(f"[ViewCanvas] Failed to update marker: {exc}")
             self.marker_id = None
+        self.drag_handler.set_marker(self.marker_id)
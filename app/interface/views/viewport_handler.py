@@ -0,0 +1,70 @@
+"""Canvas zoom and pan interaction handler."""
+
+import tkinter as tk
+from typing import Callable, Optional
+
+
+class ViewportHandler:
+    """Handles mouse-wheel zoom and right-button drag-to-pan on a canvas."""
+
+    def __init__(self, canvas: tk.Canvas, coordinate_helper, on_change: Callable):
+        """Initialize viewport handler."""
+        self.canvas = canvas
+        self.coord_helper = coordinate_helper
+        self.on_change = on_change
+        self._last_pan: Optional[tuple] = None
+        self._redraw_job: Optional[str] = None
+
+        self._bind_events()
+
+    def _bind_events(self) -> None:
+        """Bind wheel (Windows/macOS and X11) and pan events."""
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._zoom(e, 1))
+        self.canvas.bind("<Button-5>", lambda e: self._zoom(e, -1))
+        self.canvas.bind("<ButtonPress-3>", self._on_pan_start)
+        self.canvas.bind("<B3-Motion>", self._on_pan)
+        self.canvas.bind("<ButtonRelease-3>", self._on_pan_end)
+        self.canvas.bind("<Double-Button-3>", self._on_reset)
+
+    def _on_wheel(self, event: tk.Event) -> None:
+        """Handle mouse wheel event."""
+        self._zoom(event, 1 if event.delta > 0 else -1)
+
+    def _zoom(self, event: tk.Event, steps: int) -> None:
+        """Zoom around the cursor position."""
+        if self.coord_helper.zoom_at(event.x, event.y, steps):
+            self._schedule_redraw()
+
+    def _on_pan_start(self, event: tk.Event) -> None:
+        """Start panning."""
+        self._last_pan = (event.x, event.y)
+
+    def _on_pan(self, event: tk.Event) -> None:
+        """Move the view with the cursor."""
+        if self._last_pan is None:
+            return
+        self.coord_helper.pan_by(
+            event.x - self._last_pan[0], event.y - self._last_pan[1]
+        )
+        self._last_pan = (event.x, event.y)
+        self._schedule_redraw()
+
+    def _on_pan_end(self, event: tk.Event) -> None:
+        """Stop panning."""
+        self._last_pan = None
+
+    def _on_reset(self, event: tk.Event) -> None:
+        """Reset to the full-extent view."""
+        self.coord_helper.reset_view()
+        self._schedule_redraw()
+
+    def _schedule_redraw(self) -> None:
+        """Coalesce bursts of wheel/motion events into one redraw."""
+        if self._redraw_job is None:
+            self._redraw_job = self.canvas.after_idle(self._redraw)
+
+    def _redraw(self) -> None:
+        """Run the pending redraw."""
+        self._redraw_job = None
+        self.on_change()
@@ -0,0 +1,66 @@
+"""
+Benchmark: rows/sec of each DataInsertionService strategy against MySQL.
+Recreates the tables from DatabaseSchemaService for every strategy and
+loads the view tables (plus a map table built from their magIds) from the
+latest dump in share/SQL. Uses the DB_* environment variables; needs a
+scratch database, the tables are dropped. load_data needs local_infile=ON
+on the server; the run stops if any table fell back to another strategy.
+
+Usage: python benchmarks/bench_insert_strategies.py [strategy ...]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "dataLoader"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sql_dump_frames import load_view_frames
+from database.connection import get_bulk_load_engine
+from services import DataInsertionService, DatabaseSchemaService
+
+TABLE_NAMES = ["map", "centerpos2x", "bamboopattern", "largescreenpixelpos"]
+
+
+def main():
+    """Load every table with each strategy and print rows/sec."""
+    strategies = sys.argv[1:] or list(DataInsertionService.STRATEGIES)
+    frames = load_view_frames()
+    tsv_dir = tempfile.mkdtemp(prefix="stakes_tsv_")
+    try:
+        engine = get_bulk_load_engine(tsv_dir)
+        schema = DatabaseSchemaService(engine)
+        total_rows = sum(len(df) for df in frames.values())
+
+        for strategy in strategies:
+            schema.drop_tables_if_exist(TABLE_NAMES)
+            schema.create_tables()
+            service = DataInsertionService(
+                engine, default_strategy=strategy, tsv_dir=tsv_dir
+            )
+            start = time.perf_counter()
+            service.insert_all_data(frames)
+            elapsed = time.perf_counter() - start
+            fell_back = [
+                table for table, (used, _, _) in service.stats.items() if used != strategy
+            ]
+            if fell_back:
+                raise SystemExit(
+                    f"{strategy}: fell back on {', '.join(fell_back)}; no timing recorded"
+                )
+            print(
+                f"{strategy}: {total_rows} rows in {elapsed:.2f}s "
+                f"({total_rows / elapsed:,.0f} rows/s)"
+            )
+            for table_name, (used, rows, seconds) in service.stats.items():
+                print(f"  {table_name:<20} {used:<12} {rows / seconds:>12,.0f} rows/s")
+    finally:
+        shutil.rmtree(tsv_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: restoring calibration edits from the undo/redo journal.
+Records EDITS edits (with some undo/redo) into a temporary journal, then
+times EditHistoryService.replay on a freshly loaded repository.
+
+Usage: python benchmarks/bench_journal_replay.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sql_dump_frames import load_view_frames
+from app.application.services.edit_history_service import EditHistoryService
+from app.domain.value_objects.view_type import ViewType
+from app.infrastructure.journal.calibration_journal import CalibrationJournal
+from app.infrastructure.repositories.vehicle_data_repository import (
+    VehicleDataRepository,
+)
+
+EDITS = 50000
+
+
+def load_repository(frames):
+    """Build a repository over copies of the dump frames."""
+    repo = VehicleDataRepository()
+    repo.loader.load_all_tables = lambda: {k: v.copy() for k, v in frames.items()}
+    repo.load_all_data()
+    return repo
+
+
+def main():
+    """Write the journal, replay it and compare the restored coordinates."""
+    frames = load_view_frames()
+    rng = random.Random(0)
+    path = os.path.join(tempfile.mkdtemp(), "calibration.journal")
+
+    repo = load_repository(frames)
+    n = repo.get_total_records()
+    history = EditHistoryService(repo, CalibrationJournal(path, batch_size=1024))
+    start = time.perf_counter()
+    for _ in range(EDITS):
+        view = rng.choice(list(ViewType))
+        history.record(view, rng.randrange(n), rng.random(), rng.random())
+        if rng.random() < 0.1:
+            history.undo()
+        elif rng.random() < 0.05:
+            history.redo()
+    history.close()
+    record_s = time.perf_counter() - start
+
+    restored = load_repository(frames)
+    replayed = EditHistoryService(restored, CalibrationJournal(path))
+    start = time.perf_counter()
+    points = replayed.replay()
+    replay_s = time.perf_counter() - start
+
+    for view in ViewType:
+        expected = repo.get_modifications(view)
+        actual = restored.get_modifications(view)
+        assert expected.keys() == actual.keys(), view
+        for index, mod in expected.items():
+            assert actual[index].modified_coordinate == mod.modified_coordinate
+    print(f"Journal: {os.path.getsize(path) / 1e6:.1f} MB, {EDITS} edits")
+    print(f"  record {record_s / EDITS * 1e6:.1f} us/edit")
+    print(f"  replay {replay_s * 1e3:.0f} ms, {points} points restored")
+
+
+if __name__ == "__main__":
+    main()
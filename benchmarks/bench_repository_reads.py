@@ -0,0 +1,78 @@
+"""
+Microbenchmark: single-index coordinate reads/writes in VehicleDataRepository.
+Compares the previous DataFrame row access with the columnar store.
+
+Usage: python benchmarks/bench_repository_reads.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sql_dump_frames import load_view_frames
+from app.domain.value_objects.coordinate import Coordinate
+from app.domain.value_objects.view_type import ViewType
+from app.infrastructure.repositories.vehicle_data_repository import (
+    VehicleDataRepository,
+)
+
+CALLS = 30000
+
+
+def dataframe_read(df, view_type, index):
+    """Previous implementation: full row fetch through iloc."""
+    row = df.iloc[index]
+    return Coordinate(
+        float(row[view_type.get_x_column()]), float(row[view_type.get_y_column()])
+    )
+
+
+def dataframe_write(df, view_type, index):
+    """Previous implementation: label-based write through loc."""
+    df.loc[index, view_type.get_x_column()] = 1.0
+    df.loc[index, view_type.get_y_column()] = 2.0
+
+
+def main():
+    """Run the benchmark for every view and print per-call timings."""
+    frames = load_view_frames()
+    repo = VehicleDataRepository()
+    repo.loader.load_all_tables = lambda: {k: v.copy() for k, v in frames.items()}
+    repo.load_all_data()
+    n = repo.get_total_records()
+    print(f"Records per view: {n}, calls per measurement: {CALLS}")
+
+    for view in ViewType:
+        df = frames[view.value].astype(
+            {view.get_x_column(): float, view.get_y_column(): float}
+        )
+        idx = [i * 7919 % n for i in range(CALLS)]
+        it = iter(idx * 4)
+        before_r = timeit.timeit(
+            lambda: dataframe_read(df, view, next(it)), number=CALLS
+        )
+        after_r = timeit.timeit(
+            lambda: repo.get_coordinate(view, next(it)), number=CALLS
+        )
+        before_w = timeit.timeit(
+            lambda: dataframe_write(df, view, next(it)), number=CALLS
+        )
+        after_w = timeit.timeit(
+            lambda: repo.update_coordinate(view, next(it), 1.0, 2.0), number=CALLS
+        )
+        print(f"{view.value}:")
+        print(
+            f"  read  before {before_r / CALLS * 1e6:8.2f} us  after "
+            f"{after_r / CALLS * 1e6:6.2f} us  ({before_r / after_r:.0f}x)"
+        )
+        print(
+            f"  write before {before_w / CALLS * 1e6:8.2f} us  after "
+            f"{after_w / CALLS * 1e6:6.2f} us  ({before_w / after_w:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Helpers to rebuild table DataFrames from the SQL dumps in share/SQL.
+Lets the benchmarks run against real data without a MySQL server.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.join(BASE_DIR, "dataLoader"))
+
+from services import SqlExportService
+from services.sql_dump_reader import read_dumps, split_values
+
+SQL_DIR = os.path.join(BASE_DIR, "share", "SQL")
+VIEW_TABLES = ["bamboopattern", "centerpos2x", "largescreenpixelpos"]
+
+
+def latest_version_dir() -> str:
+    """Return the newest completely exported version directory under share/SQL."""
+    version_dir = SqlExportService(SQL_DIR).get_latest_version_dir()
+    if version_dir is None:
+        raise FileNotFoundError(f"No complete version in {SQL_DIR}")
+    return version_dir
+
+
+def parse_literal(literal: str):
+    """Python value of one dump literal."""
+    if literal == "NULL":
+        return None
+    if literal.startswith("'"):
+        return literal[1:-1].replace("''", "'")
+    try:
+        return int(literal)
+    except ValueError:
+        return float(literal)
+
+
+def load_dump_frame(table_name: str, version_dir: str = None) -> pd.DataFrame:
+    """Parse one table's dumps (.sql or .sqlz, any shards) into a frame ordered by magId."""
+    version_dir = version_dir or latest_version_dir()
+    export = SqlExportService(os.path.dirname(version_dir))
+    files = export.table_files(os.path.basename(version_dir))[table_name]
+    dump = read_dumps([os.path.join(version_dir, f) for f in files])
+    rows = [
+        [parse_literal(v) for v in split_values(dump.rows[mag_id])]
+        for mag_id in sorted(dump.rows)
+    ]
+    return pd.DataFrame(rows, columns=dump.columns)
+
+
+def load_view_frames() -> dict:
+    """Load the three view dumps plus a minimal synthetic map table."""
+    frames = {name: load_dump_frame(name) for name in VIEW_TABLES}
+    frames["map"] = frames["bamboopattern"][["magId", "stake"]].copy()
+    return frames
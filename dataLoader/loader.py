@@ -1,16 +1,19 @@
 import os
+import shutil
 import sys
+import tempfile
 
 # Add parent directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from database.connection import get_engine
+    from database.connection import get_bulk_load_engine, get_engine
     from services import (
         DatabaseSchemaService, 
         DataCleaningService,
         DataInsertionService,
         ExcelLoaderService,
+        IncrementalSyncService,
         SqlExportService
     )
     print("All modules imported successfully")
@@ -23,48 +26,96 @@ BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 SHARE_DIR = os.path.join(BASE_DIR, 'share')
 SQL_DIR = os.path.join(SHARE_DIR, 'SQL')
 TABLE_NAMES = ['map', 'centerpos2x', 'bamboopattern', 'largescreenpixelpos']
+# Worker processes for Excel parsing; 0 = one per file up to the CPU count
+EXCEL_WORKERS = int(os.getenv('EXCEL_WORKERS', '0')) or None
+# Fast-load: bare tables, keys/FKs added after the load; FAST_LOAD=0 creates
+# them up front (fine for small loads)
+FAST_LOAD = os.getenv('FAST_LOAD', '1').lower() in ('1', 'true', 'yes')
+# LOAD_MODE=incremental upserts/deletes only changed rows (tables stay online);
+# full drops and recreates the tables. Incremental falls back to full when
+# the tables do not exist yet.
+LOAD_MODE = os.getenv('LOAD_MODE', 'full').lower()
+# Rows per INSERT statement in the exported SQL files
+SQL_ROWS_PER_INSERT = int(os.getenv('SQL_ROWS_PER_INSERT', '100'))
+# Worker processes for the SQL export; 0 = one per table up to the CPU count
+SQL_EXPORT_WORKERS = int(os.getenv('SQL_EXPORT_WORKERS', '0')) or None
+# Split each exported table into this many magId-range shards
+SQL_SHARDS = int(os.getenv('SQL_SHARDS', '1'))
+# Write version dumps as block-compressed .sqlz archives; SQL_COMPRESS=0 for plain .sql
+SQL_COMPRESS = os.getenv('SQL_COMPRESS', '1').lower() in ('1', 'true', 'yes')
+# Insert strategy: executemany (default), load_data or to_sql; per table with
+# INSERT_STRATEGY_<TABLE>, e.g. INSERT_STRATEGY_MAP=load_data
+INSERT_STRATEGY = os.getenv('INSERT_STRATEGY', 'executemany')
+INSERT_STRATEGIES = {
+    table: os.environ[f'INSERT_STRATEGY_{table.upper()}']
+    for table in TABLE_NAMES
+    if f'INSERT_STRATEGY_{table.upper()}' in os.environ
+}
 
-try:
-    # Initialize services
-    engine = get_engine()
-    schema_service = DatabaseSchemaService(engine)
-    cleaning_service = DataCleaningService()
-    insertion_service = DataInsertionService(engine)
-    excel_service = ExcelLoaderService(SHARE_DIR)
-    sql_export_service = SqlExportService(SQL_DIR)
-    
-    print("Starting data loading process...")
+
+def main():
+    """Run the Excel -> MySQL -> SQL export pipeline."""
+    # LOAD DATA LOCAL INFILE may only send the TSV files staged here
+    tsv_dir = tempfile.mkdtemp(prefix='stakes_tsv_')
+    try:
+        # Initialize services
+        engine = get_engine()
+        schema_service = DatabaseSchemaService(engine)
+        cleaning_service = DataCleaningService()
+        insertion_service = DataInsertionService(
+            get_bulk_load_engine(tsv_dir), default_strategy=INSERT_STRATEGY,
+            strategies=INSERT_STRATEGIES, tsv_dir=tsv_dir
+        )
+        excel_service = ExcelLoaderService(
+            SHARE_DIR, max_workers=EXCEL_WORKERS, cleaning_service=cleaning_service
+        )
+        sql_export_service = SqlExportService(
+            SQL_DIR, rows_per_insert=SQL_ROWS_PER_INSERT, max_workers=SQL_EXPORT_WORKERS,
+            shards=SQL_SHARDS, compress=SQL_COMPRESS
+        )
+        sync_service = IncrementalSyncService(engine, insertion_service)
     
-    # Step 1: Drop existing tables
-    print("Dropping existing tables...")
-    schema_service.drop_tables_if_exist(TABLE_NAMES)
+        print("Starting data loading process...")
     
-    # Step 2: Create fresh tables
-    print("Creating tables...")
-    schema_service.create_tables()
+        # Step 1: Load and clean Excel data (unchanged files come from the cache)
+        dataframes = excel_service.load_all_files()
     
-    # Step 3: Load Excel data
-    dataframes = excel_service.load_all_files()
+        if LOAD_MODE == 'incremental' and sync_service.tables_exist():
+            # Steps 2-4: Upsert/delete changed rows only, in one transaction
+            print("Syncing changed rows...")
+            sync_service.sync_all(dataframes)
+        else:
+            # Step 2: Drop existing tables
+            print("Dropping existing tables...")
+            schema_service.drop_tables_if_exist(TABLE_NAMES)
     
-    # Step 4: Clean data
-    print("Cleaning data...")
-    dataframes['map'] = cleaning_service.clean_map_data(dataframes['map'])
-    dataframes['centerpos2x'] = cleaning_service.clean_centerpos2x_data(dataframes['centerpos2x'])
-    dataframes['bamboopattern'] = cleaning_service.clean_bamboopattern_data(dataframes['bamboopattern'])
-    dataframes['largescreenpixelpos'] = cleaning_service.clean_largescreenpixelpos_data(dataframes['largescreenpixelpos'])
+            # Step 3: Create fresh tables
+            print("Creating tables...")
+            schema_service.create_tables(deferred_keys=FAST_LOAD)
     
-    # Step 5: Insert data
-    print("Inserting data...")
-    insertion_service.insert_all_data(dataframes)
+            # Step 4: Insert data
+            print("Inserting data...")
+            insertion_service.insert_all_data(dataframes)
+            if FAST_LOAD:
+                print("Adding indexes and foreign keys...")
+                schema_service.add_deferred_keys()
+                schema_service.verify_referential_integrity()
     
-    # Step 6: Export SQL files with versioning
-    print("Generating SQL export files...")
-    version_dir = sql_export_service.export_all_data_as_sql(dataframes)
+        # Step 5: Export SQL files with versioning
+        print("Generating SQL export files...")
+        version_dir = sql_export_service.export_all_data_as_sql(dataframes)
     
-    print("Carga completada sin pérdidas.")
-    print(f"Archivos SQL exportados en: {version_dir}")
+        print("Carga completada sin pérdidas.")
+        print(f"Archivos SQL exportados en: {version_dir}")
     
-except Exception as e:
-    print(f"Error during execution: {e}")
-    import traceback
-    traceback.print_exc()
+    except Exception as e:
+        print(f"Error during execution: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        shutil.rmtree(tsv_dir, ignore_errors=True)
+
+
+# Guard needed: the Excel process pool re-imports this module on spawn
+if __name__ == '__main__':
+    main()
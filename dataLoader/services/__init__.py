@@ -6,12 +6,28 @@ from .database_schema_service import DatabaseSchemaService
 from .data_cleaning_service import DataCleaningService
 from .data_insertion_service import DataInsertionService
 from .excel_loader_service import ExcelLoaderService
+from .frame_cache_service import FrameCacheService
+from .incremental_sync_service import IncrementalSyncService
+from .sql_archive import SqlArchive
+from .sql_chunk_sync_service import SqlChunkSyncService
+from .sql_delta_service import SqlDeltaService
 from .sql_export_service import SqlExportService
+from .sql_row_renderer import SqlRowRenderer
+from .sql_snapshot_service import SqlSnapshotService
+from .version_catalog import VersionCatalog
 
 __all__ = [
     'DatabaseSchemaService',
     'DataCleaningService', 
     'DataInsertionService',
     'ExcelLoaderService',
-    'SqlExportService'
+    'FrameCacheService',
+    'IncrementalSyncService',
+    'SqlArchive',
+    'SqlChunkSyncService',
+    'SqlDeltaService',
+    'SqlExportService',
+    'SqlRowRenderer',
+    'SqlSnapshotService',
+    'VersionCatalog'
 ]
@@ -3,6 +3,9 @@ Data cleaning service.
 Handles Excel data preprocessing and type conversion.
 """
 
+import hashlib
+import json
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 
@@ -10,34 +13,139 @@ from typing import Dict, Any
 class DataCleaningService:
     """Service for cleaning and preparing Excel data for database insertion."""
     
-    @staticmethod
-    def clean_map_data(df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and prepare map table data."""
-        defaults = {
-            'segment': 0, 'lineDirectionTypeId': 0, 'type': 0.0, 'tid': 0.0,
-            'polar': 0, 'hidenEnable': 0, 'transverse': 0.0, 'longitudinal': 0.0,
-            'curvature': 0.0, 'coordinateX': 0.0, 'coordinateY': 0.0,
-            'coordinateE': 0, 'coordinateN': 0, 'cruisingSpeed': 0, 'limitSpeed': 0,
-            'scene': 0, 'stationType': 0.0, 'stationNum': 0, 'signallamp': 0,
-            'oneWayRoad': 0, 'meetingVec': 0, 'oppositeSegment': 0
+    # Bump when cleaning logic changes in a way the defaults below don't show;
+    # cached cleaned frames are keyed by rules_fingerprint()
+    RULES_VERSION = 2
+    
+    MAP_DEFAULTS: Dict[str, Any] = {
+        'segment': 0, 'lineDirectionTypeId': 0, 'type': 0.0, 'tid': 0.0,
+        'polar': 0, 'hidenEnable': 0, 'transverse': 0.0, 'longitudinal': 0.0,
+        'curvature': 0.0, 'coordinateX': 0.0, 'coordinateY': 0.0,
+        'coordinateE': 0, 'coordinateN': 0, 'cruisingSpeed': 0, 'limitSpeed': 0,
+        'scene': 0, 'stationType': 0.0, 'stationNum': 0, 'signallamp': 0,
+        'oneWayRoad': 0, 'meetingVec': 0, 'oppositeSegment': 0
+    }
+    LARGESCREENPIXELPOS_DEFAULTS: Dict[str, Any] = {
+        'stopTime': 0.0, 'residenceTime': '0'
+    }
+    FILL_VALUE = 0
+    
+    # Column dtypes matching the DDL in DatabaseSchemaService:
+    # INT -> int32, TINYINT -> int8, DOUBLE -> 'double' (float32 when every
+    # value round-trips exactly, else float64), low-cardinality VARCHAR ->
+    # category. Columns left out keep the dtype pandas inferred.
+    DTYPES: Dict[str, Dict[str, str]] = {
+        'map': {
+            'magId': 'int32', 'segment': 'int32', 'lineDirectionTypeId': 'int32',
+            'stake': 'category', 'type': 'double', 'tid': 'double', 'polar': 'int8',
+            'hidenEnable': 'int8', 'transverse': 'double', 'longitudinal': 'double',
+            'curvature': 'double', 'coordinateX': 'double', 'coordinateY': 'double',
+            'coordinateE': 'int32', 'coordinateN': 'int32', 'cruisingSpeed': 'int32',
+            'limitSpeed': 'int32', 'scene': 'int8', 'stationType': 'double',
+            'stationNum': 'int32', 'signallamp': 'int8', 'oneWayRoad': 'int8',
+            'meetingVec': 'int8', 'oppositeSegment': 'int32'
+        },
+        'centerpos2x': {
+            'magId': 'int32', 'stake': 'category', 'lineId': 'int32',
+            'lineDirectionTypeId': 'int32', 'xCoordinate': 'int32',
+            'yCoordinate': 'int32', 'pixelValue': 'int32', 'platformName': 'int32',
+            'platformNumber': 'int32'
+        },
+        'bamboopattern': {
+            'magId': 'int32', 'stake': 'category', 'siteNumber': 'int32',
+            'vehicleleft': 'int32', 'top': 'int32', 'lineDirectionTypeId': 'int32',
+            'lineId': 'int32', 'platformName': 'int32'
+        },
+        'largescreenpixelpos': {
+            'magId': 'int32', 'lineId': 'int32', 'lineDirectionTypeId': 'int32',
+            'xCoordinate': 'int32', 'yCoordinate': 'int32', 'pixelValue': 'int32',
+            'platformName': 'int32', 'platformNumber': 'int32', 'stopTime': 'double',
+            'residenceTime': 'category'
+        },
+    }
+    
+    @classmethod
+    def rules_fingerprint(cls) -> str:
+        """Hash of the rules version and every default used for cleaning."""
+        rules = {
+            'version': cls.RULES_VERSION,
+            'map': cls.MAP_DEFAULTS,
+            'largescreenpixelpos': cls.LARGESCREENPIXELPOS_DEFAULTS,
+            'fill': cls.FILL_VALUE,
+            'dtypes': cls.DTYPES,
         }
-        return df.fillna(defaults)
+        payload = json.dumps(rules, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def clean(cls, table_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean a table's data with its clean_<table>_data rule and dtypes."""
+        before = df.memory_usage(deep=True).sum()
+        df = getattr(cls, f'clean_{table_name}_data')(df)
+        df = cls.apply_dtypes(table_name, df)
+        after = df.memory_usage(deep=True).sum()
+        print(f"  {table_name}: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB in memory")
+        return df
+    
+    @classmethod
+    def apply_dtypes(cls, table_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast columns to the table's DTYPES; unsafe casts are skipped."""
+        return df.astype(cls.dtype_casts(table_name, df))
+    
+    @classmethod
+    def dtype_casts(
+        cls, table_name: str, df: pd.DataFrame, report: bool = True
+    ) -> Dict[str, Any]:
+        """The casts apply_dtypes makes on df, by column; report prints the skipped ones."""
+        casts = {}
+        for col, kind in cls.DTYPES.get(table_name, {}).items():
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if kind == 'category':
+                casts[col] = 'category'
+            elif kind == 'double':
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                exact = np.array_equal(
+                    values.astype(np.float32).astype(np.float64), values, equal_nan=True
+                )
+                casts[col] = np.float32 if exact else np.float64
+            elif series.isna().any() or not pd.api.types.is_numeric_dtype(series):
+                if report:
+                    print(f"  {table_name}.{col}: kept {series.dtype} (NULLs or non-numeric)")
+            else:
+                info = np.iinfo(kind)
+                values = series.to_numpy()
+                # An empty column casts safely and has no min/max to check
+                if values.size and ((values % 1 != 0).any()
+                                    or values.min() < info.min or values.max() > info.max):
+                    if report:
+                        print(f"  {table_name}.{col}: kept {series.dtype} "
+                              f"(values outside {kind})")
+                else:
+                    casts[col] = kind
+        return casts
+    
+    @classmethod
+    def clean_map_data(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and prepare map table data."""
+        return df.fillna(cls.MAP_DEFAULTS)
     
-    @staticmethod
-    def clean_centerpos2x_data(df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def clean_centerpos2x_data(cls, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and prepare centerpos2x table data."""
-        return df.fillna(0)
+        return df.fillna(cls.FILL_VALUE)
     
-    @staticmethod
-    def clean_bamboopattern_data(df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def clean_bamboopattern_data(cls, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and prepare bamboopattern table data."""
-        return df.fillna(0)
+        return df.fillna(cls.FILL_VALUE)
     
-    @staticmethod
-    def clean_largescreenpixelpos_data(df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def clean_largescreenpixelpos_data(cls, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and prepare largescreenpixelpos table data."""
-        df = df.fillna({'stopTime': 0.0, 'residenceTime': '0'})
+        df = df.fillna(cls.LARGESCREENPIXELPOS_DEFAULTS)
         for col in df.columns:
             if col not in ['residenceTime']:
-                df[col] = df[col].fillna(0)
+                df[col] = df[col].fillna(cls.FILL_VALUE)
         return df
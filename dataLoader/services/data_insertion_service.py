@@ -3,37 +3,175 @@ Data insertion service.
 Handles database insertion operations with proper transaction management.
 """
 
+import os
+import tempfile
+import time
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 import pandas as pd
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 
 class DataInsertionService:
-    """Service for inserting cleaned data into database tables."""
-    
-    def __init__(self, engine):
+    """
+    Service for inserting cleaned data into database tables.
+
+    Each table is inserted with one of STRATEGIES:
+      'executemany' - multi-row INSERTs through the DBAPI cursor (default)
+      'load_data'   - stage a TSV file and run LOAD DATA LOCAL INFILE;
+                      falls back to 'executemany' when local infile is disabled
+      'to_sql'      - pandas DataFrame.to_sql (previous behaviour)
+    """
+
+    STRATEGIES = ('executemany', 'load_data', 'to_sql')
+    # MySQL errors meaning local infile is disabled on the server or client
+    # (1148, 3948) or the client refused to send the file (2068)
+    LOCAL_INFILE_DISABLED = (1148, 2068, 3948)
+
+    def __init__(
+        self,
+        engine,
+        default_strategy: str = 'executemany',
+        strategies: Optional[Dict[str, str]] = None,
+        batch_size: int = 5000,
+        tsv_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            engine: SQLAlchemy engine
+            default_strategy: Strategy for tables not listed in strategies
+            strategies: Per-table strategy overrides, e.g. {'map': 'to_sql'}
+            batch_size: Rows per executemany call / to_sql chunk
+            tsv_dir: Directory the 'load_data' TSV files are staged in (the
+                one the engine may send local files from); default temp dir
+        """
+        for strategy in [default_strategy, *(strategies or {}).values()]:
+            if strategy not in self.STRATEGIES:
+                raise ValueError(f"Unknown insert strategy: {strategy}")
         self.engine = engine
-    
+        self.default_strategy = default_strategy
+        self.strategies = dict(strategies or {})
+        self.batch_size = batch_size
+        self.tsv_dir = tsv_dir
+        self.stats: Dict[str, Tuple[str, int, float]] = {}
+
     def insert_all_data(self, dataframes: Dict[str, pd.DataFrame]) -> None:
         """Insert all dataframes into their respective tables."""
         table_order = ['map', 'centerpos2x', 'bamboopattern', 'largescreenpixelpos']
-        
+
         with self.engine.begin() as conn:
             conn.execute(text("SET foreign_key_checks = 0;"))
-            
+
             for table_name in table_order:
                 if table_name in dataframes:
                     self._insert_data(conn, table_name, dataframes[table_name])
-            
+
             conn.execute(text("SET foreign_key_checks = 1;"))
-    
+
     def _insert_data(self, conn, table_name: str, df: pd.DataFrame) -> None:
-        """Insert data into a specific table."""
-        print(f"Inserting {len(df)} rows into {table_name}...")
-        df.to_sql(
-            table_name, 
-            conn, 
-            if_exists="append", 
-            index=False, 
-            chunksize=1000
-        )
+        """Insert data into a specific table with its configured strategy."""
+        strategy = self.strategies.get(table_name, self.default_strategy)
+        print(f"Inserting {len(df)} rows into {table_name} ({strategy})...")
+        start = time.perf_counter()
+        if strategy == 'load_data':
+            try:
+                self._load_data(conn, table_name, df)
+            except DBAPIError as e:
+                # Anything else (duplicate key, lost connection...) must not
+                # be retried on a partly loaded table
+                if self._error_code(e) not in self.LOCAL_INFILE_DISABLED:
+                    raise
+                print(f"  LOAD DATA LOCAL INFILE unavailable ({e.orig}); "
+                      f"falling back to executemany")
+                strategy = 'executemany'
+        if strategy == 'executemany':
+            self._executemany(conn, table_name, df)
+        elif strategy == 'to_sql':
+            df.to_sql(
+                table_name,
+                conn,
+                if_exists="append",
+                index=False,
+                chunksize=1000
+            )
+        elapsed = time.perf_counter() - start
+        self.stats[table_name] = (strategy, len(df), elapsed)
+        rate = len(df) / elapsed if elapsed > 0 else float('inf')
+        print(f"  {table_name}: {len(df)} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+
+    @staticmethod
+    def _error_code(error: DBAPIError) -> Optional[int]:
+        """MySQL error number of a DBAPI error, if the driver exposes one."""
+        code = getattr(error.orig, 'errno', None)
+        if code is None and getattr(error.orig, 'args', None):
+            code = error.orig.args[0]
+        return code if isinstance(code, int) else None
+
+    def _load_data(self, conn, table_name: str, df: pd.DataFrame) -> None:
+        """Stage df as a TSV file and bulk-load it with LOAD DATA LOCAL INFILE."""
+        fd, path = tempfile.mkstemp(suffix='.tsv', prefix=f'{table_name}_', dir=self.tsv_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(self._to_tsv(df))
+            columns = ', '.join(f'`{c}`' for c in df.columns)
+            sql = (
+                f"LOAD DATA LOCAL INFILE '{path.replace(os.sep, '/')}' "
+                f"INTO TABLE `{table_name}` CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' ({columns})"
+            )
+            conn.exec_driver_sql(sql)
+        finally:
+            os.remove(path)
+
+    @staticmethod
+    def _to_tsv(df: pd.DataFrame) -> str:
+        """Render df in LOAD DATA's default text format (\\N for NULL)."""
+        if df.empty:
+            return ''
+        fields: List[pd.Series] = []
+        for col in df.columns:
+            series = df[col]
+            null = series.isna()
+            if pd.api.types.is_float_dtype(series):
+                # repr of the float64 value like SqlRowRenderer, so float32
+                # columns load the doubles the dump and executemany send;
+                # 3.0 -> '3' so whole floats also load cleanly into INT columns
+                doubles = series.astype('float64')
+                values = pd.Series(list(map(repr, doubles.tolist())), index=series.index)
+                whole = ~null & (doubles % 1 == 0) & (doubles.abs() < 2 ** 53)
+                values[whole] = doubles[whole].astype('int64').astype(str)
+            elif pd.api.types.is_integer_dtype(series):
+                values = series.astype(str)
+            else:
+                values = (series.astype(str)
+                          .str.replace('\\', '\\\\', regex=False)
+                          .str.replace('\t', '\\t', regex=False)
+                          .str.replace('\n', '\\n', regex=False)
+                          .str.replace('\r', '\\r', regex=False))
+            fields.append(values.mask(null, '\\N').reset_index(drop=True))
+        lines = fields[0].str.cat(fields[1:], sep='\t')
+        return '\n'.join(lines) + '\n'
+
+    def upsert(self, conn, table_name: str, df: pd.DataFrame) -> None:
+        """Insert df, updating rows whose primary key already exists."""
+        self._executemany(conn, table_name, df, on_duplicate_update=True)
+
+    def _executemany(
+        self, conn, table_name: str, df: pd.DataFrame, on_duplicate_update: bool = False
+    ) -> None:
+        """Insert df with batched multi-row INSERTs on the DBAPI cursor."""
+        columns = ', '.join(f'`{c}`' for c in df.columns)
+        placeholders = ', '.join(['%s'] * len(df.columns))
+        sql = f"INSERT INTO `{table_name}` ({columns}) VALUES ({placeholders})"
+        if on_duplicate_update:
+            updates = ', '.join(f'`{c}` = VALUES(`{c}`)' for c in df.columns)
+            sql += f" ON DUPLICATE KEY UPDATE {updates}"
+        values = df.astype(object).where(df.notna(), None)
+        rows = list(values.itertuples(index=False, name=None))
+        cursor = conn.connection.cursor()
+        try:
+            for start in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[start:start + self.batch_size])
+        finally:
+            cursor.close()
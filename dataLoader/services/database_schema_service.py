@@ -3,15 +3,41 @@ Database schema management service.
 Handles table creation and deletion operations.
 """
 
-from sqlalchemy import text
-from typing import List
+from sqlalchemy import inspect, text
+from typing import Dict, List
+from .table_definitions import TABLE_COLUMNS
+from .table_swaps import TableSwaps
 
 
-class DatabaseSchemaService:
+class DatabaseSchemaService(TableSwaps):
     """Service for managing database schema operations."""
     
+    # Secondary keys and foreign keys; created inline by default, or added
+    # after the load with one ALTER TABLE per table in fast-load mode.
+    # Foreign keys are left unnamed: constraint names are unique per schema,
+    # and InnoDB's generated <table>_ibfk_N names follow RENAME TABLE, so
+    # live, *_staging and *_prev tables never collide.
+    TABLE_KEYS: Dict[str, List[str]] = {
+        'map': ['KEY `idx_stake` (`stake`)'],
+        'centerpos2x': [
+            'FOREIGN KEY (`magId`) REFERENCES `map`(`magId`) '
+            'ON UPDATE CASCADE ON DELETE RESTRICT'
+        ],
+        'bamboopattern': [
+            'FOREIGN KEY (`magId`) REFERENCES `map`(`magId`) '
+            'ON UPDATE CASCADE ON DELETE RESTRICT'
+        ],
+        'largescreenpixelpos': [
+            'FOREIGN KEY (`magId`) REFERENCES `map`(`magId`) '
+            'ON UPDATE CASCADE ON DELETE RESTRICT'
+        ],
+    }
+    
     def __init__(self, engine):
         self.engine = engine
+        self.deferred_keys = False
+        self.suffix = ''
+        self.map_suffix = ''
     
     def drop_tables_if_exist(self, table_names: List[str]) -> None:
         """Drop tables if they exist, in reverse order for FK constraints."""
@@ -24,109 +50,103 @@ class DatabaseSchemaService:
             
             conn.execute(text("SET foreign_key_checks = 1;"))
     
-    def create_tables(self) -> None:
-        """Create all required tables."""
+    def create_tables(
+        self, deferred_keys: bool = False, suffix: str = '', table_names: List[str] = None
+    ) -> None:
+        """
+        Create all required tables, or only table_names.
+        With deferred_keys the tables get only their primary keys; call
+        add_deferred_keys() once the data is loaded. With a suffix the tables
+        are created as e.g. map_staging, their foreign keys pointing at the
+        suffixed map table when it is created too, else at the live map.
+        """
+        table_names = table_names or list(self.TABLE_KEYS)
+        self.deferred_keys = deferred_keys
+        self.suffix = suffix
+        self.map_suffix = self.references_suffix(table_names, suffix)
         with self.engine.begin() as conn:
-            self._create_map_table(conn)
-            self._create_centerpos2x_table(conn)
-            self._create_bamboopattern_table(conn)
-            self._create_largescreenpixelpos_table(conn)
-            print("All tables created successfully")
+            for table in self.TABLE_KEYS:
+                if table in table_names:
+                    self._create_table(conn, table)
+            print(f"Created tables: {', '.join(table_names)}"
+                  + (f" as *{suffix}" if suffix else "")
+                  + (" (keys deferred)" if deferred_keys else ""))
     
-    def _create_map_table(self, conn) -> None:
-        """Create the main map table."""
-        sql = """
-        CREATE TABLE `map` (
-            `magId` INT NOT NULL,
-            `segment` INT,
-            `lineDirectionTypeId` INT,
-            `stake` VARCHAR(9),
-            `type` DOUBLE,
-            `epc` VARCHAR(24),
-            `tid` DOUBLE,
-            `polar` TINYINT,
-            `hidenEnable` TINYINT,
-            `transverse` DOUBLE,
-            `longitudinal` DOUBLE,
-            `curvature` DOUBLE,
-            `coordinateX` DOUBLE,
-            `coordinateY` DOUBLE,
-            `coordinateE` INT,
-            `coordinateN` INT,
-            `cruisingSpeed` INT,
-            `limitSpeed` INT,
-            `scene` TINYINT,
-            `stationType` DOUBLE,
-            `stationNum` INT,
-            `signallamp` TINYINT,
-            `oneWayRoad` TINYINT,
-            `meetingVec` TINYINT,
-            `oppositeSegment` INT,
-            PRIMARY KEY (`magId`),
-            KEY `idx_stake` (`stake`)
-        ) ENGINE = InnoDB;
-        """
-        conn.execute(text(sql))
+    @staticmethod
+    def references_suffix(table_names: List[str], suffix: str) -> str:
+        """Suffix of the map that suffixed table_names reference: theirs if map is among them."""
+        return suffix if 'map' in table_names else ''
     
-    def _create_centerpos2x_table(self, conn) -> None:
-        """Create centerpos2x table."""
-        sql = """
-        CREATE TABLE `centerpos2x` (
-            `magId` INT NOT NULL,
-            `stake` VARCHAR(9),
-            `lineId` INT,
-            `lineDirectionTypeId` INT,
-            `xCoordinate` INT,
-            `yCoordinate` INT,
-            `pixelValue` INT,
-            `platformName` INT,
-            `platformNumber` INT,
-            PRIMARY KEY (`magId`),
-            CONSTRAINT `fk_center_mag`
-                FOREIGN KEY (`magId`) REFERENCES `map`(`magId`)
-                ON UPDATE CASCADE ON DELETE RESTRICT
-        ) ENGINE = InnoDB;
-        """
-        conn.execute(text(sql))
+    @classmethod
+    def table_keys(cls, table_name: str, suffix: str = '') -> List[str]:
+        """Key clauses of a table created with suffix; its FKs point at the suffixed map."""
+        return [
+            key.replace('REFERENCES `map`', f'REFERENCES `map{suffix}`')
+            for key in cls.TABLE_KEYS[table_name]
+        ]
     
-    def _create_bamboopattern_table(self, conn) -> None:
-        """Create bamboopattern table."""
-        sql = """
-        CREATE TABLE `bamboopattern` (
-            `magId` INT NOT NULL,
-            `stake` VARCHAR(9),
-            `siteNumber` INT,
-            `vehicleleft` INT,
-            `top` INT,
-            `lineDirectionTypeId` INT,
-            `lineId` INT,
-            `platformName` INT,
-            PRIMARY KEY (`magId`),
-            CONSTRAINT `fk_bamboo_mag`
-                FOREIGN KEY (`magId`) REFERENCES `map`(`magId`)
-                ON UPDATE CASCADE ON DELETE RESTRICT
-        ) ENGINE = InnoDB;
+    def _keys_sql(self, table_name: str) -> str:
+        """Inline key/constraint clauses for CREATE TABLE, empty when deferred."""
+        if self.deferred_keys:
+            return ''
+        return ''.join(
+            f',\n            {key}' for key in self.table_keys(table_name, self.map_suffix))
+    
+    def add_deferred_keys(self, table_names: List[str] = None, suffix: str = '') -> None:
+        """Add secondary keys and foreign keys, one ALTER TABLE per table."""
+        table_names = table_names or list(self.TABLE_KEYS)
+        map_suffix = self.references_suffix(table_names, suffix)
+        with self.engine.begin() as conn:
+            # Integrity is verified set-based afterwards instead of row by row
+            conn.execute(text("SET foreign_key_checks = 0;"))
+            for table in table_names:
+                clauses = ', '.join(f'ADD {key}' for key in self.table_keys(table, map_suffix))
+                conn.execute(text(f"ALTER TABLE `{table}{suffix}` {clauses};"))
+                print(f"Added keys to table: {table}{suffix}")
+            conn.execute(text("SET foreign_key_checks = 1;"))
+    
+    def existing_tables(self, suffix: str = '') -> List[str]:
+        """Tables of the schema that exist with the given suffix."""
+        inspector = inspect(self.engine)
+        return [t for t in self.TABLE_KEYS if inspector.has_table(f"{t}{suffix}")]
+    
+    def verify_referential_integrity(
+        self, sample_size: int = 10, suffix: str = '', table_names: List[str] = None
+    ) -> None:
         """
-        conn.execute(text(sql))
+        Check every child magId exists in map with one anti-join per table.
+        Only table_names are checked when given; their map is the suffixed
+        one if map is among them, else the live one.
+        """
+        table_names = table_names or list(self.TABLE_KEYS)
+        map_suffix = self.references_suffix(table_names, suffix)
+        problems = []
+        with self.engine.connect() as conn:
+            for table in table_names:
+                if table == 'map':
+                    continue
+                missing = (
+                    f"FROM `{table}{suffix}` c LEFT JOIN `map{map_suffix}` m "
+                    f"ON m.`magId` = c.`magId` WHERE m.`magId` IS NULL"
+                )
+                count = conn.execute(text(f"SELECT COUNT(*) {missing}")).scalar()
+                if count:
+                    sample = conn.execute(text(
+                        f"SELECT c.`magId` {missing} LIMIT {int(sample_size)}"
+                    )).scalars().all()
+                    problems.append(
+                        f"{table}{suffix}: {count} rows without map entry (e.g. magId {sample})"
+                    )
+        if problems:
+            raise RuntimeError("Referential integrity check failed: " + "; ".join(problems))
+        print("Referential integrity verified")
     
-    def _create_largescreenpixelpos_table(self, conn) -> None:
-        """Create largescreenpixelpos table."""
-        sql = """
-        CREATE TABLE `largescreenpixelpos` (
-            `magId` INT NOT NULL,
-            `lineId` INT,
-            `lineDirectionTypeId` INT,
-            `xCoordinate` INT,
-            `yCoordinate` INT,
-            `pixelValue` INT,
-            `platformName` INT,
-            `platformNumber` INT,
-            `stopTime` DOUBLE,
-            `residenceTime` VARCHAR(32),
-            PRIMARY KEY (`magId`),
-            CONSTRAINT `fk_large_mag`
-                FOREIGN KEY (`magId`) REFERENCES `map`(`magId`)
-                ON UPDATE CASCADE ON DELETE RESTRICT
+    def _create_table(self, conn, table_name: str) -> None:
+        """Create one table of TABLE_COLUMNS, named with the current suffix."""
+        columns = ''.join(f'\n            {column},' for column in TABLE_COLUMNS[table_name])
+        sql = f"""
+        CREATE TABLE `{table_name}{self.suffix}` ({columns}
+            PRIMARY KEY (`magId`){self._keys_sql(table_name)}
         ) ENGINE = InnoDB;
         """
         conn.execute(text(sql))
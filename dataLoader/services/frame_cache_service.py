@@ -0,0 +1,116 @@
+"""
+Frame cache service.
+Stores parsed and cleaned DataFrames as uncompressed NumPy .npz files,
+keyed by the source file's content hash and the cleaning rules.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+
+class FrameCacheService:
+    """Content-addressed on-disk cache of DataFrames, one column per array."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def file_hash(file_path: str) -> str:
+        """SHA-256 of the file contents."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, table_name: str, key: str) -> str:
+        """Cache file for a table and key."""
+        return os.path.join(self.cache_dir, f'{table_name}_{key[:32]}.npz')
+
+    @staticmethod
+    def make_key(file_hash: str, rules_fingerprint: str) -> str:
+        """Combine the content hash and the cleaning rules into one cache key."""
+        return hashlib.sha256(f'{file_hash}:{rules_fingerprint}'.encode()).hexdigest()
+
+    def load(self, table_name: str, key: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame for key, or None on a miss."""
+        path = self._path(table_name, key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data['__meta__']))
+                columns = {
+                    col['name']: self._restore(data, i, col)
+                    for i, col in enumerate(meta['columns'])
+                }
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        return pd.DataFrame(columns)
+
+    def store(self, table_name: str, key: str, df: pd.DataFrame) -> bool:
+        """Write df under key, replacing older entries of the table."""
+        arrays, columns = {}, []
+        for i, name in enumerate(df.columns):
+            encoded = self._encode(df[name], i, arrays)
+            if encoded is None:
+                print(f"Not caching {table_name}: column {name!r} has mixed types")
+                return False
+            columns.append(dict(encoded, name=name))
+        arrays['__meta__'] = np.array(json.dumps({'columns': columns}))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(table_name, key)
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        for stale in glob.glob(os.path.join(self.cache_dir, f'{table_name}_*.npz')):
+            if stale != path:
+                os.remove(stale)
+        return True
+
+    @staticmethod
+    def _encode(series: pd.Series, i: int, arrays: dict) -> Optional[dict]:
+        """Store a column as plain NumPy arrays; returns its dtype metadata."""
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = FrameCacheService._encode(
+                pd.Series(dtype.categories), f'{i}_cat', arrays)
+            if categories is None:
+                return None
+            arrays[f'c{i}'] = series.cat.codes.to_numpy()
+            return {'kind': 'category', 'dtype': str(dtype.categories.dtype),
+                    'ordered': bool(dtype.ordered), 'categories': categories}
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+            arrays[f'c{i}'] = series.to_numpy()
+            return {'kind': 'numpy', 'dtype': str(dtype)}
+
+        mask = series.isna().to_numpy()
+        values = series.to_numpy(dtype=object)
+        if not all(isinstance(v, str) for v in values[~mask]):
+            return None
+        text = values.copy()
+        text[mask] = ''
+        arrays[f'c{i}'] = text.astype(str) if len(text) else np.array([], dtype='U1')
+        arrays[f'm{i}'] = mask
+        return {'kind': 'text', 'dtype': str(dtype)}
+
+    @staticmethod
+    def _restore(data, i, col: dict) -> pd.Series:
+        """Rebuild a column written by _encode."""
+        if col['kind'] == 'category':
+            categories = FrameCacheService._restore(data, f'{i}_cat', col['categories'])
+            dtype = pd.CategoricalDtype(categories, ordered=col['ordered'])
+            return pd.Series(pd.Categorical.from_codes(data[f'c{i}'], dtype=dtype))
+        if col['kind'] == 'numpy':
+            return pd.Series(data[f'c{i}'])
+
+        values = data[f'c{i}'].astype(object)
+        values[data[f'm{i}']] = np.nan
+        return pd.Series(values, dtype=col['dtype'])
@@ -0,0 +1,156 @@
+"""
+SQL archive format.
+Block-compressed .sqlz files: whole statements grouped into zlib blocks,
+followed by a JSON index of block offsets, statement offsets and record
+counts, so archives can be summarized without decompressing and applied
+by streaming one block at a time.
+"""
+
+import io
+import json
+import struct
+import zlib
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+MAGIC = b'SQLZ0001'
+FOOTER = struct.Struct('<QQ')
+ARCHIVE_EXTENSION = '.sqlz'
+
+
+class ArchiveWriter:
+    """
+    Writes an archive to a binary stream piece by piece.
+    A piece is one statement or comment block and never spans two blocks;
+    a block is compressed and written once it holds at least block_size
+    bytes of text, so only one block of text is held in memory.
+    """
+
+    def __init__(self, out, block_size: int = 1 << 18, level: int = 6):
+        """
+        Args:
+            out: Binary stream with a write() method
+            block_size: Bytes of text after which a block is closed
+            level: zlib compression level
+        """
+        self.out = out
+        self.block_size = block_size
+        self.level = level
+        self.blocks: List[Dict] = []
+        self.offset = len(MAGIC)
+        self.raw_offset = 0
+        self.current: List[bytes] = []
+        self.statement_offsets: List[int] = []
+        self.records = 0
+        self.size = 0
+        out.write(MAGIC)
+
+    def add(self, text: str, records: int) -> None:
+        """Append one piece holding records rows (0 for comments)."""
+        data = text.encode('utf-8')
+        if records:
+            self.statement_offsets.append(self.size)
+            self.records += records
+        self.current.append(data)
+        self.size += len(data)
+        if self.size >= self.block_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        raw = b''.join(self.current)
+        data = zlib.compress(raw, self.level)
+        self.blocks.append({
+            'offset': self.offset,
+            'length': len(data),
+            'raw_offset': self.raw_offset,
+            'raw_length': len(raw),
+            'statements': self.statement_offsets,
+            'records': self.records
+        })
+        self.out.write(data)
+        self.offset += len(data)
+        self.raw_offset += len(raw)
+        self.current, self.statement_offsets, self.records, self.size = [], [], 0, 0
+
+    def close(self) -> None:
+        """Write the last block, the index and the footer."""
+        if self.current or not self.blocks:
+            self._flush()
+        index = json.dumps({
+            'blocks': self.blocks,
+            'records': sum(b['records'] for b in self.blocks),
+            'statements': sum(len(b['statements']) for b in self.blocks),
+            'raw_length': self.raw_offset
+        }).encode('utf-8')
+        self.out.write(index)
+        self.out.write(FOOTER.pack(self.offset, len(index)))
+        self.out.write(MAGIC)
+
+
+def build_archive(
+    pieces: Iterable[Tuple[str, int]], block_size: int = 1 << 18, level: int = 6
+) -> bytes:
+    """Pack (text, records) pieces into an archive held in memory."""
+    out = io.BytesIO()
+    writer = ArchiveWriter(out, block_size, level)
+    for text, records in pieces:
+        writer.add(text, records)
+    writer.close()
+    return out.getvalue()
+
+
+class SqlArchive:
+    """Read access to a .sqlz archive; the index is loaded on open."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            head = f.read(len(MAGIC))
+            f.seek(-(FOOTER.size + len(MAGIC)), 2)
+            footer = f.read(FOOTER.size + len(MAGIC))
+            if head != MAGIC or footer[FOOTER.size:] != MAGIC:
+                raise ValueError(f"{path} is not a SQL archive")
+            index_offset, index_length = FOOTER.unpack(footer[:FOOTER.size])
+            f.seek(index_offset)
+            self.index = json.loads(f.read(index_length))
+
+    @property
+    def records(self) -> int:
+        """Rows inserted by the archive's statements."""
+        return self.index['records']
+
+    @property
+    def statements(self) -> int:
+        """INSERT statements in the archive."""
+        return self.index['statements']
+
+    @property
+    def blocks(self) -> List[Dict]:
+        """Block index entries."""
+        return self.index['blocks']
+
+    def read_block(self, i: int) -> str:
+        """Decompress block i."""
+        block = self.blocks[i]
+        with open(self.path, 'rb') as f:
+            f.seek(block['offset'])
+            return zlib.decompress(f.read(block['length'])).decode('utf-8')
+
+    def iter_blocks(self) -> Iterator[Tuple[str, int]]:
+        """Yield (text, compressed bytes) per block, in order, from one file handle."""
+        with open(self.path, 'rb') as f:
+            for block in self.blocks:
+                f.seek(block['offset'])
+                data = f.read(block['length'])
+                yield zlib.decompress(data).decode('utf-8'), len(data)
+
+
+def iter_lines(path: str) -> Iterator[str]:
+    """Lines of a plain .sql file or of the text inside a .sqlz archive."""
+    if path.endswith(ARCHIVE_EXTENSION):
+        # Blocks end on statement boundaries, so no line spans two blocks
+        for text, _ in SqlArchive(path).iter_blocks():
+            yield from text.splitlines(keepends=True)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from f
@@ -0,0 +1,121 @@
+"""
+SQL delta service.
+Compares two exported SQL versions row by row (keyed by magId) and writes
+a patch of INSERT, UPDATE and DELETE statements that moves a database
+from one version to the other.
+"""
+
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from .sql_dump_reader import TableDump, read_dumps, split_values
+from .sql_patch_statements import PatchStatements, TableDelta
+from .sql_statement_reader import execute_file
+
+
+class SqlDeltaService(PatchStatements):
+    """Service for diffing SQL versions and applying the resulting patches."""
+
+    def __init__(self, export_service, rows_per_insert: int = 100):
+        """
+        Args:
+            export_service: SqlExportService owning the version directories
+            rows_per_insert: Rows per INSERT statement in the patch
+        """
+        self.export_service = export_service
+        self.rows_per_insert = rows_per_insert
+        self.deltas_dir = os.path.join(export_service.base_sql_dir, 'deltas')
+
+    @staticmethod
+    def row_hash(row: str) -> bytes:
+        """Content hash of one VALUES tuple."""
+        return hashlib.blake2b(row.encode('utf-8'), digest_size=16).digest()
+
+    def diff_tables(self, old: TableDump, new: TableDump) -> TableDelta:
+        """Compare two dumps of one table by magId and per-row hashes."""
+        if old.columns != new.columns:
+            raise ValueError(f"{new.table}: columns changed between versions; "
+                             f"apply the full version instead")
+        old_hashes = {mag_id: self.row_hash(row) for mag_id, row in old.rows.items()}
+        inserts, updates = [], []
+        for mag_id, row in new.rows.items():
+            old_hash = old_hashes.get(mag_id)
+            if old_hash is None:
+                inserts.append(row)
+            elif old_hash != self.row_hash(row):
+                old_values = split_values(old.rows[mag_id])
+                changed = {
+                    column: value
+                    for column, old_value, value in zip(new.columns, old_values,
+                                                        split_values(row))
+                    if value != old_value
+                }
+                updates.append((mag_id, changed))
+        deletes = sorted(set(old.rows) - set(new.rows))
+        return TableDelta(new.columns, inserts, updates, deletes)
+
+    def diff_versions(self, old_version: str, new_version: str) -> Dict[str, TableDelta]:
+        """Per-table deltas from old_version to new_version."""
+        for version in (old_version, new_version):
+            if not self.export_service.is_complete(version):
+                raise ValueError(f"Version {version} is missing or incomplete")
+        old_manifest = self.export_service.read_manifest(old_version) or {}
+        new_manifest = self.export_service.read_manifest(new_version) or {}
+        base = self.export_service.base_sql_dir
+
+        old_files = self.export_service.table_files(old_version)
+        deltas = {}
+        for table, new_files in self.export_service.table_files(new_version).items():
+            old_entry = old_manifest.get('tables', {}).get(table)
+            new_entry = new_manifest.get('tables', {}).get(table)
+            if old_entry and new_entry and old_entry['object'] == new_entry['object']:
+                # Same stored object: nothing to compare
+                continue
+            if table not in old_files:
+                raise ValueError(f"{table} is not part of {old_version}")
+            deltas[table] = self.diff_tables(
+                read_dumps([os.path.join(base, old_version, f) for f in old_files[table]]),
+                read_dumps([os.path.join(base, new_version, f) for f in new_files])
+            )
+        return deltas
+
+    def write_patch(self, old_version: str, new_version: str, path: Optional[str] = None) -> str:
+        """
+        Diff two versions and write the patch file; returns its path.
+        Every statement sits on its own line. Deletes run children first and
+        inserts/updates map first, so foreign keys hold throughout.
+        """
+        start = time.perf_counter()
+        deltas = self.diff_versions(old_version, new_version)
+        path = path or os.path.join(self.deltas_dir, f"{old_version}__{new_version}.sql")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tables = self._ordered_tables(deltas)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(f"-- Delta: {old_version} -> {new_version}\n")
+            f.write(f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            for table in tables:
+                delta = deltas[table]
+                f.write(f"-- {table}: {len(delta.inserts)} inserted, "
+                        f"{len(delta.updates)} updated, {len(delta.deletes)} deleted\n")
+            for statement in self.statements(deltas):
+                f.write(statement + '\n')
+        os.replace(path + '.tmp', path)
+
+        for table in tables:
+            delta = deltas[table]
+            print(f"  {table}: {len(delta.inserts)} inserted, {len(delta.updates)} updated, "
+                  f"{len(delta.deletes)} deleted")
+        print(f"Delta {old_version} -> {new_version} written to {path} "
+              f"in {time.perf_counter() - start:.2f}s")
+        return path
+
+    @staticmethod
+    def apply_patch(engine, path: str) -> int:
+        """Run a patch in one transaction; returns the number of statements."""
+        with engine.begin() as conn:
+            count = execute_file(conn, path)
+        print(f"Applied {count} statements from {path}")
+        return count
@@ -0,0 +1,68 @@
+"""
+SQL dump reader.
+Parses the dumps written by SqlExportService (.sql or .sqlz, one table or
+its shards) back into their VALUES tuples keyed by magId.
+"""
+
+import re
+from typing import Dict, List, NamedTuple
+from .sql_archive import iter_lines
+
+
+INSERT_HEADER = re.compile(r"INSERT INTO `([^`]+)` \((.*)\) VALUES")
+VALUE = re.compile(r"'(?:[^']|'')*'|[^,\s]+")
+KEY_COLUMN = 'magId'
+
+
+class TableDump(NamedTuple):
+    """Rows of one table dump, as VALUES tuples keyed by magId."""
+    table: str
+    columns: List[str]
+    rows: Dict[int, str]
+
+
+def read_dump(path: str) -> TableDump:
+    """Parse a dump (.sql or .sqlz) written by SqlExportService into rows keyed by magId."""
+    table, columns, rows = None, [], {}
+    key_index = None
+    pending = ''
+    for line in iter_lines(path):
+        if not pending:
+            match = INSERT_HEADER.match(line)
+            if match:
+                table = match.group(1)
+                columns = re.findall(r'`([^`]+)`', match.group(2))
+                key_index = columns.index(KEY_COLUMN)
+                continue
+            if not line.startswith('('):
+                continue
+        pending += line
+        # A quoted value may contain a newline; wait for the row to close
+        stripped = pending.rstrip()
+        if pending.count("'") % 2 or not stripped.endswith(('),', ');')):
+            continue
+        row = stripped[:-1]
+        rows[parse_key(split_values(row)[key_index])] = row
+        pending = ''
+    return TableDump(table, columns, rows)
+
+
+def read_dumps(paths: List[str]) -> TableDump:
+    """Parse the shards of one table into a single dump."""
+    dumps = [read_dump(path) for path in paths]
+    rows = {}
+    for dump in dumps:
+        if dump.columns != dumps[0].columns:
+            raise ValueError(f"{dump.table}: shards disagree on columns")
+        rows.update(dump.rows)
+    return TableDump(dumps[0].table, dumps[0].columns, rows)
+
+
+def split_values(row: str) -> List[str]:
+    """Literals of a '(v1, v2, ...)' tuple."""
+    return VALUE.findall(row[1:-1])
+
+
+def parse_key(literal: str) -> int:
+    """magId from its literal; all-numeric rows render it as '5' or 5.0."""
+    return int(float(literal.strip("'")))
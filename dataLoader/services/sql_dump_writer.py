@@ -0,0 +1,88 @@
+"""
+SQL dump writer.
+Renders table frames as INSERT dumps and stores them in the object store;
+module-level so the export's worker processes can run it.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .sql_object_store import store_dump
+from .sql_row_renderer import SqlRowRenderer
+
+
+def iter_table_pieces(
+    frames: Iterable[pd.DataFrame], table_name: str, records: int, rows_per_insert: int
+) -> Iterator[Tuple[str, int]]:
+    """
+    Render one table's dump as (text, records) pieces, one per statement.
+    frames are consecutive chunks of the table and records its row count;
+    rows left over at the end of a chunk open the next statement, so the
+    statements do not depend on how the table was chunked.
+    The dump carries no timestamp, so unchanged data renders to the same
+    bytes and is stored once; the export time lives in version_info.sql.
+    """
+    # Header and table cleanup (optional, commented out since tables are immutable)
+    yield (
+        f"-- SQL INSERT statements for table: {table_name}\n"
+        f"-- Records: {records}\n\n"
+        f"-- DELETE FROM {table_name}; -- Uncomment if you want to clear existing data\n\n",
+        0
+    )
+    
+    insert_line = None
+    rows: List[str] = []
+    for df in frames:
+        if len(df) == 0:
+            continue
+        if insert_line is None:
+            columns_str = ', '.join([f"`{col}`" for col in df.columns])
+            insert_line = f"INSERT INTO `{table_name}` ({columns_str}) VALUES\n"
+        
+        # Render all literals column-wise, then emit rows_per_insert per statement
+        rows.extend(SqlRowRenderer.render(df))
+        full = len(rows) - len(rows) % rows_per_insert
+        for i in range(0, full, rows_per_insert):
+            chunk = rows[i:i + rows_per_insert]
+            yield insert_line + ',\n'.join(chunk) + ';\n\n', len(chunk)
+        rows = rows[full:]
+    if rows:
+        yield insert_line + ',\n'.join(rows) + ';\n\n', len(rows)
+    elif insert_line is None:
+        yield f"-- No data to insert for table {table_name}\n\n", 0
+
+
+def write_table_sql(
+    df: pd.DataFrame,
+    table_name: str,
+    version_dir: str,
+    objects_dir: str,
+    rows_per_insert: int,
+    buffer_size: int,
+    file_stem: Optional[str] = None,
+    compress: bool = True
+) -> Dict:
+    """Store one table's dataframe (or one shard of it) as a dump; see store_dump."""
+    pieces = iter_table_pieces([df], table_name, len(df), rows_per_insert)
+    return store_dump(pieces, table_name, version_dir, objects_dir, buffer_size,
+                      file_stem, compress)
+
+
+def shard_frame(
+    df: pd.DataFrame, table_name: str, shards: int
+) -> List[Tuple[pd.DataFrame, Optional[str]]]:
+    """
+    Split df into shards contiguous magId ranges of similar size.
+    Rows keep their order within a shard; an unsharded table keeps its plain name.
+    """
+    if shards == 1 or len(df) == 0:
+        return [(df, None)]
+    mag_ids = df['magId'].to_numpy()
+    sorted_ids = np.sort(mag_ids)
+    parts = []
+    for k, ids in enumerate(np.array_split(sorted_ids, shards)):
+        if len(ids) == 0:
+            continue
+        in_range = (mag_ids >= ids[0]) & (mag_ids <= ids[-1])
+        parts.append((df[in_range], f"{table_name}.{k + 1:03d}"))
+    return parts
@@ -4,153 +4,176 @@ Handles generation of SQL files from dataframes with versioning support.
 """
 
 import os
+import time
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict
-import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from .sql_dump_writer import iter_table_pieces, shard_frame, write_table_sql
+from .sql_object_store import OBJECTS_DIR, atomic_write, store_dump, write_manifest
+from .version_catalog import METADATA_FILE, VersionCatalog
+from .version_queries import VersionQueries
 
 
-class SqlExportService:
+class SqlExportService(VersionQueries):
     """Service for exporting dataframes as SQL INSERT statements with versioning."""
     
-    def __init__(self, base_sql_dir: str):
+    def __init__(
+        self,
+        base_sql_dir: str,
+        rows_per_insert: int = 100,
+        buffer_size: int = 1 << 20,
+        max_workers: Optional[int] = None,
+        shards: int = 1,
+        compress: bool = True
+    ):
+        """
+        Args:
+            base_sql_dir: Directory holding the V{n}_* version directories
+                and the objects/ store their dumps are linked from
+            rows_per_insert: Rows per INSERT statement in the dumps
+            buffer_size: Write buffer of each dump file, in bytes
+            max_workers: Worker processes for the dumps; None uses one per
+                dump up to the CPU count, 1 writes them in this process
+            shards: Split each table into this many dumps by magId range
+            compress: Write block-compressed .sqlz archives instead of .sql
+        """
+        if rows_per_insert < 1:
+            raise ValueError("rows_per_insert must be at least 1")
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
         self.base_sql_dir = base_sql_dir
+        self.objects_dir = os.path.join(base_sql_dir, OBJECTS_DIR)
+        self.rows_per_insert = rows_per_insert
+        self.buffer_size = buffer_size
+        self.max_workers = max_workers
+        self.shards = shards
+        self.compress = compress
+        self.catalog = VersionCatalog(base_sql_dir)
     
     def export_all_data_as_sql(self, dataframes: Dict[str, pd.DataFrame]) -> str:
         """
         Export all dataframes as SQL files with versioning.
+        Each dump (a table, or a magId-range shard of one) is written by its
+        own worker process into the object store and linked into the version;
+        manifest.json maps tables and shards to objects.
+        version_info.sql is written last, so a version without it never
+        finished exporting.
         Returns the version directory path.
         """
-        # Create version directory
-        version_dir = self._create_version_directory()
+        start = time.perf_counter()
+        version_dir, version, timestamp = self._create_version_directory()
+        jobs = [
+            (part, table_name, file_stem)
+            for table_name, df in dataframes.items()
+            for part, file_stem in shard_frame(df, table_name, self.shards)
+        ]
+        workers = min(self.max_workers or os.cpu_count() or 1, len(jobs))
         
-        # Export each table as SQL
-        for table_name, df in dataframes.items():
-            self._export_table_as_sql(df, table_name, version_dir)
+        if workers <= 1:
+            entries = [
+                self._export_table_as_sql(part, table_name, version_dir, file_stem)
+                for part, table_name, file_stem in jobs
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(write_table_sql, part, table_name, version_dir,
+                                self.objects_dir, self.rows_per_insert, self.buffer_size,
+                                file_stem, self.compress)
+                    for part, table_name, file_stem in jobs
+                ]
+                entries = [future.result() for future in futures]
+                for entry in entries:
+                    self._report(entry)
+        for entry, (part, _, _) in zip(entries, jobs):
+            if self.shards > 1 and len(part):
+                entry['min_magId'] = int(part['magId'].min())
+                entry['max_magId'] = int(part['magId'].max())
         
-        print(f"SQL files exported to: {version_dir}")
+        self._finish_version(version_dir, version, timestamp, entries)
+        print(f"SQL files exported to: {version_dir} in {time.perf_counter() - start:.2f}s")
         return version_dir
     
-    def _create_version_directory(self) -> str:
-        """Create a new version directory based on timestamp."""
-        # Get current timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Find existing version directories
-        existing_versions = []
-        if os.path.exists(self.base_sql_dir):
-            for item in os.listdir(self.base_sql_dir):
-                if os.path.isdir(os.path.join(self.base_sql_dir, item)):
-                    # Extract version number if it follows V{number} pattern
-                    match = re.match(r'V(\d+)', item)
-                    if match:
-                        existing_versions.append(int(match.group(1)))
+    def export_table_streams(
+        self, streams: Dict[str, Tuple[int, Iterable[pd.DataFrame]]]
+    ) -> str:
+        """
+        Export tables given as (row count, dataframe chunks) into a new version.
+        Tables are written one after another in this process, each chunk
+        rendered and written before the next is pulled, so memory stays at
+        one chunk whatever the table size. The version is a normal one
+        (manifest, catalog entry, version_info.sql last); tables are not sharded.
+        Returns the version directory path.
+        """
+        start = time.perf_counter()
+        version_dir, version, timestamp = self._create_version_directory()
+        entries = []
+        for table_name, (records, frames) in streams.items():
+            pieces = iter_table_pieces(frames, table_name, records, self.rows_per_insert)
+            entry = store_dump(pieces, table_name, version_dir, self.objects_dir,
+                               self.buffer_size, compress=self.compress)
+            if entry['records'] != records:
+                raise ValueError(f"{table_name}: expected {records} rows, "
+                                 f"the stream had {entry['records']}")
+            self._report(entry)
+            entries.append(entry)
         
-        # Determine next version number
-        next_version = max(existing_versions, default=0) + 1
+        self._finish_version(version_dir, version, timestamp, entries)
+        print(f"SQL files exported to: {version_dir} in {time.perf_counter() - start:.2f}s")
+        return version_dir
+    
+    def _finish_version(
+        self, version_dir: str, version: int, timestamp: str, entries: List[Dict]
+    ) -> None:
+        """Write the manifest, then version_info.sql, then the catalog entry."""
+        manifest = write_manifest(version_dir, entries)
+        # Only a complete export gets its metadata file
+        generated = self._create_metadata_file(version_dir, version, timestamp)
+        self.catalog.add(os.path.basename(version_dir), {
+            'version': version,
+            'generated': generated,
+            'timestamp': timestamp,
+            'tables': manifest['tables']
+        })
+    
+    def _create_version_directory(self) -> Tuple[str, int, str]:
+        """Create a new version directory; returns its path, number and timestamp."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # The catalog hands out the number, so concurrent exports never share one
+        next_version = self.catalog.reserve()
         
         # Create version directory
         version_dir = os.path.join(self.base_sql_dir, f"V{next_version}_{timestamp}")
         os.makedirs(version_dir, exist_ok=True)
         
-        # Create metadata file
-        self._create_metadata_file(version_dir, next_version, timestamp)
-        
-        return version_dir
+        return version_dir, next_version, timestamp
     
-    def _create_metadata_file(self, version_dir: str, version: int, timestamp: str) -> None:
-        """Create a metadata file with version information."""
+    def _create_metadata_file(self, version_dir: str, version: int, timestamp: str) -> str:
+        """Create a metadata file with version information; returns its generation time."""
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         metadata_content = f"""-- Version: V{version}
--- Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+-- Generated: {generated}
 -- Timestamp: {timestamp}
 -- Description: Automated SQL export from Excel data loading process
 """
-        metadata_path = os.path.join(version_dir, "version_info.sql")
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            f.write(metadata_content)
-    
-    def _export_table_as_sql(self, df: pd.DataFrame, table_name: str, version_dir: str) -> None:
-        """Export a single dataframe as SQL INSERT statements."""
-        sql_file_path = os.path.join(version_dir, f"{table_name}.sql")
-        
-        with open(sql_file_path, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write(f"-- SQL INSERT statements for table: {table_name}\n")
-            f.write(f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"-- Records: {len(df)}\n\n")
-            
-            # Write table cleanup (optional, commented out since tables are immutable)
-            f.write(f"-- DELETE FROM {table_name}; -- Uncomment if you want to clear existing data\n\n")
-            
-            if len(df) > 0:
-                # Generate INSERT statements
-                columns = list(df.columns)
-                columns_str = ', '.join([f"`{col}`" for col in columns])
-                
-                # Process data in chunks for better performance
-                chunk_size = 100
-                for i in range(0, len(df), chunk_size):
-                    chunk = df.iloc[i:i+chunk_size]
-                    
-                    f.write(f"INSERT INTO `{table_name}` ({columns_str}) VALUES\n")
-                    
-                    values_list = []
-                    for _, row in chunk.iterrows():
-                        value_parts = []
-                        for col in columns:
-                            value = row[col]
-                            if pd.isna(value):
-                                value_parts.append("NULL")
-                            elif isinstance(value, str):
-                                # Escape single quotes and wrap in quotes
-                                escaped_value = value.replace("'", "''")
-                                value_parts.append(f"'{escaped_value}'")
-                            elif isinstance(value, (int, float)):
-                                value_parts.append(str(value))
-                            else:
-                                # Convert to string and escape
-                                escaped_value = str(value).replace("'", "''")
-                                value_parts.append(f"'{escaped_value}'")
-                        
-                        values_list.append(f"({', '.join(value_parts)})")
-                    
-                    f.write(',\n'.join(values_list))
-                    f.write(';\n\n')
-            else:
-                f.write(f"-- No data to insert for table {table_name}\n\n")
-        
-        print(f"Generated SQL file: {sql_file_path} ({len(df)} records)")
+        atomic_write(os.path.join(version_dir, METADATA_FILE), metadata_content.encode('utf-8'))
+        return generated
     
-    def get_latest_version_dir(self) -> str:
-        """Get the path to the latest version directory."""
-        if not os.path.exists(self.base_sql_dir):
-            return None
-            
-        version_dirs = []
-        for item in os.listdir(self.base_sql_dir):
-            if os.path.isdir(os.path.join(self.base_sql_dir, item)):
-                match = re.match(r'V(\d+)', item)
-                if match:
-                    version_dirs.append((int(match.group(1)), item))
-        
-        if version_dirs:
-            version_dirs.sort(key=lambda x: x[0], reverse=True)
-            latest_dir = version_dirs[0][1]
-            return os.path.join(self.base_sql_dir, latest_dir)
-        
-        return None
+    def _export_table_as_sql(
+        self, df: pd.DataFrame, table_name: str, version_dir: str, file_stem: Optional[str] = None
+    ) -> Dict:
+        """Export a single dataframe as SQL INSERT statements; returns its manifest entry."""
+        entry = write_table_sql(df, table_name, version_dir, self.objects_dir,
+                                self.rows_per_insert, self.buffer_size, file_stem,
+                                self.compress)
+        self._report(entry)
+        return entry
     
-    def list_all_versions(self) -> list:
-        """List all existing version directories."""
-        if not os.path.exists(self.base_sql_dir):
-            return []
-            
-        versions = []
-        for item in os.listdir(self.base_sql_dir):
-            if os.path.isdir(os.path.join(self.base_sql_dir, item)):
-                match = re.match(r'V(\d+)', item)
-                if match:
-                    versions.append(item)
-        
-        versions.sort()
-        return versions
+    @staticmethod
+    def _report(entry: Dict) -> None:
+        """Print one generated file, whether its object was reused and the time taken."""
+        stored = ('unchanged, linked to existing object' if entry['reused']
+                  else f"new object, {entry['bytes']:,} bytes")
+        print(f"Generated SQL file: {entry['path']} ({entry['records']} records, "
+              f"{stored}, {entry['seconds']:.2f}s)")
@@ -0,0 +1,187 @@
+"""
+SQL object store.
+Content-addressed storage of version dumps under objects/, hard-linked into
+the version directories, and the manifest.json recording which object each
+table of a version references.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .sql_archive import ARCHIVE_EXTENSION, ArchiveWriter
+
+
+MANIFEST_FILE = 'manifest.json'
+OBJECTS_DIR = 'objects'
+
+
+class _HashingWriter:
+    """Binary stream wrapper that hashes and counts what goes through it."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, data: bytes) -> None:
+        self.f.write(data)
+        self.sha256.update(data)
+        self.bytes += len(data)
+
+
+def atomic_write(path: str, content: bytes, buffer_size: int = -1) -> None:
+    """Write content to path through a temporary file and a rename."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=buffer_size) as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextmanager
+def file_lock(path: str, timeout: float = 30.0, stale_after: float = 60.0) -> Iterator[None]:
+    """
+    Hold path as an exclusive lock file while the block runs.
+    Waits up to timeout seconds for another holder; a lock file older than
+    stale_after seconds is left over from a crashed process and is taken over.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > stale_after:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not lock {path} within {timeout}s")
+            time.sleep(0.05)
+    try:
+        os.close(fd)
+        yield
+    finally:
+        os.remove(path)
+
+
+def store_dump(
+    pieces: Iterable[Tuple[str, int]],
+    table_name: str,
+    version_dir: str,
+    objects_dir: str,
+    buffer_size: int,
+    file_stem: Optional[str] = None,
+    compress: bool = True
+) -> Dict:
+    """
+    Store one table's dump (or one shard of it, saved as file_stem) in the
+    object store and link it into version_dir.
+    With compress the dump is a block-compressed .sqlz archive, else plain .sql.
+    Pieces are written as they come, to a temporary file hashed on the way,
+    so a dump of any size needs one archive block of memory.
+    Objects are named by the SHA-256 of their content: a dump identical to
+    an earlier one is not kept again, only hard-linked. Every file is
+    written under a temporary name and renamed into place, so neither the
+    store nor the version directory ever holds a partial dump.
+    Returns the table's manifest entry.
+    """
+    start = time.perf_counter()
+    extension = ARCHIVE_EXTENSION if compress else '.sql'
+    os.makedirs(objects_dir, exist_ok=True)
+    tmp_object = os.path.join(objects_dir, f"{file_stem or table_name}.{os.getpid()}.tmp")
+    records = 0
+    try:
+        with open(tmp_object, 'wb', buffering=buffer_size) as f:
+            out = _HashingWriter(f)
+            archive = ArchiveWriter(out) if compress else None
+            for text, piece_records in pieces:
+                records += piece_records
+                if archive is not None:
+                    archive.add(text, piece_records)
+                else:
+                    out.write(text.encode('utf-8'))
+            if archive is not None:
+                archive.close()
+        digest = out.sha256.hexdigest()
+        object_path = os.path.join(objects_dir, digest[:2], f"{digest}{extension}")
+        reused = os.path.exists(object_path)
+        if not reused:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(tmp_object, object_path)
+    finally:
+        if os.path.exists(tmp_object):
+            os.remove(tmp_object)
+
+    file_name = f"{file_stem or table_name}{extension}"
+    sql_file_path = os.path.join(version_dir, file_name)
+    tmp_path = sql_file_path + '.tmp'
+    try:
+        try:
+            os.link(object_path, tmp_path)
+        except OSError:
+            # No hard links here (e.g. FAT or across devices): fall back to a copy
+            shutil.copyfile(object_path, tmp_path)
+        os.replace(tmp_path, sql_file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {
+        'table': table_name,
+        'file': file_name,
+        'path': sql_file_path,
+        'object': digest,
+        'bytes': out.bytes,
+        'records': records,
+        'reused': reused,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def write_manifest(version_dir: str, entries: List[Dict]) -> Dict:
+    """
+    Record which object each table of the version references.
+    A sharded table lists its shards in order; its table-level object is
+    the hash of the shard objects, so unchanged tables still compare equal.
+    """
+    tables: Dict[str, Dict] = {}
+    for entry in entries:
+        table = tables.setdefault(entry['table'], {'bytes': 0, 'records': 0, 'files': []})
+        table['bytes'] += entry['bytes']
+        table['records'] += entry['records']
+        table['files'].append(entry)
+    for table in tables.values():
+        files = table.pop('files')
+        if len(files) == 1 and files[0]['file'].count('.') == 1:
+            table['object'] = files[0]['object']
+            table['file'] = files[0]['file']
+            continue
+        digests = ':'.join(entry['object'] for entry in files)
+        table['object'] = hashlib.sha256(digests.encode()).hexdigest()
+        table['shards'] = [
+            {key: entry[key] for key in
+             ('file', 'object', 'bytes', 'records', 'min_magId', 'max_magId')}
+            for entry in files
+        ]
+    manifest = {'tables': tables}
+    atomic_write(os.path.join(version_dir, MANIFEST_FILE),
+                 json.dumps(manifest, indent=2).encode('utf-8'))
+    return manifest
+
+
+def read_manifest(version_dir: str) -> Optional[Dict]:
+    """The manifest of a version directory, or None for versions exported without one."""
+    path = os.path.join(version_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
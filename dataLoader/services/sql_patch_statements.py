@@ -0,0 +1,51 @@
+"""
+SQL patch statements.
+Renders per-table row changes as the DELETE, INSERT and UPDATE statements
+of a patch, ordered so foreign keys on map hold throughout.
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+
+class TableDelta(NamedTuple):
+    """Statements' worth of changes for one table."""
+    columns: List[str]
+    inserts: List[str]
+    updates: List[Tuple[int, Dict[str, str]]]
+    deletes: List[int]
+
+
+class PatchStatements:
+    """Statements applying TableDeltas. Expects a rows_per_insert attribute."""
+
+    TABLE_ORDER = ['map', 'centerpos2x', 'bamboopattern', 'largescreenpixelpos']
+    KEY_COLUMN = 'magId'
+
+    def _ordered_tables(self, deltas: Dict[str, TableDelta]) -> List[str]:
+        """Tables of deltas, map first."""
+        tables = [t for t in self.TABLE_ORDER if t in deltas]
+        return tables + [t for t in deltas if t not in tables]
+
+    def statements(self, deltas: Dict[str, TableDelta]) -> Iterator[str]:
+        """Statements applying deltas: deletes children first, then inserts/updates map first."""
+        tables = self._ordered_tables(deltas)
+        for table in reversed(tables):
+            yield from self._delete_statements(table, deltas[table])
+        for table in tables:
+            yield from self._upsert_statements(table, deltas[table])
+
+    def _delete_statements(self, table: str, delta: TableDelta) -> Iterator[str]:
+        """DELETE statements for removed magIds, in batches."""
+        for i in range(0, len(delta.deletes), self.rows_per_insert):
+            id_list = ', '.join(str(m) for m in delta.deletes[i:i + self.rows_per_insert])
+            yield f"DELETE FROM `{table}` WHERE `{self.KEY_COLUMN}` IN ({id_list});"
+
+    def _upsert_statements(self, table: str, delta: TableDelta) -> Iterator[str]:
+        """Multi-row INSERTs for new rows, then one UPDATE per changed row."""
+        columns_str = ', '.join(f"`{col}`" for col in delta.columns)
+        for i in range(0, len(delta.inserts), self.rows_per_insert):
+            values = ', '.join(delta.inserts[i:i + self.rows_per_insert])
+            yield f"INSERT INTO `{table}` ({columns_str}) VALUES {values};"
+        for mag_id, changed in delta.updates:
+            assignments = ', '.join(f"`{col}` = {value}" for col, value in changed.items())
+            yield f"UPDATE `{table}` SET {assignments} WHERE `{self.KEY_COLUMN}` = {mag_id};"
@@ -0,0 +1,155 @@
+"""
+SQL range hashing.
+Summarizes a table per magId range as (row count, XOR of row hashes): the
+live side by one aggregate query, the version side from its dump. Ranges
+are compared from the widest size down, and only ranges that differ are
+examined at the next size.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy import inspect
+from .sql_dump_reader import read_dumps, split_values
+from .sql_patch_statements import TableDelta
+from .sql_row_hash import Column, canonical, column_kind, row_hash, row_hash_sql
+
+
+Chunks = Dict[int, Tuple[int, int]]    # range index -> (rows, XOR of row hashes)
+
+
+class TableSync(NamedTuple):
+    """Outcome of comparing one live table with its version dump."""
+    table: str
+    delta: TableDelta
+    rows: int
+    compared: List[int]    # ranges compared at each size, widest first
+
+
+class RangeHashing:
+    """
+    Range comparison of live tables with version dumps. Expects engine,
+    leaf_size and fanout attributes.
+    """
+
+    KEY_COLUMN = 'magId'
+
+    def live_columns(self, table: str) -> Optional[List[Column]]:
+        """Columns of the live table and their kinds, or None if it does not exist."""
+        inspector = inspect(self.engine)
+        if not inspector.has_table(table):
+            return None
+        return [(c['name'], column_kind(c['type'])) for c in inspector.get_columns(table)]
+
+    @staticmethod
+    def version_hashes(rows: Dict[int, str], columns: List[Column]) -> Dict[int, int]:
+        """Row hash per magId of a dump's VALUES tuples."""
+        kinds = [kind for _, kind in columns]
+        return {
+            mag_id: row_hash(
+                canonical(literal, kind)
+                for literal, kind in zip(split_values(row), kinds)
+            )
+            for mag_id, row in rows.items()
+        }
+
+    @staticmethod
+    def chunk_hashes(hashes: Dict[int, int], size: int) -> Chunks:
+        """Fold row hashes into (rows, XOR) per range of size magIds."""
+        chunks: Dict[int, List[int]] = {}
+        for mag_id, value in hashes.items():
+            chunk = chunks.setdefault(mag_id // size, [0, 0])
+            chunk[0] += 1
+            chunk[1] ^= value
+        return {index: (rows, xor) for index, (rows, xor) in chunks.items()}
+
+    def range_sizes(self, mag_ids: Iterable[int]) -> List[int]:
+        """Range sizes, widest first; the widest splits the magIds into at most fanout ranges."""
+        mag_ids = list(mag_ids)
+        sizes = [self.leaf_size]
+        if mag_ids:
+            low, high = min(mag_ids), max(mag_ids)
+            while high // sizes[-1] - low // sizes[-1] + 1 > self.fanout:
+                sizes.append(sizes[-1] * self.fanout)
+        return sizes[::-1]
+
+    @classmethod
+    def _range_filter(cls, ranges: List[Tuple[int, int]]) -> str:
+        """WHERE clause for inclusive magId ranges, adjacent ones merged."""
+        merged: List[List[int]] = []
+        for low, high in sorted(ranges):
+            if merged and low <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], high)
+            else:
+                merged.append([low, high])
+        return ' WHERE ' + ' OR '.join(
+            f"`{cls.KEY_COLUMN}` BETWEEN {low} AND {high}" for low, high in merged)
+
+    def live_chunks(
+        self, conn, table: str, columns: List[Column], size: int,
+        ranges: Optional[List[Tuple[int, int]]] = None
+    ) -> Chunks:
+        """(rows, XOR) per range of size magIds of the live table, in one aggregate query."""
+        where = self._range_filter(ranges) if ranges else ''
+        # Grouped by each range's first magId: exact in any SQL, unlike a
+        # division (MySQL's '/' rounds to 4 decimals; SQLite has no DIV)
+        first = f"`{self.KEY_COLUMN}` - MOD(`{self.KEY_COLUMN}`, {size})"
+        sql = (f"SELECT {first}, COUNT(*), BIT_XOR({row_hash_sql(columns)}) "
+               f"FROM `{table}`{where} GROUP BY {first}")
+        return {int(start) // size: (int(rows), int(xor))
+                for start, rows, xor in conn.exec_driver_sql(sql)}
+
+    def live_hashes(
+        self, conn, table: str, columns: List[Column], ranges: List[Tuple[int, int]]
+    ) -> Dict[int, int]:
+        """Row hash per magId of the live rows within ranges."""
+        sql = (f"SELECT `{self.KEY_COLUMN}`, {row_hash_sql(columns)} "
+               f"FROM `{table}`{self._range_filter(ranges)}")
+        return {int(mag_id): int(value) for mag_id, value in conn.exec_driver_sql(sql)}
+
+    def compare_table(self, conn, table: str, paths: List[str]) -> Optional[TableSync]:
+        """
+        Compare a live table with its version dumps range by range.
+        At each size only the ranges inside a differing wider range are
+        compared; at the finest size the rows of differing ranges are
+        compared one by one. Returns None when the live table is missing or
+        its columns differ from the dump's.
+        """
+        dump = read_dumps(paths)
+        columns = self.live_columns(table)
+        if columns is None or [name for name, _ in columns] != dump.columns:
+            return None
+
+        hashes = self.version_hashes(dump.rows, columns)
+        ranges, differing, compared = None, None, []
+        for size in self.range_sizes(hashes):
+            expected = self.chunk_hashes(hashes, size)
+            live = self.live_chunks(conn, table, columns, size, ranges)
+            # Sizes are multiples of each other: a range's parent index is
+            # its first magId divided by the previous size
+            candidates = set(live) | {
+                index for index in expected
+                if differing is None or index * size // parent_size in differing
+            }
+            compared.append(len(candidates))
+            differing = {index for index in candidates if live.get(index) != expected.get(index)}
+            if not differing:
+                return TableSync(table, TableDelta(dump.columns, [], [], []),
+                                 len(dump.rows), compared)
+            ranges = [(index * size, (index + 1) * size - 1) for index in sorted(differing)]
+            parent_size = size
+
+        live_rows = self.live_hashes(conn, table, columns, ranges)
+        version_rows = {m: h for m, h in hashes.items() if m // self.leaf_size in differing}
+        key = dump.columns.index(self.KEY_COLUMN)
+        inserts, updates = [], []
+        for mag_id in sorted(version_rows):
+            if mag_id not in live_rows:
+                inserts.append(dump.rows[mag_id])
+            elif live_rows[mag_id] != version_rows[mag_id]:
+                values = split_values(dump.rows[mag_id])
+                updates.append((mag_id, {
+                    column: value for j, (column, value) in enumerate(zip(dump.columns, values))
+                    if j != key
+                }))
+        deletes = sorted(set(live_rows) - set(version_rows))
+        return TableSync(table, TableDelta(dump.columns, inserts, updates, deletes),
+                         len(dump.rows), compared)
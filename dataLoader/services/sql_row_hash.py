@@ -0,0 +1,76 @@
+"""
+SQL row hashes.
+The 60-bit hash of a row's canonical values, computed in Python from dump
+literals and in MySQL from the stored columns; both give the same number.
+"""
+
+import hashlib
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy.sql import sqltypes
+
+
+# Row hash input: canonical values joined by SEPARATOR, NULL as NULL_MARKER;
+# both go into the hash query as plain string literals
+SEPARATOR = '\x1f'
+NULL_MARKER = '\x1e'
+# Hex digits of the MD5 kept: 60 bits fit a signed 64-bit integer
+HASH_DIGITS = 15
+# DOUBLE columns are compared as ROUND(value * REAL_SCALE)
+REAL_SCALE = 1000000
+
+Column = Tuple[str, str]    # (name, kind), kind one of 'int', 'real', 'text'
+
+
+def column_kind(sql_type) -> str:
+    """How a column's values are canonicalized for hashing."""
+    if isinstance(sql_type, sqltypes.Integer):
+        return 'int'
+    # Float is not a Numeric subclass in every SQLAlchemy release
+    if isinstance(sql_type, (sqltypes.Numeric, sqltypes.Float)):
+        return 'real'
+    return 'text'
+
+
+def canonical(literal: str, kind: str) -> Optional[str]:
+    """
+    The text MySQL's row hash sees for a dump literal stored in a column of kind.
+    Literals MySQL would store differently fall through unchanged; their
+    range then hashes differently and is simply re-applied.
+    """
+    if literal == 'NULL':
+        return None
+    value = literal[1:-1].replace("''", "'") if literal.startswith("'") else literal
+    try:
+        if kind == 'int':
+            # MySQL rounds fractional values half away from zero into INT columns
+            return str(int(Decimal(value).to_integral_value(ROUND_HALF_UP)))
+        if kind == 'real':
+            return str(round(float(value) * REAL_SCALE))
+    except (InvalidOperation, ValueError, OverflowError):
+        pass
+    return value
+
+
+def row_hash(values: Iterable[Optional[str]]) -> int:
+    """60-bit hash of one row's canonical values; matches row_hash_sql."""
+    text = SEPARATOR.join(NULL_MARKER if v is None else v for v in values)
+    return int(hashlib.md5(text.encode('utf-8')).hexdigest()[:HASH_DIGITS], 16)
+
+
+def canonical_sql(column: str, kind: str) -> str:
+    """SQL expression giving the canonical text of a column (see canonical)."""
+    if kind == 'int':
+        return f"CAST(`{column}` AS SIGNED INTEGER)"
+    if kind == 'real':
+        return f"CAST(ROUND(`{column}` * {REAL_SCALE}) AS SIGNED INTEGER)"
+    return f"`{column}`"
+
+
+def row_hash_sql(columns: List[Column]) -> str:
+    """MySQL expression of row_hash: the first HASH_DIGITS hex digits of the MD5."""
+    values = ', '.join(
+        f"IFNULL({canonical_sql(column, kind)}, '{NULL_MARKER}')" for column, kind in columns
+    )
+    return (f"CAST(CONV(SUBSTRING(MD5(CONCAT_WS('{SEPARATOR}', {values})), 1, {HASH_DIGITS}), "
+            f"16, 10) AS UNSIGNED INTEGER)")
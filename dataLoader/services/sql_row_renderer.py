@@ -0,0 +1,116 @@
+"""
+SQL row renderer.
+Turns a DataFrame into SQL VALUES tuples column by column, producing the
+same literals as the original per-row iterrows() renderer.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import List
+
+
+class SqlRowRenderer:
+    """
+    Column-wise SQL literal rendering.
+
+    Literal rules (identical to the previous row-by-row export):
+      - NULL for missing values
+      - str quoted with '' escaping
+      - Python int/float (incl. bool and float64) unquoted via str()
+      - anything else quoted via str()
+    iterrows() upcasts all-numeric frames to one NumPy dtype, whose scalars
+    (except float64) are not Python int/float and were therefore quoted;
+    that is reproduced so existing dumps stay byte-identical.
+    """
+
+    @classmethod
+    def render(cls, df: pd.DataFrame) -> List[str]:
+        """Render every row as '(v1, v2, ...)'."""
+        if df.empty:
+            return []
+        common = cls._row_dtype(df)
+        columns = [cls._render_column(df.iloc[:, i], common) for i in range(df.shape[1])]
+        return [f"({', '.join(parts)})" for parts in zip(*columns)]
+
+    @staticmethod
+    def literal(value) -> str:
+        """Render one value exactly like the previous per-cell code."""
+        if pd.isna(value):
+            return "NULL"
+        if isinstance(value, str):
+            escaped_value = value.replace("'", "''")
+            return f"'{escaped_value}'"
+        if isinstance(value, (int, float)):
+            return str(value)
+        escaped_value = str(value).replace("'", "''")
+        return f"'{escaped_value}'"
+
+    @staticmethod
+    def _row_dtype(df: pd.DataFrame):
+        """NumPy dtype iterrows() would give each row, or None for object rows."""
+        # Categorical columns interleave as their categories' dtype
+        dtypes = [
+            d.categories.dtype if isinstance(d, pd.CategoricalDtype) else d
+            for d in df.dtypes
+        ]
+        if not all(isinstance(d, np.dtype) for d in dtypes):
+            return None
+        kinds = {d.kind for d in dtypes}
+        if kinds <= set('iuf'):
+            return np.result_type(*dtypes)
+        if len(set(dtypes)) == 1 and dtypes[0].kind in 'bc':
+            return dtypes[0]
+        # object rows; datetime rows box to Timestamp like object ones do
+        return None
+
+    @classmethod
+    def _render_column(cls, series: pd.Series, common) -> List[str]:
+        """Render one column given the row dtype of the frame."""
+        if common is not None:
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                categories = series.cat.categories.to_numpy().astype(common)
+                values = np.append(categories, np.zeros(1, dtype=common))[codes]
+                rendered = cls._render_numpy_scalars(values)
+                # iterrows() turns a missing int category into an arbitrary
+                # number; NULL is what that row always meant
+                for i in np.flatnonzero(codes == -1).tolist():
+                    rendered[i] = 'NULL'
+                return rendered
+            return cls._render_numpy_scalars(series.to_numpy(dtype=common))
+
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = cls._render_column(
+                pd.Series(dtype.categories.astype(object)), None
+            )
+            table = np.array(categories + ['NULL'], dtype=object)
+            return table[series.cat.codes.to_numpy()].tolist()
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+            return list(map(str, series.to_numpy().tolist()))
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            values = series.to_numpy(dtype=np.float64)
+            rendered = list(map(repr, values.tolist()))
+            for i in np.flatnonzero(np.isnan(values)).tolist():
+                rendered[i] = 'NULL'
+            return rendered
+        if isinstance(dtype, np.dtype) and dtype.kind == 'b':
+            return list(map(str, series.to_numpy().tolist()))
+
+        values = series.to_numpy(dtype=object)
+        if pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+            null = pd.isna(values)
+            quoted = "'" + series.astype(object).where(~null, '').str.replace(
+                "'", "''", regex=False) + "'"
+            return np.where(null, 'NULL', quoted.to_numpy(dtype=object)).tolist()
+        return [cls.literal(v) for v in values]
+
+    @classmethod
+    def _render_numpy_scalars(cls, values: np.ndarray) -> List[str]:
+        """Render a homogeneous row dtype: only float64 scalars go unquoted."""
+        if values.dtype == np.float64:
+            rendered = list(map(repr, values.tolist()))
+            for i in np.flatnonzero(np.isnan(values)).tolist():
+                rendered[i] = 'NULL'
+            return rendered
+        return [cls.literal(v) for v in values]
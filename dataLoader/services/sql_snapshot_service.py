@@ -0,0 +1,143 @@
+"""
+SQL snapshot service.
+Exports the current contents of the database as a new SQL version,
+streaming each table through a server-side cursor in chunks so memory
+stays flat whatever the table size.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from sqlalchemy import inspect
+from .data_cleaning_service import DataCleaningService
+from .sql_row_hash import column_kind
+
+
+class SqlSnapshotService:
+    """Service for snapshotting the live tables into a version directory."""
+
+    TABLE_ORDER = ['map', 'centerpos2x', 'bamboopattern', 'largescreenpixelpos']
+    KEY_COLUMN = 'magId'
+
+    def __init__(self, engine, export_service, chunk_size: int = 10000):
+        """
+        Args:
+            engine: SQLAlchemy engine of the database to snapshot
+            export_service: SqlExportService writing the version
+            chunk_size: Rows fetched and rendered at a time
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.engine = engine
+        self.export_service = export_service
+        self.chunk_size = chunk_size
+
+    def snapshot(self, tables: Optional[List[str]] = None) -> str:
+        """
+        Write the current rows of tables (default: every existing table of
+        the schema) as a new version; returns its directory.
+        Everything is read in one transaction: under InnoDB's default
+        REPEATABLE READ the row counts and every table's rows come from the
+        same consistent snapshot, even while others write.
+        """
+        inspector = inspect(self.engine)
+        tables = tables or [t for t in self.TABLE_ORDER if inspector.has_table(t)]
+        if not tables:
+            raise ValueError("No tables to snapshot")
+        columns = {
+            table: [(c['name'], column_kind(c['type']))
+                    for c in inspector.get_columns(table)]
+            for table in tables
+        }
+        with self.engine.connect() as conn, conn.begin():
+            counts = {
+                table: int(conn.exec_driver_sql(f"SELECT COUNT(*) FROM `{table}`").scalar())
+                for table in tables
+            }
+            dtypes = {table: self._dtypes(conn, table, columns[table]) for table in tables}
+            casts = {table: self._casts(conn, table, dtypes[table]) for table in tables}
+            # Each table's query only runs once the previous one is consumed
+            streams = {
+                table: (counts[table], self._frames(conn, table, dtypes[table], casts[table]))
+                for table in tables
+            }
+            return self.export_service.export_table_streams(streams)
+
+    def _dtypes(self, conn, table: str, columns: List[Tuple[str, str]]) -> Dict[str, object]:
+        """
+        Dtype of each column before apply_dtypes, as the loader's whole-table
+        frame has it: integers holding a NULL anywhere in the table are
+        float64 there, so they are in every chunk too. Frames typed like the
+        loader's render to the same dump bytes and share its objects.
+        """
+        ints = [name for name, kind in columns if kind == 'int']
+        nullable = set()
+        if ints:
+            sums = ', '.join(f"SUM(CASE WHEN `{name}` IS NULL THEN 1 ELSE 0 END)" for name in ints)
+            row = conn.exec_driver_sql(f"SELECT {sums} FROM `{table}`").one()
+            nullable = {name for name, nulls in zip(ints, row) if nulls}
+        return {
+            name: object if kind == 'text'
+            else 'int64' if kind == 'int' and name not in nullable
+            else 'float64'
+            for name, kind in columns
+        }
+
+    def _casts(self, conn, table: str, dtypes: Dict[str, object]) -> Dict[str, object]:
+        """
+        The casts apply_dtypes makes on the loader's whole-table frame,
+        found in a first pass over the columns it may narrow: a column is
+        narrowed only if every chunk allows it, and a double is float32
+        only if every chunk's values fit. Every chunk then gets the same casts.
+        """
+        rules = DataCleaningService.DTYPES.get(table, {})
+        narrowed = {name: dtype for name, dtype in dtypes.items()
+                    if rules.get(name, 'category') != 'category'}
+        empty = pd.DataFrame({name: pd.Series([], dtype=dtype) for name, dtype in dtypes.items()})
+        casts = DataCleaningService.dtype_casts(table, empty, report=False)
+        for df in self._chunks(conn, table, narrowed) if narrowed else ():
+            chunk = DataCleaningService.dtype_casts(table, df, report=False)
+            casts = {
+                name: np.float64 if np.float64 in (cast, chunk.get(name)) else cast
+                for name, cast in casts.items()
+                if name in chunk or name not in narrowed
+            }
+        return casts
+
+    def _frames(
+        self, conn, table: str, dtypes: Dict[str, object], casts: Dict[str, object]
+    ) -> Iterator[pd.DataFrame]:
+        """Chunks of a table's rows in magId order, typed like the loader's frames."""
+        for df in self._chunks(conn, table, dtypes):
+            yield df.astype(casts)
+
+    def _chunks(self, conn, table: str, dtypes: Dict[str, object]) -> Iterator[pd.DataFrame]:
+        """Chunks of the dtypes columns of a table, in magId order."""
+        names = ', '.join(f"`{name}`" for name in dtypes)
+        sql = f"SELECT {names} FROM `{table}` ORDER BY `{self.KEY_COLUMN}`"
+        for rows in self._row_chunks(conn, sql):
+            values = list(zip(*rows))
+            yield pd.DataFrame({
+                name: pd.Series(values[i], dtype=dtype)
+                for i, (name, dtype) in enumerate(dtypes.items())
+            })
+
+    def _row_chunks(self, conn, sql: str) -> Iterator[Sequence[Tuple]]:
+        """Run sql on a server-side cursor and yield its rows chunk_size at a time."""
+        if conn.dialect.driver == 'mysqlconnector':
+            # SQLAlchemy gives mysql-connector no server-side cursors (stream_results
+            # would silently buffer the whole result); an unbuffered DBAPI cursor
+            # reads rows off the socket only as they are fetched
+            cursor = conn.connection.cursor(buffered=False)
+            try:
+                cursor.execute(sql)
+                while True:
+                    rows = cursor.fetchmany(self.chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                cursor.close()
+            return
+        result = conn.execution_options(stream_results=True).exec_driver_sql(sql)
+        yield from result.partitions(self.chunk_size)
@@ -0,0 +1,190 @@
+"""
+SQL statement reader.
+Streams the statements of a .sql file from disk in fixed-size chunks,
+splitting on semicolons only outside quotes, identifiers and comments.
+"""
+
+import codecs
+import os
+import re
+import time
+from typing import Callable, Iterator, Optional
+from .sql_archive import ARCHIVE_EXTENSION, SqlArchive
+
+
+# Code state: a statement end, a quote/identifier opener or a comment opener.
+# MySQL only treats '--' as a comment when whitespace follows it.
+CODE_TOKEN = re.compile(r"[;'\"`#]|--[ \t\r\n]|/\*")
+QUOTE_END = {
+    "'": re.compile(r"[\\']"),
+    '"': re.compile(r'[\\"]'),
+    '`': re.compile(r'`'),
+}
+
+
+def iter_statements(read: Callable[[], str]) -> Iterator[str]:
+    """
+    Yield each statement of the text returned by successive read() calls.
+    Comments are dropped; statements are stripped and lose their ';'.
+    Quotes follow MySQL's defaults: a doubled quote or a backslash escapes
+    the next character inside '...' and "..."; `...` only doubles.
+    Only the statement being read and one chunk are held in memory.
+    """
+    buf, pos, start, eof = '', 0, 0, False
+    state = None    # None (code), a quote character, '--' or '/*'
+    parts = []      # pieces of the current statement, comments cut out
+
+    while True:
+        more = False
+        if state is None:
+            match = CODE_TOKEN.search(buf, pos)
+            if match is None:
+                if eof:
+                    parts.append(buf[start:])
+                    statement = ''.join(parts).strip()
+                    if statement:
+                        yield statement
+                    return
+                # Keep a possibly split '--' / '/*' opener for the next chunk
+                pos = max(pos, len(buf) - 2)
+                more = True
+            else:
+                token = match.group()
+                if token == ';':
+                    parts.append(buf[start:match.start()])
+                    statement = ''.join(parts).strip()
+                    if statement:
+                        yield statement
+                    parts = []
+                    start = pos = match.end()
+                elif token in QUOTE_END:
+                    state = token
+                    pos = match.end()
+                else:
+                    parts.append(buf[start:match.start()])
+                    parts.append(' ')
+                    state = '/*' if token == '/*' else '--'
+                    start = pos = match.end()
+        elif state in QUOTE_END:
+            match = QUOTE_END[state].search(buf, pos)
+            if match is None:
+                if eof:
+                    raise ValueError(f"Unterminated {state} quote in SQL input")
+                pos = len(buf)
+                more = True
+            elif match.end() >= len(buf) and not eof:
+                # Need the following character to tell an escape from the end
+                pos = match.start()
+                more = True
+            elif match.group() == '\\':
+                pos = match.end() + 1
+            elif buf.startswith(state, match.end()):
+                pos = match.end() + 1
+            else:
+                state = None
+                pos = match.end()
+        else:
+            end = '\n' if state == '--' else '*/'
+            found = buf.find(end, pos)
+            if found < 0:
+                if eof:
+                    state = None
+                    start = pos = len(buf)
+                    continue
+                start = pos = max(pos, len(buf) - len(end) + 1)
+                more = True
+            else:
+                state = None
+                start = pos = found + len(end)
+
+        if more:
+            if eof:
+                continue
+            chunk = read()
+            if not chunk:
+                eof = True
+            # Drop everything before the current statement / comment position
+            buf = buf[start:] + chunk
+            pos -= start
+            start = 0
+
+
+class SqlStatementReader:
+    """
+    Iterates the statements of a SQL file with bounded memory.
+    .sqlz archives are streamed one decompressed block at a time.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1 << 16):
+        """
+        Args:
+            path: SQL file (UTF-8) or .sqlz archive to read
+            chunk_size: Bytes read from disk at a time (plain files)
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+        self.bytes_read = 0
+
+    def __iter__(self) -> Iterator[str]:
+        if self.path.endswith(ARCHIVE_EXTENSION):
+            blocks = SqlArchive(self.path).iter_blocks()
+
+            def read_block() -> str:
+                text, size = next(blocks, ('', 0))
+                self.bytes_read += size
+                return text
+
+            yield from iter_statements(read_block)
+            return
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        with open(self.path, 'rb') as f:
+            def read() -> str:
+                data = f.read(self.chunk_size)
+                self.bytes_read += len(data)
+                text = decoder.decode(data, final=not data)
+                # A chunk ending inside a multi-byte character decodes to ''
+                while data and not text:
+                    data = f.read(self.chunk_size)
+                    self.bytes_read += len(data)
+                    text = decoder.decode(data, final=not data)
+                return text
+
+            yield from iter_statements(read)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the file read so far."""
+        return self.bytes_read / self.size if self.size else 1.0
+
+
+def execute_file(
+    conn,
+    path: str,
+    progress_every: int = 200,
+    transform: Optional[Callable[[str], str]] = None
+) -> int:
+    """
+    Stream a SQL file's statements to the raw DBAPI cursor of conn.
+    Each statement is one cursor.execute() on a single cursor, bypassing
+    SQLAlchemy's text() parsing; progress is printed every progress_every
+    statements. transform, if given, rewrites each statement before it is
+    sent. Returns the number of statements executed.
+    """
+    reader = SqlStatementReader(path)
+    name = os.path.basename(path)
+    start = time.perf_counter()
+    count = 0
+    cursor = conn.connection.cursor()
+    try:
+        for statement in reader:
+            # No parameters: no %-formatting, no bind parsing
+            cursor.execute(transform(statement) if transform else statement)
+            count += 1
+            if count % progress_every == 0:
+                print(f"  {name}: {count} statements, {reader.progress:.0%}", end='\r')
+    finally:
+        cursor.close()
+    print(f"  {name}: {count} statements in {time.perf_counter() - start:.2f}s")
+    return count
@@ -0,0 +1,37 @@
+"""
+Table definitions.
+Column definitions of every table, in CREATE TABLE order; every table's
+primary key is magId, and its other keys live in DatabaseSchemaService.
+"""
+
+from typing import Dict, List
+
+
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    'map': [
+        '`magId` INT NOT NULL', '`segment` INT', '`lineDirectionTypeId` INT',
+        '`stake` VARCHAR(9)', '`type` DOUBLE', '`epc` VARCHAR(24)', '`tid` DOUBLE',
+        '`polar` TINYINT', '`hidenEnable` TINYINT', '`transverse` DOUBLE',
+        '`longitudinal` DOUBLE', '`curvature` DOUBLE', '`coordinateX` DOUBLE',
+        '`coordinateY` DOUBLE', '`coordinateE` INT', '`coordinateN` INT',
+        '`cruisingSpeed` INT', '`limitSpeed` INT', '`scene` TINYINT',
+        '`stationType` DOUBLE', '`stationNum` INT', '`signallamp` TINYINT',
+        '`oneWayRoad` TINYINT', '`meetingVec` TINYINT', '`oppositeSegment` INT',
+    ],
+    'centerpos2x': [
+        '`magId` INT NOT NULL', '`stake` VARCHAR(9)', '`lineId` INT',
+        '`lineDirectionTypeId` INT', '`xCoordinate` INT', '`yCoordinate` INT',
+        '`pixelValue` INT', '`platformName` INT', '`platformNumber` INT',
+    ],
+    'bamboopattern': [
+        '`magId` INT NOT NULL', '`stake` VARCHAR(9)', '`siteNumber` INT',
+        '`vehicleleft` INT', '`top` INT', '`lineDirectionTypeId` INT', '`lineId` INT',
+        '`platformName` INT',
+    ],
+    'largescreenpixelpos': [
+        '`magId` INT NOT NULL', '`lineId` INT', '`lineDirectionTypeId` INT',
+        '`xCoordinate` INT', '`yCoordinate` INT', '`pixelValue` INT',
+        '`platformName` INT', '`platformNumber` INT', '`stopTime` DOUBLE',
+        '`residenceTime` VARCHAR(32)',
+    ],
+}
@@ -0,0 +1,64 @@
+"""
+Table swaps.
+Makes loaded *_staging tables live, and rolls them back, with one atomic
+RENAME TABLE; the replaced tables are kept as *_prev.
+"""
+
+from sqlalchemy import text
+from typing import List, Tuple
+
+
+class TableSwaps:
+    """
+    Staging, swap and rollback of the schema's tables. Expects engine,
+    TABLE_KEYS, existing_tables() and drop_tables_if_exist().
+    """
+    
+    STAGING_SUFFIX = '_staging'
+    PREV_SUFFIX = '_prev'
+    
+    def copy_tables(self, table_names: List[str], suffix: str) -> None:
+        """Copy the live rows of table_names into their (empty) suffixed tables."""
+        with self.engine.begin() as conn:
+            for table in table_names:
+                conn.execute(text(f"INSERT INTO `{table}{suffix}` SELECT * FROM `{table}`;"))
+                print(f"Copied table {table} into {table}{suffix}")
+    
+    def swap_staging_tables(self, table_names: List[str] = None) -> None:
+        """
+        Make the *_staging tables (all, or table_names) live with one RENAME
+        TABLE. The live tables become *_prev, so readers switch from the old
+        data to the new data in a single step. Every older *_prev table is
+        dropped first, so a rollback undoes exactly this swap.
+        """
+        staging, prev = self.STAGING_SUFFIX, self.PREV_SUFFIX
+        table_names = table_names or list(self.TABLE_KEYS)
+        missing = set(table_names) - set(self.existing_tables(staging))
+        if missing:
+            raise RuntimeError(f"Missing staging tables: {sorted(missing)}")
+        self.drop_tables_if_exist([f"{t}{prev}" for t in self.TABLE_KEYS])
+        live = [t for t in self.existing_tables() if t in table_names]
+        renames = [(t, f"{t}{prev}") for t in live]
+        renames += [(f"{t}{staging}", t) for t in self.TABLE_KEYS if t in table_names]
+        self._rename_tables(renames)
+        print(f"Swapped staging tables in: {', '.join(table_names)}; "
+              f"previous tables kept as *{prev}")
+    
+    def rollback_tables(self) -> None:
+        """Swap the tables that have a *_prev with it, in one RENAME TABLE."""
+        prev, swap = self.PREV_SUFFIX, '_swap'
+        tables = self.existing_tables(prev)
+        if not tables:
+            raise RuntimeError(f"Nothing to roll back to; no *{prev} tables")
+        renames = []
+        for t in tables:
+            renames += [(t, f"{t}{swap}"), (f"{t}{prev}", t), (f"{t}{swap}", f"{t}{prev}")]
+        self._rename_tables(renames)
+        print(f"Rolled back {', '.join(tables)}: previous tables are live again, "
+              f"replaced ones kept as *{prev}")
+    
+    def _rename_tables(self, renames: List[Tuple[str, str]]) -> None:
+        """Apply (old, new) renames in order as one atomic RENAME TABLE."""
+        clauses = ', '.join(f"`{old}` TO `{new}`" for old, new in renames)
+        with self.engine.begin() as conn:
+            conn.execute(text(f"RENAME TABLE {clauses};"))
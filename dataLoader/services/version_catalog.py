@@ -0,0 +1,169 @@
+"""
+Version catalog.
+Keeps catalog.json in the SQL directory: one entry per completely exported
+version, so listing versions, finding the latest one and numbering the next
+one need no scan of the version directories. Changes are made under a lock
+file, so concurrent exports and snapshots do not lose each other's entries.
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+from .sql_archive import ARCHIVE_EXTENSION
+from .sql_object_store import atomic_write, file_lock, read_manifest
+
+
+METADATA_FILE = 'version_info.sql'
+CATALOG_FILE = 'catalog.json'
+LOCK_FILE = 'catalog.lock'
+
+
+def list_dump_files(version_dir: str) -> Dict[str, List[str]]:
+    """Dump files of each table found in a version directory, in name order."""
+    files: Dict[str, List[str]] = {}
+    for name in sorted(os.listdir(version_dir)):
+        if name.endswith(('.sql', ARCHIVE_EXTENSION)) and name != METADATA_FILE:
+            files.setdefault(name.split('.')[0], []).append(name)
+    return files
+
+
+class VersionCatalog:
+    """Catalog of the V{n}_* versions of a SQL directory."""
+
+    def __init__(self, base_sql_dir: str):
+        """
+        Args:
+            base_sql_dir: Directory holding the version directories and catalog.json
+        """
+        self.base_sql_dir = base_sql_dir
+
+    def is_complete(self, version_name: str) -> bool:
+        """Whether a version finished exporting (its metadata file exists)."""
+        return os.path.exists(os.path.join(self.base_sql_dir, version_name, METADATA_FILE))
+
+    def read(self) -> Dict:
+        """
+        The version catalog: {'latest': name, 'reserved': number,
+        'versions': {name: entry}}, reserved being the highest number handed
+        out. Each entry holds the version number, generation time, timestamp and
+        per-table records, bytes and object hashes. A missing or unreadable
+        catalog is rebuilt from the version directories, and entries whose
+        directory was deleted are dropped.
+        """
+        catalog = self._load()
+        if catalog is None or not all(self._exists(name) for name in catalog['versions']):
+            with self._locked():
+                catalog = self._write(*self._current())
+        return catalog
+
+    def rebuild(self) -> Dict:
+        """Scan every complete version directory and rewrite the catalog."""
+        with self._locked():
+            return self._write(*self._scan())
+
+    def entry(self, version_name: str) -> Optional[Dict]:
+        """Catalog entry of a complete version, or None."""
+        return self.read()['versions'].get(version_name)
+
+    def add(self, version_name: str, entry: Dict) -> None:
+        """Record a freshly exported version in the catalog."""
+        with self._locked():
+            versions, reserved = self._current()
+            versions[version_name] = entry
+            self._write(versions, reserved)
+
+    def reserve(self) -> int:
+        """Number for a new version, higher than every version made or under way."""
+        with self._locked():
+            versions, reserved = self._current()
+            number = max([reserved, *(e['version'] for e in versions.values())]) + 1
+            self._write(versions, number)
+            return number
+
+    def _exists(self, version_name: str) -> bool:
+        """Whether a catalogued version's directory is still there."""
+        return os.path.isdir(os.path.join(self.base_sql_dir, version_name))
+
+    def _locked(self):
+        """Lock held while the catalog is read, changed and written."""
+        os.makedirs(self.base_sql_dir, exist_ok=True)
+        return file_lock(os.path.join(self.base_sql_dir, LOCK_FILE))
+
+    def _load(self) -> Optional[Dict]:
+        """catalog.json as stored, or None if missing or unreadable."""
+        try:
+            with open(os.path.join(self.base_sql_dir, CATALOG_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _current(self) -> Tuple[Dict[str, Dict], int]:
+        """Versions and reserved number from the stored catalog, else from a scan."""
+        catalog = self._load()
+        if catalog is None:
+            return self._scan()
+        return catalog['versions'], catalog.get('reserved', 0)
+
+    def _scan(self) -> Tuple[Dict[str, Dict], int]:
+        """Entries of the complete version directories, and the highest number in use."""
+        versions, highest = {}, 0
+        if os.path.exists(self.base_sql_dir):
+            for item in os.listdir(self.base_sql_dir):
+                match = re.match(r'V(\d+)', item)
+                if match and os.path.isdir(os.path.join(self.base_sql_dir, item)):
+                    highest = max(highest, int(match.group(1)))
+                    if self.is_complete(item):
+                        versions[item] = self._entry(item)
+        return versions, highest
+
+    def _write(self, versions: Dict[str, Dict], reserved: int) -> Dict:
+        """Write the catalog atomically, versions ordered by number; returns it."""
+        ordered = dict(sorted(
+            ((name, entry) for name, entry in versions.items() if self._exists(name)),
+            key=lambda item: item[1]['version']))
+        catalog = {
+            'latest': next(reversed(ordered), None),
+            'reserved': max([reserved, *(e['version'] for e in ordered.values())]),
+            'versions': ordered
+        }
+        if os.path.exists(self.base_sql_dir):
+            atomic_write(os.path.join(self.base_sql_dir, CATALOG_FILE),
+                         json.dumps(catalog, indent=2).encode('utf-8'))
+        return catalog
+
+    def _entry(self, version_name: str) -> Dict:
+        """
+        Catalog entry read back from a version directory.
+        Versions exported before manifests existed get their counts from the
+        dump headers and their hashes from the dump files.
+        """
+        version_dir = os.path.join(self.base_sql_dir, version_name)
+        info = {}
+        with open(os.path.join(version_dir, METADATA_FILE), 'r', encoding='utf-8') as f:
+            for line in f:
+                key, _, value = line[2:].partition(':')
+                info[key.strip()] = value.strip()
+        manifest = read_manifest(version_dir)
+        if manifest is not None:
+            tables = manifest['tables']
+        else:
+            tables = {}
+            for table, files in list_dump_files(version_dir).items():
+                path = os.path.join(version_dir, files[0])
+                with open(path, 'rb') as f:
+                    content = f.read()
+                records = re.search(rb'^-- Records: (\d+)', content, re.MULTILINE)
+                tables[table] = {
+                    'bytes': len(content),
+                    'records': int(records.group(1)) if records else None,
+                    'object': hashlib.sha256(content).hexdigest(),
+                    'file': files[0]
+                }
+        return {
+            'version': int(re.match(r'V(\d+)', version_name).group(1)),
+            'generated': info.get('Generated'),
+            'timestamp': info.get('Timestamp'),
+            'tables': tables
+        }
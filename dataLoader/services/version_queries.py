@@ -0,0 +1,45 @@
+"""
+Version queries.
+Read-only lookups of the exported versions: their manifests, dump files,
+completeness and the latest one, answered from the version catalog.
+"""
+
+import os
+from typing import Dict, List, Optional
+from .sql_object_store import read_manifest
+from .version_catalog import list_dump_files
+
+
+class VersionQueries:
+    """Lookups of exported versions. Expects base_sql_dir and catalog attributes."""
+    
+    def read_manifest(self, version_name: str) -> Optional[Dict]:
+        """The manifest of a version, or None for versions exported without one."""
+        return read_manifest(os.path.join(self.base_sql_dir, version_name))
+    
+    def table_files(self, version_name: str) -> Dict[str, List[str]]:
+        """
+        Dump files of each table in a version, in apply order within a table.
+        Uses the manifest; versions without one are read from the directory.
+        """
+        manifest = self.read_manifest(version_name)
+        if manifest is not None:
+            return {
+                table: [shard['file'] for shard in entry['shards']]
+                if 'shards' in entry else [entry.get('file', f"{table}.sql")]
+                for table, entry in manifest['tables'].items()
+            }
+        return list_dump_files(os.path.join(self.base_sql_dir, version_name))
+    
+    def is_complete(self, version_name: str) -> bool:
+        """Whether a version finished exporting (its metadata file exists)."""
+        return self.catalog.is_complete(version_name)
+    
+    def get_latest_version_dir(self) -> str:
+        """Get the path to the latest completely exported version directory."""
+        latest = self.catalog.read()['latest']
+        return os.path.join(self.base_sql_dir, latest) if latest else None
+    
+    def list_all_versions(self) -> list:
+        """List all completely exported version directories, oldest first."""
+        return list(self.catalog.read()['versions'])
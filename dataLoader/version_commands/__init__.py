@@ -0,0 +1,14 @@
+"""
+Version commands package initialization.
+The commands SqlVersionManager runs, grouped by what they act on.
+"""
+
+from .apply_commands import ApplyCommands
+from .catalog_commands import CatalogCommands
+from .delta_commands import DeltaCommands
+
+__all__ = [
+    'ApplyCommands',
+    'CatalogCommands',
+    'DeltaCommands'
+]
@@ -0,0 +1,121 @@
+"""
+Apply commands.
+Applying a version (incrementally, or through staging tables and a swap)
+and rolling the last swap back.
+"""
+
+import os
+from .staging_load import StagingLoad
+
+
+class ApplyCommands(StagingLoad):
+    """apply and rollback. Expects sql_dir, export_service, schema_service and chunk_sync_service."""
+    
+    def apply_version(self, version_name: str, confirm: bool = False, incremental: bool = False):
+        """
+        Apply a specific version to the database through staging tables.
+        With incremental, and when the version's live tables exist, only
+        the magId ranges that differ from the version are re-applied; too
+        many changes fall back to the staging load.
+        """
+        version_path = os.path.join(self.sql_dir, version_name)
+        
+        if not os.path.exists(version_path):
+            print(f"Version {version_name} not found.")
+            return False
+        
+        if not self.export_service.is_complete(version_name):
+            print(f"Version {version_name} is incomplete (export did not finish); not applying it.")
+            return False
+        
+        # List SQL files (one per table, or its shards) in the version
+        table_files = self.export_service.table_files(version_name)
+        
+        if not table_files:
+            print(f"No SQL files found in version {version_name}")
+            return False
+        
+        print(f"Version {version_name} contains the following SQL files:")
+        for files in table_files.values():
+            for sql_file in files:
+                print(f"  - {sql_file}")
+        
+        if not confirm:
+            response = input("Do you want to apply this version? (y/N): ")
+            if response.lower() != 'y':
+                print("Operation cancelled.")
+                return False
+        
+        if incremental and set(table_files) <= set(self.schema_service.existing_tables()):
+            if self._apply_incremental(version_path, table_files):
+                print(f"Version {version_name} applied incrementally!")
+                return True
+            print("Falling back to a full apply.")
+        
+        try:
+            self._apply_staged(version_path, table_files)
+            print(f"Version {version_name} applied successfully!")
+            return True
+        except Exception as e:
+            print(f"Error applying version {version_name}: {e}")
+            print("The live tables were not changed.")
+            return False
+    
+    def _apply_incremental(self, version_path: str, table_files) -> bool:
+        """Re-apply only the differing ranges; False if the live tables were left as they were."""
+        try:
+            print("Comparing live tables with the version range by range...")
+            synced = self.chunk_sync_service.sync(version_path, table_files) is not None
+        except Exception as e:
+            print(f"Incremental apply failed ({e}); the live tables were not changed.")
+            return False
+        if synced:
+            # The patched live tables no longer follow the *_prev ones,
+            # so a rollback would bring back older data than the last load
+            prev = self.schema_service.PREV_SUFFIX
+            self.schema_service.drop_tables_if_exist(
+                [f"{t}{prev}" for t in self.schema_service.TABLE_KEYS])
+        return synced
+    
+    def _apply_staged(self, version_path: str, table_files) -> None:
+        """Load the version into *_staging tables and swap them in with one RENAME TABLE."""
+        tables = list(table_files)
+        staging = self.schema_service.STAGING_SUFFIX
+        # Only the version's tables are swapped; a version without map keeps
+        # the live map, which its staged child tables reference. Child
+        # foreign keys follow map through the rename, so a version with map
+        # carries the live child tables it lacks over into staging as well.
+        carried = []
+        if 'map' in tables:
+            carried = [t for t in self.schema_service.existing_tables() if t not in tables]
+        staged = [t for t in self.schema_service.TABLE_KEYS if t in tables or t in carried]
+        
+        # Load into *_staging tables; the live tables stay untouched
+        print("Creating staging tables...")
+        self.schema_service.drop_tables_if_exist([f"{t}{staging}" for t in staged])
+        self.schema_service.create_tables(
+            deferred_keys=True, suffix=staging, table_names=staged)
+        
+        if carried:
+            self.schema_service.copy_tables(carried, staging)
+        self._load_staging(version_path, table_files, staging)
+        
+        self.schema_service.add_deferred_keys(staged, suffix=staging)
+        self.schema_service.verify_referential_integrity(suffix=staging, table_names=staged)
+        
+        # One RENAME TABLE makes the new data live; the old stays as *_prev
+        self.schema_service.swap_staging_tables(staged)
+    
+    def rollback(self, confirm: bool = False):
+        """Make the *_prev tables live again, swapping them with the current ones."""
+        if not confirm:
+            response = input("Do you want to roll back to the previous tables? (y/N): ")
+            if response.lower() != 'y':
+                print("Operation cancelled.")
+                return False
+        try:
+            self.schema_service.rollback_tables()
+            return True
+        except Exception as e:
+            print(f"Error rolling back: {e}")
+            return False
@@ -0,0 +1,58 @@
+"""
+Catalog commands.
+Listing and showing the exported versions, and snapshotting the database
+as a new one.
+"""
+
+import os
+
+
+class CatalogCommands:
+    """list, show and snapshot. Expects export_service and snapshot_service."""
+    
+    def list_versions(self):
+        """List all available versions, from the catalog."""
+        catalog = self.export_service.catalog.read()
+        if not catalog['versions']:
+            print("No versions found.")
+            return
+        
+        print("Available versions:")
+        for version, entry in catalog['versions'].items():
+            records = sum(t['records'] or 0 for t in entry['tables'].values())
+            latest = " (latest)" if version == catalog['latest'] else ""
+            print(f"  {version}: Version: V{entry['version']}, generated {entry['generated']}, "
+                  f"{len(entry['tables'])} tables, {records:,} records{latest}")
+    
+    def show_version_details(self, version_name: str):
+        """Show detailed information about a version, from the catalog."""
+        entry = self.export_service.catalog.entry(version_name)
+        
+        if entry is None:
+            print(f"Version {version_name} not found.")
+            return
+        
+        print(f"=== Version {version_name} Details ===")
+        print(f"Version: V{entry['version']}")
+        print(f"Generated: {entry['generated']}")
+        print(f"Timestamp: {entry['timestamp']}")
+        
+        print("SQL Files:")
+        for table, info in entry['tables'].items():
+            records = 'unknown' if info['records'] is None else f"{info['records']:,}"
+            print(f"  - {table} ({records} records, {info['bytes']:,} bytes, "
+                  f"object {info['object'][:12]})")
+            for shard in info.get('shards', []):
+                print(f"      {shard['file']} ({shard['records']:,} records, "
+                      f"magId {shard['min_magId']}-{shard['max_magId']}, "
+                      f"{shard['bytes']:,} bytes)")
+    
+    def snapshot(self):
+        """Write the current database contents as a new version."""
+        try:
+            version_dir = self.snapshot_service.snapshot()
+            print(f"Snapshot written as version {os.path.basename(version_dir)}")
+            return version_dir
+        except Exception as e:
+            print(f"Error taking snapshot: {e}")
+            return None
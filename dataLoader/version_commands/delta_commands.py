@@ -0,0 +1,45 @@
+"""
+Delta commands.
+Writing a patch between two versions and applying one to the database.
+"""
+
+import os
+
+
+class DeltaCommands:
+    """diff and apply-delta. Expects engine and delta_service."""
+    
+    def diff_versions(self, old_version: str, new_version: str, output: str = None):
+        """Write a patch moving the database from old_version to new_version."""
+        try:
+            return self.delta_service.write_patch(old_version, new_version, output)
+        except ValueError as e:
+            print(f"Cannot diff {old_version} -> {new_version}: {e}")
+            return None
+    
+    def apply_delta(self, patch_path: str, confirm: bool = False):
+        """Apply a patch written by diff_versions."""
+        if not os.path.exists(patch_path):
+            print(f"Patch {patch_path} not found.")
+            return False
+        
+        with open(patch_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.startswith('--'):
+                    break
+                print(line.strip()[2:].strip())
+        print("The database must currently hold the patch's source version.")
+        
+        if not confirm:
+            response = input("Do you want to apply this patch? (y/N): ")
+            if response.lower() != 'y':
+                print("Operation cancelled.")
+                return False
+        
+        try:
+            self.delta_service.apply_patch(self.engine, patch_path)
+            print("Patch applied successfully!")
+            return True
+        except Exception as e:
+            print(f"Error applying patch {patch_path}: {e}")
+            return False
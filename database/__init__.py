@@ -1,4 +1,4 @@
 # Database module initialization
-from .connection import get_engine, get_connection
+from .connection import get_engine, get_bulk_load_engine, get_connection
 
-__all__ = ["get_engine", "get_connection"]
+__all__ = ["get_engine", "get_bulk_load_engine", "get_connection"]
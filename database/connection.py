@@ -19,6 +19,11 @@ class DatabaseConfig:
         self.password = os.getenv("DB_PASSWORD", "root")
         self.database = os.getenv("DB_DATABASE", "stakes")
         self.charset = os.getenv("DB_CHARSET", "utf8mb4")
+        # Client-side permission for LOAD DATA LOCAL INFILE on the shared
+        # engine; off by default, bulk loads use get_bulk_load_engine()
+        self.allow_local_infile = os.getenv(
+            "DB_ALLOW_LOCAL_INFILE", "false"
+        ).lower() in ("1", "true", "yes")
 
     def get_connection_string(self) -> str:
         """Generate the database connection string."""
@@ -48,13 +53,44 @@ def get_engine(pool_pre_ping: bool = True, **kwargs):
 
     if _engine is None:
         connection_string = _config.get_connection_string()
+        connect_args = kwargs.pop("connect_args", {})
+        connect_args.setdefault("allow_local_infile", _config.allow_local_infile)
         _engine = create_engine(
-            connection_string, pool_pre_ping=pool_pre_ping, **kwargs
+            connection_string,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
+            **kwargs,
         )
 
     return _engine
 
 
+def get_bulk_load_engine(infile_dir: str, pool_pre_ping: bool = True, **kwargs):
+    """
+    Create a separate engine for LOAD DATA LOCAL INFILE bulk loads.
+
+    The client may only send files inside infile_dir, so a server asking
+    for any other local file is refused.
+
+    Args:
+        infile_dir (str): Directory the bulk-load files are written to
+        pool_pre_ping (bool): Enable connection health checks
+        **kwargs: Additional engine parameters
+
+    Returns:
+        SQLAlchemy engine instance (not the shared one)
+    """
+    connect_args = kwargs.pop("connect_args", {})
+    connect_args.setdefault("allow_local_infile", False)
+    connect_args.setdefault("allow_local_infile_in_path", infile_dir)
+    return create_engine(
+        _config.get_connection_string(),
+        pool_pre_ping=pool_pre_ping,
+        connect_args=connect_args,
+        **kwargs,
+    )
+
+
 def get_connection():
     """
     Get a database connection from the engine.
@@ -0,0 +1,97 @@
+"""
+Shared helpers for the SQL version tests.
+Sample frames to export, and loading a version into a SQLite database to
+compare table contents.
+"""
+
+import sys
+import os
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+
+import hashlib
+import pandas as pd
+from sqlalchemy import event
+from services.sql_statement_reader import SqlStatementReader
+
+TABLES = ("map", "centerpos2x")
+SCHEMAS = {
+    "map": "(magId INTEGER PRIMARY KEY, stake TEXT)",
+    "centerpos2x": "(magId INTEGER PRIMARY KEY, xCoordinate REAL)",
+}
+
+
+def sample_dataframes(n: int = 250) -> dict:
+    """A map table and one child table keyed by magId; the last xCoordinate is NULL."""
+    mag_ids = list(range(100001, 100001 + n))
+    coordinates = [i / 3 for i in range(n - 1)] + [None]
+    return {
+        "map": pd.DataFrame({"magId": mag_ids, "stake": [f"K{i}'0" for i in range(n)]}),
+        "centerpos2x": pd.DataFrame({"magId": mag_ids, "xCoordinate": coordinates}),
+    }
+
+
+class _BitXor:
+    """MySQL's BIT_XOR aggregate."""
+
+    def __init__(self):
+        self.value = 0
+
+    def step(self, value):
+        if value is not None:
+            self.value ^= value
+
+    def finalize(self):
+        return self.value
+
+
+def _concat_ws(separator, *values):
+    """MySQL's CONCAT_WS: skips NULLs, renders numbers as text."""
+    return separator.join(str(v) for v in values if v is not None)
+
+
+def register_mysql_functions(engine) -> None:
+    """Give engine's SQLite connections the MySQL functions the range hashes use."""
+
+    @event.listens_for(engine, "connect")
+    def register(dbapi_connection, _):
+        dbapi_connection.create_function("CONCAT_WS", -1, _concat_ws)
+        dbapi_connection.create_function(
+            "MD5", 1, lambda text: hashlib.md5(text.encode("utf-8")).hexdigest()
+        )
+        # Only ever called to convert to base 10
+        dbapi_connection.create_function(
+            "CONV", 3, lambda text, base, to_base: str(int(text, base))
+        )
+        dbapi_connection.create_aggregate("BIT_XOR", 1, _BitXor)
+
+
+def create_tables(engine) -> None:
+    """Create the sample tables in a SQLite database."""
+    with engine.begin() as conn:
+        for table in TABLES:
+            conn.exec_driver_sql(f"CREATE TABLE {table} {SCHEMAS[table]}")
+
+
+def load_version(engine, version_dir: str) -> None:
+    """Create the tables and run a version's dumps (.sql or .sqlz) against engine."""
+    create_tables(engine)
+    names = sorted(os.listdir(version_dir))
+    with engine.begin() as conn:
+        for table in TABLES:
+            for name in names:
+                if name.split(".")[0] == table and name.endswith((".sql", ".sqlz")):
+                    for statement in SqlStatementReader(os.path.join(version_dir, name)):
+                        conn.exec_driver_sql(statement)
+
+
+def table_rows(engine) -> dict:
+    """Every row of both tables, ordered by magId."""
+    with engine.connect() as conn:
+        return {
+            table: conn.exec_driver_sql(f"SELECT * FROM {table} ORDER BY magId").fetchall()
+            for table in TABLES
+        }
@@ -0,0 +1,71 @@
+"""
+Test module for the sparse calibration overlay.
+Checks that edits merge over the loaded coordinates without touching them.
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path to import the app package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from app.domain.value_objects.view_type import ViewType
+from app.infrastructure.repositories.calibration_overlay import CalibrationOverlay
+from app.infrastructure.repositories.columnar_view_store import ColumnarViewStore
+
+
+def make_store() -> ColumnarViewStore:
+    """Build a small centerpos2x store."""
+    df = pd.DataFrame(
+        {
+            "magId": [100001, 100002, 100003],
+            "lineId": [1, 1, 2],
+            "xCoordinate": [10, 20, 30],
+            "yCoordinate": [1, 2, 3],
+        }
+    )
+    return ColumnarViewStore(ViewType.CENTER_POS_2X, df)
+
+
+class TestCalibrationOverlay:
+    """Test class for CalibrationOverlay and ColumnarViewStore edits."""
+
+    def test_edit_merges_over_base(self):
+        """Edited reads return the new value; originals stay untouched."""
+        store = make_store()
+        store.set(1, 25.5, 4.0)
+        assert store.get(1) == (25.5, 4.0)
+        assert store.get_original(1) == (20.0, 2.0)
+        assert len(store.overlay) == 1
+        print("✅ Edit merged over base coordinates")
+
+    def test_reverting_edit_drops_it(self):
+        """Setting the original value back removes the overlay entry."""
+        store = make_store()
+        store.set(0, 11.0, 1.0)
+        store.set(0, 10.0, 1.0)
+        assert len(store.overlay) == 0
+        print("✅ Reverted edit removed from overlay")
+
+    def test_remove_keeps_other_slots(self):
+        """Removing an edit moves the last slot without losing data."""
+        overlay = CalibrationOverlay(capacity=1)
+        for index in range(40):
+            overlay.set_delta(index, float(index), -float(index))
+        overlay.remove(3)
+        assert overlay.get_delta(3) is None
+        assert overlay.get_delta(39) == (39.0, -39.0)
+        indices, dx, _ = overlay.edits()
+        assert sorted(indices.tolist()) == [i for i in range(40) if i != 3]
+        assert (dx == indices).all()
+        print("✅ Overlay removal keeps remaining edits")
+
+    def test_current_arrays(self):
+        """Bulk reads apply every edit."""
+        store = make_store()
+        store.set(2, 31.0, 3.5)
+        xs, ys = store.current_arrays()
+        assert xs.tolist() == [10.0, 20.0, 31.0]
+        assert ys.tolist() == [1.0, 2.0, 3.5]
+        print("✅ Bulk arrays include edits")
@@ -0,0 +1,60 @@
+"""
+Test module for the dtype casting of cleaned frames.
+Checks which columns DataCleaningService.apply_dtypes narrows and which it
+leaves alone.
+"""
+
+import sys
+import os
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+
+import numpy as np
+import pandas as pd
+from services.data_cleaning_service import DataCleaningService
+
+
+def test_columns_are_narrowed_to_the_table_dtypes():
+    """Integer, small-int, double and category columns get their DDL dtypes."""
+    df = pd.DataFrame({
+        "magId": [100001.0, 100002.0],
+        "polar": [0, 1],
+        "type": [1.5, 2.0],
+        "curvature": [0.1, 0.2],
+        "stake": ["K1", "K1"],
+        "unlisted": [1, 2],
+    })
+    result = DataCleaningService.apply_dtypes("map", df)
+    assert result["magId"].dtype == np.int32
+    assert result["polar"].dtype == np.int8
+    # 1.5 and 2.0 round-trip through float32 exactly; 0.1 does not
+    assert result["type"].dtype == np.float32
+    assert result["curvature"].dtype == np.float64
+    assert isinstance(result["stake"].dtype, pd.CategoricalDtype)
+    assert result["unlisted"].dtype == np.int64
+    assert result["magId"].tolist() == [100001, 100002]
+
+
+def test_unsafe_integer_casts_are_skipped():
+    """NULLs, fractions, text and out-of-range values keep their dtype."""
+    df = pd.DataFrame({
+        "magId": [1.0, None],
+        "segment": [1.5, 2.0],
+        "lineDirectionTypeId": ["a", "b"],
+        "polar": [0, 300],
+    })
+    result = DataCleaningService.apply_dtypes("map", df)
+    assert result.dtypes.tolist() == df.dtypes.tolist()
+
+
+def test_empty_frame_is_cast():
+    """An empty table has no values to range-check and still gets its dtypes."""
+    df = pd.DataFrame({"magId": pd.Series([], dtype="float64"),
+                       "xCoordinate": pd.Series([], dtype="int64")})
+    result = DataCleaningService.apply_dtypes("centerpos2x", df)
+    assert result["magId"].dtype == np.int32
+    assert result["xCoordinate"].dtype == np.int32
+    assert result.empty
@@ -0,0 +1,75 @@
+"""
+Test module for the data insertion service.
+Checks which LOAD DATA errors fall back to executemany and that the staged
+TSV values match the SQL dump's literals.
+"""
+
+import sys
+import os
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy.exc import DBAPIError
+from services.data_insertion_service import DataInsertionService
+from services.sql_row_renderer import SqlRowRenderer
+
+
+class DriverError(Exception):
+    """DBAPI error carrying a MySQL error number like mysql-connector's."""
+
+    def __init__(self, errno: int):
+        super().__init__(f"error {errno}")
+        self.errno = errno
+
+
+def insert_failing_load(errno: int) -> DataInsertionService:
+    """Insert one table with load_data failing with errno; returns the service."""
+    service = DataInsertionService(None, default_strategy="load_data")
+    inserted = []
+
+    def fail(conn, table_name, df):
+        raise DBAPIError("LOAD DATA", None, DriverError(errno))
+
+    service._load_data = fail
+    service._executemany = lambda conn, table_name, df: inserted.append(table_name)
+    service._insert_data(None, "map", pd.DataFrame({"magId": [1]}))
+    assert inserted == ["map"]
+    return service
+
+
+@pytest.mark.parametrize("errno", [1148, 2068, 3948])
+def test_disabled_local_infile_falls_back(errno):
+    """Local infile refused by the server or the client loads with executemany."""
+    assert insert_failing_load(errno).stats["map"][0] == "executemany"
+
+
+@pytest.mark.parametrize("errno", [1062, 1452, 2013])
+def test_other_errors_are_raised(errno):
+    """Duplicate keys, FK violations and lost connections are not retried."""
+    with pytest.raises(DBAPIError):
+        insert_failing_load(errno)
+
+
+def test_tsv_floats_match_the_rendered_literals():
+    """float32 columns stage the float64 values the SQL dump renders."""
+    df = pd.DataFrame({
+        "magId": pd.Series([1, 2, 3, 4], dtype="int32"),
+        "stopTime": pd.Series([0.1, 2.675, None, 3.0], dtype="float32"),
+        "stake": ["K1+000", None, "a\tb", "K2"],
+    })
+    tsv = DataInsertionService._to_tsv(df)
+    literals = SqlRowRenderer.render(df)
+    for line, literal in zip(tsv.splitlines(), literals):
+        _, stop_time, _ = line.split("\t")
+        expected = literal.strip("()").split(", ")[1]
+        if expected == "NULL":
+            assert stop_time == "\\N"
+        else:
+            assert float(stop_time) == float(expected)
+    assert tsv.splitlines()[0].split("\t")[1] == repr(float(np.float32(0.1)))
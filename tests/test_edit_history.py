@@ -0,0 +1,153 @@
+"""
+Test module for the undo/redo edit history and its journal.
+Checks that edits, undos and redos survive a replay onto reloaded data.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path to import the app package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from app.application.services.edit_history_service import EditHistoryService
+from app.domain.value_objects.view_type import ViewType
+from app.infrastructure.journal.calibration_journal import CalibrationJournal
+from app.infrastructure.repositories.vehicle_data_repository import (
+    VehicleDataRepository,
+)
+
+VIEW = ViewType.CENTER_POS_2X
+
+
+def make_repository(mag_ids) -> VehicleDataRepository:
+    """Build a repository over a small centerpos2x table."""
+    n = len(mag_ids)
+    frames = {
+        "map": pd.DataFrame({"magId": mag_ids, "stake": ["K0+000"] * n}),
+        VIEW.value: pd.DataFrame(
+            {
+                "magId": mag_ids,
+                "lineId": [1] * n,
+                "xCoordinate": [float(i) for i in range(n)],
+                "yCoordinate": [0.0] * n,
+            }
+        ),
+    }
+    repo = VehicleDataRepository()
+    repo.loader.load_all_tables = lambda: frames
+    repo.load_all_data()
+    return repo
+
+
+def make_history(repo, path) -> EditHistoryService:
+    """Attach a history service journaling to path."""
+    return EditHistoryService(repo, CalibrationJournal(path))
+
+
+class TestEditHistory:
+    """Test class for EditHistoryService and CalibrationJournal."""
+
+    def test_undo_redo(self):
+        """Undo restores the old value and redo re-applies the new one."""
+        path = os.path.join(tempfile.mkdtemp(), "calibration.journal")
+        repo = make_repository([101, 102, 103])
+        history = make_history(repo, path)
+        history.record(VIEW, 1, 5.0, 6.0)
+        assert history.undo().index == 1
+        assert repo.get_coordinate(VIEW, 1).x == 1.0
+        history.redo()
+        assert repo.get_coordinate(VIEW, 1).y == 6.0
+        assert history.redo() is None
+        history.close()
+        print("✅ Undo and redo applied")
+
+    def test_replay_restores_edits_and_stacks(self):
+        """Replaying the journal rebuilds coordinates and undo/redo stacks."""
+        path = os.path.join(tempfile.mkdtemp(), "calibration.journal")
+        history = make_history(make_repository([101, 102, 103]), path)
+        history.record(VIEW, 0, 9.0, 9.0)
+        history.record(VIEW, 2, 7.0, 7.0)
+        history.undo()
+        history.close()
+
+        repo = make_repository([101, 102, 103])
+        replayed = make_history(repo, path)
+        assert replayed.replay() == 2
+        assert repo.get_coordinate(VIEW, 0).x == 9.0
+        assert repo.get_coordinate(VIEW, 2).x == 2.0
+        assert replayed.redo().index == 2
+        assert repo.get_coordinate(VIEW, 2).x == 7.0
+        replayed.close()
+        print("✅ Journal replay restored edits")
+
+    def test_replay_maps_by_mag_id(self):
+        """Edits follow their magId when record order changes on reload."""
+        path = os.path.join(tempfile.mkdtemp(), "calibration.journal")
+        history = make_history(make_repository([101, 102, 103]), path)
+        history.record(VIEW, 0, 50.0, 50.0)
+        history.close()
+
+        repo = make_repository([103, 102, 101])
+        make_history(repo, path).replay()
+        assert repo.get_coordinate(VIEW, 2).x == 50.0
+        assert repo.get_coordinate(VIEW, 0).x == 0.0
+        print("✅ Replay resolved records by magId")
+
+    def test_torn_record_ignored(self):
+        """A partially written trailing record is skipped on read."""
+        path = os.path.join(tempfile.mkdtemp(), "calibration.journal")
+        history = make_history(make_repository([101, 102]), path)
+        history.record(VIEW, 1, 3.0, 3.0)
+        history.close()
+        with open(path, "ab") as f:
+            f.write(b"\x01\x01\x00")
+        journal = CalibrationJournal(path)
+        assert len(journal.read_all()) == 1
+        journal.append(1, 1, 0, 101, (0.0, 0.0), (8.0, 8.0))
+        records = journal.read_all()
+        assert records["mag_id"].tolist() == [102, 101]
+        journal.close()
+        print("✅ Torn trailing record ignored")
+
+    def test_journal_bound_to_data_version(self):
+        """Edits replay onto the data they were made on, not onto new data."""
+        base = os.path.join(tempfile.mkdtemp(), "calibration.journal")
+        repo = make_repository([101, 102, 103])
+        history = make_history(repo, base)
+        history.journal.bind(repo.data_version())
+        history.record(VIEW, 0, 9.0, 9.0)
+        history.close()
+
+        other = make_repository([101, 102, 104])
+        assert other.data_version() != repo.data_version()
+        replayed = make_history(other, base)
+        replayed.journal.bind(other.data_version())
+        assert replayed.replay() == 0
+        replayed.close()
+
+        same = make_repository([101, 102, 103])
+        again = make_history(same, base)
+        again.journal.bind(same.data_version())
+        assert again.replay() == 1
+        assert same.get_coordinate(VIEW, 0).x == 9.0
+        again.close()
+        print("✅ Journal kept per data version")
+
+    def test_old_data_version_journals_pruned(self):
+        """Only the keep most recently bound journals stay on disk."""
+        directory = tempfile.mkdtemp()
+        base = os.path.join(directory, "calibration.journal")
+        journal = CalibrationJournal(base, keep=2)
+        for version in ("a", "b", "c"):
+            journal.bind(version)
+            journal.append(1, 1, 0, 101, (0.0, 0.0), (1.0, 1.0))
+            journal.close()
+            os.utime(journal.path, (0, {"a": 1, "b": 2, "c": 3}[version]))
+        journal.bind("c")
+        assert sorted(os.listdir(directory)) == [
+            "calibration.b.journal",
+            "calibration.c.journal",
+        ]
+        print("✅ Old journals pruned")
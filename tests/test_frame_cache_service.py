@@ -0,0 +1,54 @@
+"""
+Test module for the on-disk cache of cleaned frames.
+Stores frames with every column kind and checks they load back unchanged.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+
+import numpy as np
+import pandas as pd
+from services.data_cleaning_service import DataCleaningService
+from services.frame_cache_service import FrameCacheService
+
+
+def test_cleaned_frame_round_trips():
+    """Numeric, category and nullable text columns come back identical."""
+    df = DataCleaningService.apply_dtypes("largescreenpixelpos", pd.DataFrame({
+        "magId": [100001, 100002, 100003],
+        "stopTime": [0.5, 1.0, 2.25],
+        "residenceTime": ["0", "5", "0"],
+        "note": ["a", None, "c"],
+    }))
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FrameCacheService(tmp)
+        key = FrameCacheService.make_key("abc", DataCleaningService.rules_fingerprint())
+        assert cache.store("largescreenpixelpos", key, df)
+        loaded = cache.load("largescreenpixelpos", key)
+    pd.testing.assert_frame_equal(loaded, df)
+    assert loaded["magId"].dtype == np.int32
+
+
+def test_miss_and_replaced_entries():
+    """Unknown keys miss, and storing a new key drops the table's old entry."""
+    df = pd.DataFrame({"magId": [1, 2]})
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FrameCacheService(tmp)
+        assert cache.load("map", "old") is None
+        cache.store("map", "old", df)
+        cache.store("map", "new", df)
+        assert cache.load("map", "old") is None
+        pd.testing.assert_frame_equal(cache.load("map", "new"), df)
+
+
+def test_mixed_type_columns_are_not_cached():
+    """A column mixing text and numbers cannot be stored without pickling."""
+    df = pd.DataFrame({"stake": ["K1", 2]})
+    with tempfile.TemporaryDirectory() as tmp:
+        assert not FrameCacheService(tmp).store("map", "key", df)
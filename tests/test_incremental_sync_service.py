@@ -0,0 +1,105 @@
+"""
+Test module for the incremental, row-hashed sync of the live tables.
+Diffs and upserts run against SQLite; the upsert uses SQLite's ON CONFLICT
+in place of MySQL's ON DUPLICATE KEY UPDATE.
+"""
+
+import sys
+import os
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+# and this directory for the shared test helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from services.data_insertion_service import DataInsertionService
+from services.incremental_sync_service import IncrementalSyncService
+from sql_helpers import SCHEMAS, TABLES, sample_dataframes, table_rows
+
+
+class SqliteInsertionService(DataInsertionService):
+    """Upserts with SQLite's ON CONFLICT and qmark placeholders."""
+
+    def upsert(self, conn, table_name, df):
+        columns = ", ".join(df.columns)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in df.columns if c != "magId")
+        sql = (
+            f"INSERT INTO {table_name} ({columns}) VALUES "
+            f"({', '.join('?' * len(df.columns))}) "
+            f"ON CONFLICT (magId) DO UPDATE SET {updates}"
+        )
+        values = df.astype(object).where(df.notna(), None)
+        conn.connection.cursor().executemany(sql, values.itertuples(index=False, name=None))
+
+
+def live_engine(frames: dict):
+    """A SQLite database holding frames in the sample schema."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        for table in TABLES:
+            conn.exec_driver_sql(f"CREATE TABLE {table} {SCHEMAS[table]}")
+            frames[table].to_sql(table, conn, if_exists="append", index=False)
+    return engine
+
+
+def test_hashes_ignore_how_values_were_read():
+    """Excel ints and MySQL floats, NaN and None, -0.0 and 0.0 hash alike."""
+    excel = pd.DataFrame({"magId": [1, 2, 3], "x": [5, None, 0.0], "stake": ["a", None, "c"]})
+    mysql = pd.DataFrame({
+        "magId": [1, 2, 3],
+        "x": [5.0, np.nan, -0.0],
+        "stake": ["a", np.nan, "c"],
+    })
+    hashes = IncrementalSyncService.row_hashes(excel, ["magId", "x"])
+    assert hashes.index.tolist() == [1, 2, 3]
+    assert hashes.equals(IncrementalSyncService.row_hashes(mysql, ["magId", "x"]))
+
+    mysql.loc[1, "stake"] = "None"
+    changed = IncrementalSyncService.row_hashes(mysql, ["magId", "x"]) != hashes
+    assert changed.tolist() == [False, True, False]
+
+
+def test_diff_finds_changed_added_and_deleted_rows():
+    """Only rows whose content changed are upserted; NULL rows stay unchanged."""
+    frames = sample_dataframes(50)
+    engine = live_engine(frames)
+    new = frames["centerpos2x"].drop(index=[3, 4])
+    new.loc[10, "xCoordinate"] += 1
+    new.loc[50] = [200000, None]
+    service = IncrementalSyncService(engine, None)
+    with engine.connect() as conn:
+        diff = service.diff_table(conn, "centerpos2x", new)
+    assert diff.upserts["magId"].tolist() == [100011, 200000]
+    assert (diff.inserted, diff.updated) == (1, 1)
+    assert diff.deletes == [100004, 100005]
+
+
+def test_duplicate_input_magids_are_refused():
+    """A frame with a repeated magId cannot be diffed."""
+    frames = sample_dataframes(5)
+    engine = live_engine(frames)
+    twice = pd.concat([frames["map"], frames["map"].head(1)])
+    with engine.connect() as conn, pytest.raises(ValueError):
+        IncrementalSyncService(engine, None).diff_table(conn, "map", twice)
+
+
+def test_sync_brings_the_tables_in_line():
+    """After sync_all the live tables hold exactly the new frames."""
+    frames = sample_dataframes(50)
+    engine = live_engine(frames)
+    new = {t: df.drop(index=[7]) for t, df in frames.items()}
+    new["map"].loc[2, "stake"] = None
+    new["map"].loc[50] = [200000, "new"]
+    new["centerpos2x"].loc[50] = [200000, 0.5]
+    service = IncrementalSyncService(engine, SqliteInsertionService(engine))
+    diffs = service.sync_all(new)
+    assert [len(d.upserts) for d in diffs.values()] == [2, 1]
+
+    expected = live_engine(new)
+    assert table_rows(engine) == table_rows(expected)
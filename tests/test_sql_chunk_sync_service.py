@@ -0,0 +1,127 @@
+"""
+Test module for the incremental, range-hashed version apply.
+The live side runs the service's own hash queries against SQLite, given
+Python versions of the MySQL functions they call.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+# and this directory for the shared test helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.mysql import DOUBLE, INTEGER, VARCHAR
+from sqlalchemy.types import REAL
+from services.sql_chunk_sync_service import SqlChunkSyncService
+from services.sql_delta_service import SqlDeltaService
+from services.sql_dump_reader import read_dumps
+from services.sql_export_service import SqlExportService
+from services.sql_row_hash import canonical, column_kind
+from sql_helpers import load_version, register_mysql_functions, sample_dataframes, table_rows
+
+
+def live_engine(version_dir: str):
+    """A SQLite database holding a version, with the hash queries' functions."""
+    engine = create_engine("sqlite://")
+    register_mysql_functions(engine)
+    load_version(engine, version_dir)
+    return engine
+
+
+def export_versions(tmp: str):
+    """An old version and a new one with a few rows changed, deleted and added."""
+    export = SqlExportService(tmp, max_workers=1)
+    frames = sample_dataframes(2000)
+    old = export.export_all_data_as_sql(frames)
+    frames["centerpos2x"].loc[[5, 900, 901], "xCoordinate"] += 1
+    frames["map"].loc[1500, "stake"] = None
+    frames = {t: df.drop(index=[10, 11]) for t, df in frames.items()}
+    frames["map"].loc[5000] = [300000, "new"]
+    frames["centerpos2x"].loc[5000] = [300000, 0.5]
+    new = export.export_all_data_as_sql(frames)
+    return export, old, new
+
+
+def test_only_differing_ranges_are_reapplied():
+    """The patched database matches the new version after a handful of statements."""
+    with tempfile.TemporaryDirectory() as tmp:
+        export, old, new = export_versions(tmp)
+        live = live_engine(old)
+
+        sync = SqlChunkSyncService(live, SqlDeltaService(export), leaf_size=16, fanout=4)
+        syncs = sync.sync(new, export.table_files(os.path.basename(new)))
+
+        delta = syncs["centerpos2x"].delta
+        assert [u[0] for u in delta.updates] == [100006, 100901, 100902]
+        assert delta.deletes == [100011, 100012]
+        assert delta.inserts == ["(300000.0, 0.5)"]
+        assert syncs["map"].delta.updates == [(101501, {"stake": "NULL"})]
+        # Each size compares at most fanout ranges per differing wider range
+        assert all(n <= 4 * 5 for n in syncs["map"].compared)
+
+        expected = create_engine("sqlite://")
+        load_version(expected, new)
+        assert table_rows(live) == table_rows(expected)
+
+
+def test_equal_tables_stop_at_the_widest_size():
+    """An unchanged table is settled by comparing its widest ranges only."""
+    with tempfile.TemporaryDirectory() as tmp:
+        export, old, _ = export_versions(tmp)
+        live = live_engine(old)
+
+        sync = SqlChunkSyncService(live, SqlDeltaService(export), leaf_size=16, fanout=4)
+        syncs = sync.sync(old, export.table_files(os.path.basename(old)))
+        assert all(len(s.compared) == 1 for s in syncs.values())
+
+
+def test_mostly_changed_version_falls_back():
+    """Past max_changed nothing is applied and the caller loads the version in full."""
+    with tempfile.TemporaryDirectory() as tmp:
+        export, old, new = export_versions(tmp)
+        live = live_engine(old)
+        before = table_rows(live)
+
+        sync = SqlChunkSyncService(live, SqlDeltaService(export), max_changed=0.0001)
+        assert sync.sync(new, export.table_files(os.path.basename(new))) is None
+        assert table_rows(live) == before
+
+
+def test_sql_hashes_match_dump_hashes():
+    """The live hash query gives each stored row the hash of its dump tuple."""
+    with tempfile.TemporaryDirectory() as tmp:
+        export, _, new = export_versions(tmp)
+        live = live_engine(new)
+        sync = SqlChunkSyncService(live, SqlDeltaService(export), leaf_size=16)
+        files = export.table_files(os.path.basename(new))
+        with live.connect() as conn:
+            for table, names in files.items():
+                dump = read_dumps([os.path.join(new, n) for n in names])
+                columns = sync.live_columns(table)
+                expected = sync.version_hashes(dump.rows, columns)
+                assert sync.live_hashes(conn, table, columns, [(0, 10**9)]) == expected
+                for size in (16, 256, 4096):
+                    assert sync.live_chunks(conn, table, columns, size) == (
+                        sync.chunk_hashes(expected, size))
+
+
+def test_literals_canonicalize_like_stored_values():
+    """Dump literals hash like the values MySQL stores from them."""
+    assert canonical("'5'", "int") == canonical("5.0", "int") == "5"
+    assert canonical("2.5", "int") == "3"
+    assert canonical("0.1", "real") == "100000"
+    assert canonical("'it''s'", "text") == "it's"
+    assert canonical("NULL", "text") is None
+
+
+def test_float_columns_are_real():
+    """Float types count as real whether or not SQLAlchemy makes them Numeric."""
+    assert column_kind(DOUBLE()) == column_kind(REAL()) == "real"
+    assert column_kind(INTEGER()) == "int"
+    assert column_kind(VARCHAR(9)) == "text"
@@ -0,0 +1,70 @@
+"""
+Test module for delta patches between SQL versions.
+Applies a patch to a database holding the old version and checks that it
+ends up with exactly the rows of the new one.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+# and this directory for the shared test helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from sqlalchemy import create_engine
+from services.sql_delta_service import SqlDeltaService
+from services.sql_export_service import SqlExportService
+from sql_helpers import load_version, sample_dataframes, table_rows
+
+
+def test_patch_turns_old_version_into_new():
+    """Inserts, updates and deletes in the patch reproduce the new version."""
+    frames = sample_dataframes()
+    with tempfile.TemporaryDirectory() as tmp:
+        export = SqlExportService(tmp, max_workers=1)
+        old = export.export_all_data_as_sql(frames)
+
+        frames["centerpos2x"].loc[10:209, "xCoordinate"] += 0.5
+        frames["map"].loc[3, "stake"] = "K3, 'moved'"
+        frames = {t: df.drop(index=[0, 1]) for t, df in frames.items()}
+        extra = {"magId": [200000], "stake": ["new"], "xCoordinate": [7.0]}
+        frames = {
+            t: pd.concat([df, pd.DataFrame({c: extra[c] for c in df.columns})])
+            for t, df in frames.items()
+        }
+        new = export.export_all_data_as_sql(frames)
+
+        delta = SqlDeltaService(export)
+        deltas = delta.diff_versions(os.path.basename(old), os.path.basename(new))
+        assert len(deltas["centerpos2x"].updates) == 200
+        assert deltas["map"].updates == [(100004, {"stake": "'K3, ''moved'''"})]
+        assert deltas["map"].deletes == [100001, 100002]
+
+        patch = delta.write_patch(os.path.basename(old), os.path.basename(new))
+        patched = create_engine("sqlite://")
+        load_version(patched, old)
+        SqlDeltaService.apply_patch(patched, patch)
+
+        expected = create_engine("sqlite://")
+        load_version(expected, new)
+        assert table_rows(patched) == table_rows(expected)
+
+
+def test_unchanged_tables_are_skipped():
+    """Tables sharing an object between versions produce no delta."""
+    frames = sample_dataframes(5)
+    with tempfile.TemporaryDirectory() as tmp:
+        export = SqlExportService(tmp, max_workers=1)
+        old = export.export_all_data_as_sql(frames)
+        frames["map"].loc[0, "stake"] = "changed"
+        new = export.export_all_data_as_sql(frames)
+
+        deltas = SqlDeltaService(export).diff_versions(
+            os.path.basename(old), os.path.basename(new)
+        )
+        assert list(deltas) == ["map"]
@@ -0,0 +1,208 @@
+"""
+Test module for the versioned SQL export.
+Checks that per-table workers produce complete versions, that unchanged
+tables share one stored object and that unfinished versions are never listed.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+# and this directory for the shared test helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from services.sql_archive import SqlArchive, build_archive, iter_lines
+from services import sql_dump_reader
+from services.sql_export_service import SqlExportService
+from services.version_catalog import VersionCatalog
+from sql_helpers import sample_dataframes
+
+
+def read_dumps(version_dir: str) -> dict:
+    """Table dumps of a version, as text."""
+    dumps = {}
+    for name in sorted(os.listdir(version_dir)):
+        if name.endswith((".sql", ".sqlz")) and name != "version_info.sql":
+            dumps[name] = list(iter_lines(os.path.join(version_dir, name)))
+    return dumps
+
+
+def test_parallel_export_matches_serial():
+    """Worker processes write the same files as the in-process export."""
+    frames = sample_dataframes(2)
+    with tempfile.TemporaryDirectory() as tmp:
+        serial = SqlExportService(tmp, max_workers=1).export_all_data_as_sql(frames)
+        parallel = SqlExportService(tmp, max_workers=2).export_all_data_as_sql(frames)
+        assert read_dumps(serial) == read_dumps(parallel)
+        assert sorted(os.listdir(parallel)) == [
+            "centerpos2x.sqlz",
+            "manifest.json",
+            "map.sqlz",
+            "version_info.sql",
+        ]
+
+
+def test_incomplete_version_is_ignored():
+    """A version without version_info.sql is skipped by list and latest."""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = SqlExportService(tmp, max_workers=1)
+        complete = service.export_all_data_as_sql(sample_dataframes(2))
+        # An export interrupted after creating its directory
+        service._create_version_directory()
+
+        assert service.list_all_versions() == [os.path.basename(complete)]
+        assert service.get_latest_version_dir() == complete
+        # The unfinished directory still reserves its version number
+        assert os.path.basename(service.export_all_data_as_sql({})).startswith("V3_")
+
+
+def test_unchanged_tables_share_objects():
+    """Re-exporting the same data links the existing objects."""
+    frames = sample_dataframes(2)
+    with tempfile.TemporaryDirectory() as tmp:
+        service = SqlExportService(tmp, max_workers=1)
+        first = service.export_all_data_as_sql(frames)
+        frames["map"].loc[1, "stake"] = "K2"
+        second = service.export_all_data_as_sql(frames)
+
+        old = service.read_manifest(os.path.basename(first))["tables"]
+        new = service.read_manifest(os.path.basename(second))["tables"]
+        assert new["centerpos2x"] == old["centerpos2x"]
+        assert new["map"]["object"] != old["map"]["object"]
+
+        same = [os.path.join(v, "centerpos2x.sqlz") for v in (first, second)]
+        assert os.path.samefile(*same)
+        objects = os.path.join(tmp, "objects")
+        assert sum(len(files) for _, _, files in os.walk(objects)) == 3
+
+
+def test_sharded_export_covers_every_row():
+    """Shards split a table by magId range and together hold all its rows."""
+    frames = {"map": pd.DataFrame({"magId": [5, 1, 4, 2, 3], "stake": list("abcde")})}
+    with tempfile.TemporaryDirectory() as tmp:
+        single = SqlExportService(tmp, max_workers=1).export_all_data_as_sql(frames)
+        sharded = SqlExportService(tmp, max_workers=1, shards=2).export_all_data_as_sql(frames)
+        name = os.path.basename(sharded)
+
+        service = SqlExportService(tmp)
+        shards = service.read_manifest(name)["tables"]["map"]["shards"]
+        assert [(s["min_magId"], s["max_magId"], s["records"]) for s in shards] == [
+            (1, 3, 3),
+            (4, 5, 2),
+        ]
+        assert service.table_files(name) == {"map": ["map.001.sqlz", "map.002.sqlz"]}
+
+        paths = [os.path.join(sharded, f) for f in service.table_files(name)["map"]]
+        whole = sql_dump_reader.read_dump(os.path.join(single, "map.sqlz"))
+        assert sql_dump_reader.read_dumps(paths).rows == whole.rows
+
+
+def test_archive_matches_plain_dump():
+    """A .sqlz archive holds the plain dump's text and indexes its records."""
+    frames = {"map": pd.DataFrame({"magId": range(1000), "stake": ["K'0"] * 1000})}
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = SqlExportService(tmp, max_workers=1, rows_per_insert=7, compress=False)
+        compressed = SqlExportService(tmp, max_workers=1, rows_per_insert=7)
+        plain_dir = plain.export_all_data_as_sql(frames)
+        archive_dir = compressed.export_all_data_as_sql(frames)
+
+        archive = SqlArchive(os.path.join(archive_dir, "map.sqlz"))
+        assert (archive.records, archive.statements) == (1000, 143)
+        assert read_dumps(plain_dir)["map.sql"] == read_dumps(archive_dir)["map.sqlz"]
+
+
+def test_archive_blocks_end_on_statements():
+    """Every block starts at a statement and decompresses on its own."""
+    pieces = [("-- header\n\n", 0)] + [
+        (f"INSERT INTO `t` (`a`) VALUES\n({i}),\n({i + 1});\n\n", 2) for i in range(50)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "t.sqlz")
+        with open(path, "wb") as f:
+            f.write(build_archive(pieces, block_size=200))
+        archive = SqlArchive(path)
+        assert len(archive.blocks) > 1
+        assert sum(b["records"] for b in archive.blocks) == archive.records == 100
+        for i, block in enumerate(archive.blocks[1:], start=1):
+            assert archive.read_block(i).startswith("INSERT INTO")
+        assert "".join(iter_lines(path)) == "".join(text for text, _ in pieces)
+
+
+def test_catalog_tracks_exports():
+    """Exports keep the catalog current; a lost catalog is rebuilt identically."""
+    frames = sample_dataframes(2)
+    with tempfile.TemporaryDirectory() as tmp:
+        service = SqlExportService(tmp, max_workers=1)
+        first = service.export_all_data_as_sql(frames)
+        second = service.export_all_data_as_sql(frames)
+
+        catalog = service.catalog.read()
+        names = [os.path.basename(first), os.path.basename(second)]
+        assert catalog["latest"] == names[1]
+        assert list(catalog["versions"]) == names
+        entry = catalog["versions"][names[1]]
+        assert entry["version"] == 2
+        assert entry["tables"] == service.read_manifest(names[1])["tables"]
+        assert entry["tables"]["map"]["records"] == 2
+
+        os.remove(os.path.join(tmp, "catalog.json"))
+        assert service.catalog.read() == catalog
+
+
+def test_catalog_covers_legacy_versions():
+    """Versions without a manifest are catalogued from their dump headers."""
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, "V1_20250101_000000")
+        os.makedirs(legacy)
+        with open(os.path.join(legacy, "version_info.sql"), "w") as f:
+            f.write("-- Version: V1\n-- Generated: 2025-01-01 00:00:00\n"
+                    "-- Timestamp: 20250101_000000\n")
+        with open(os.path.join(legacy, "map.sql"), "w") as f:
+            f.write("-- SQL INSERT statements for table: map\n"
+                    "-- Generated: 2025-01-01 00:00:00\n-- Records: 2\n")
+
+        service = SqlExportService(tmp, max_workers=1)
+        entry = service.catalog.entry("V1_20250101_000000")
+        assert entry["generated"] == "2025-01-01 00:00:00"
+        assert entry["tables"]["map"]["records"] == 2
+        newer = service.export_all_data_as_sql(sample_dataframes(2))
+        assert service.list_all_versions() == ["V1_20250101_000000", os.path.basename(newer)]
+
+
+def test_catalog_drops_deleted_versions():
+    """A version directory removed by hand disappears from the catalog."""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = SqlExportService(tmp, max_workers=1)
+        first = service.export_all_data_as_sql(sample_dataframes(2))
+        second = service.export_all_data_as_sql(sample_dataframes(2))
+        shutil.rmtree(second)
+
+        assert service.list_all_versions() == [os.path.basename(first)]
+        assert service.get_latest_version_dir() == first
+        # Its number stays taken
+        assert os.path.basename(service.export_all_data_as_sql({})).startswith("V3_")
+
+
+def test_concurrent_catalog_updates_are_kept():
+    """Versions reserved and added from several threads all end up catalogued."""
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = VersionCatalog(tmp)
+
+        def export(_):
+            number = catalog.reserve()
+            name = f"V{number}_20250101_000000"
+            os.makedirs(os.path.join(tmp, name))
+            catalog.add(name, {"version": number, "tables": {}})
+            return number
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            numbers = list(pool.map(export, range(40)))
+        assert sorted(numbers) == list(range(1, 41))
+        assert len(catalog.read()["versions"]) == 40
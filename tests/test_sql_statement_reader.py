@@ -0,0 +1,75 @@
+"""
+Test module for the streaming SQL statement reader.
+Checks statement splitting around quotes, comments and chunk boundaries.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+
+from services.sql_statement_reader import SqlStatementReader, iter_statements
+
+SCRIPT = """-- SQL INSERT statements for table: map
+-- Records: 3
+
+-- DELETE FROM map; -- Uncomment if you want to clear existing data
+
+INSERT INTO `map` (`magId`, `stake`) VALUES
+(1, 'a;b'),
+(2, 'it''s -- not a comment'),
+(3, 'back\\\\slash \\' quote: :name');
+/* block; comment */ UPDATE `we;ird` SET `x` = "d""q;" WHERE `magId` = 1;
+# hash comment; still a comment
+DELETE FROM `map` WHERE `magId` = 2--1;
+SELECT 'ü€;'
+"""
+
+EXPECTED = [
+    "INSERT INTO `map` (`magId`, `stake`) VALUES\n(1, 'a;b'),\n"
+    "(2, 'it''s -- not a comment'),\n(3, 'back\\\\slash \\' quote: :name')",
+    'UPDATE `we;ird` SET `x` = "d""q;" WHERE `magId` = 1',
+    "DELETE FROM `map` WHERE `magId` = 2--1",
+    "SELECT 'ü€;'",
+]
+
+
+def chunked(text: str, size: int):
+    """A read() callable returning text in pieces of size characters."""
+    pieces = iter([text[i:i + size] for i in range(0, len(text), size)])
+    return lambda: next(pieces, "")
+
+
+def test_statements_split_outside_quotes_and_comments():
+    """Semicolons in strings, identifiers and comments do not end statements."""
+    assert list(iter_statements(chunked(SCRIPT, 1 << 16))) == EXPECTED
+
+
+def test_every_chunk_boundary():
+    """Splitting is the same whatever the chunk size."""
+    for size in range(1, 12):
+        assert list(iter_statements(chunked(SCRIPT, size))) == EXPECTED, size
+
+
+def test_unterminated_quote_is_an_error():
+    """A missing closing quote is reported rather than guessed."""
+    try:
+        list(iter_statements(chunked("SELECT 'abc; SELECT 1;", 4)))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+def test_reader_streams_file():
+    """The file reader decodes UTF-8 across chunks and tracks progress."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "script.sql")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(SCRIPT)
+        reader = SqlStatementReader(path, chunk_size=5)
+        assert list(reader) == EXPECTED
+        assert reader.progress == 1.0
@@ -0,0 +1,140 @@
+"""
+Test module for applying versions through staging tables.
+Runs SqlVersionManager.apply_version and rollback against SQLite, with a
+schema service that keeps the swap logic but issues SQLite's DDL.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the dataLoader directory to the path to import its services
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataLoader")
+)
+# and this directory for the shared test helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from services.database_schema_service import DatabaseSchemaService
+from services.sql_chunk_sync_service import SqlChunkSyncService
+from services.sql_delta_service import SqlDeltaService
+from services.sql_export_service import SqlExportService
+from sql_helpers import SCHEMAS, register_mysql_functions, sample_dataframes, table_rows
+from sql_version_manager import SqlVersionManager
+
+
+class SqliteSchemaService(DatabaseSchemaService):
+    """The sample schema on SQLite: no deferred keys, renames one at a time."""
+
+    TABLE_KEYS = {"map": [], "centerpos2x": []}
+
+    def drop_tables_if_exist(self, table_names):
+        with self.engine.begin() as conn:
+            for table in table_names:
+                conn.exec_driver_sql(f"DROP TABLE IF EXISTS {table}")
+
+    def create_tables(self, deferred_keys=False, suffix="", table_names=None):
+        with self.engine.begin() as conn:
+            for table in table_names or list(self.TABLE_KEYS):
+                conn.exec_driver_sql(f"CREATE TABLE {table}{suffix} {SCHEMAS[table]}")
+
+    def add_deferred_keys(self, table_names=None, suffix=""):
+        pass
+
+    def _rename_tables(self, renames):
+        with self.engine.begin() as conn:
+            for old, new in renames:
+                conn.exec_driver_sql(f"ALTER TABLE {old} RENAME TO {new}")
+
+
+def make_manager(tmp: str) -> SqlVersionManager:
+    """A manager whose versions and database live in tmp."""
+    manager = SqlVersionManager()
+    manager.sql_dir = os.path.join(tmp, "SQL")
+    manager.export_service = SqlExportService(manager.sql_dir, max_workers=1)
+    manager.engine = create_engine(f"sqlite:///{os.path.join(tmp, 'live.db')}")
+    register_mysql_functions(manager.engine)
+    manager.schema_service = SqliteSchemaService(manager.engine)
+    manager.chunk_sync_service = SqlChunkSyncService(
+        manager.engine, SqlDeltaService(manager.export_service)
+    )
+    return manager
+
+
+def apply(manager: SqlVersionManager, frames: dict, incremental: bool = False) -> dict:
+    """Export frames as a version, apply it, and return the live rows."""
+    version = os.path.basename(manager.export_service.export_all_data_as_sql(frames))
+    assert manager.apply_version(version, confirm=True, incremental=incremental)
+    return table_rows(manager.engine)
+
+
+def test_partial_version_replaces_only_its_tables():
+    """A version without map swaps its child tables in and leaves map live."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = make_manager(tmp)
+        frames = sample_dataframes(50)
+        before = apply(manager, frames)
+
+        frames["centerpos2x"]["xCoordinate"] += 1
+        after = apply(manager, {"centerpos2x": frames["centerpos2x"]})
+        assert after["map"] == before["map"]
+        assert after["centerpos2x"] != before["centerpos2x"]
+        assert after["centerpos2x"][0] == (100001, 1.0)
+        assert manager.schema_service.existing_tables("_prev") == ["centerpos2x"]
+
+        assert manager.rollback(confirm=True)
+        assert table_rows(manager.engine) == before
+
+
+def test_version_with_map_carries_the_children_it_lacks():
+    """Live child tables missing from a map version are copied and swapped along."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = make_manager(tmp)
+        frames = sample_dataframes(50)
+        before = apply(manager, frames)
+
+        frames["map"]["stake"] = "K"
+        after = apply(manager, {"map": frames["map"]})
+        assert after["centerpos2x"] == before["centerpos2x"]
+        assert {stake for _, stake in after["map"]} == {"K"}
+        assert manager.schema_service.existing_tables("_prev") == ["map", "centerpos2x"]
+
+
+def test_incremental_apply_drops_stale_previous_tables():
+    """After an incremental apply there is no outdated *_prev to roll back to."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = make_manager(tmp)
+        frames = sample_dataframes(50)
+        apply(manager, frames)
+        frames["map"].loc[3, "stake"] = "second"
+        apply(manager, frames)
+        assert manager.schema_service.existing_tables("_prev") == ["map", "centerpos2x"]
+
+        frames["map"].loc[4, "stake"] = "third"
+        after = apply(manager, frames, incremental=True)
+        assert after["map"][4] == (100005, "third")
+        assert manager.schema_service.existing_tables("_prev") == []
+        assert not manager.rollback(confirm=True)
+
+
+def test_failed_incremental_apply_keeps_the_rollback_point():
+    """*_prev survive a failed sync followed by a failed full apply."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = make_manager(tmp)
+        frames = sample_dataframes(50)
+        first = apply(manager, frames)
+        frames["map"].loc[3, "stake"] = "second"
+        apply(manager, frames)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("failed")
+
+        manager.chunk_sync_service.sync = fail
+        manager.schema_service.verify_referential_integrity = fail
+        frames["map"].loc[4, "stake"] = "third"
+        version = os.path.basename(manager.export_service.export_all_data_as_sql(frames))
+        assert not manager.apply_version(version, confirm=True, incremental=True)
+        assert manager.schema_service.existing_tables("_prev") == ["map", "centerpos2x"]
+        assert manager.rollback(confirm=True)
+        assert table_rows(manager.engine) == first